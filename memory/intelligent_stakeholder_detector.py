@@ -6,17 +6,134 @@ Integrates local AI with existing stakeholder management system for automated di
 
 import json
 import sys
-from datetime import datetime
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import structlog
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 from local_stakeholder_ai import LocalStakeholderAI
 from stakeholder_engagement_engine import StakeholderEngagementEngine
 
 logger = structlog.get_logger()
 
+# Action type -> result counter it contributes to
+ACTION_RESULT_COUNTERS = {
+    'auto_created': 'auto_created',
+    'profiling_initiated': 'profiling_needed',
+    'update_suggested': 'updates_suggested'
+}
+
+# Strategic importance -> suggested meeting frequency
+FREQUENCY_MAPPING = {
+    'critical': 'weekly',
+    'high': 'biweekly',
+    'medium': 'monthly',
+    'low': 'quarterly'
+}
+
+# Content shorter than this cannot carry a name plus enough role/importance signal
+MIN_CONTENT_LENGTH = 32
+
+# Smart profiling question templates
+QUESTION_ROLE_CONFIRMATION = "Is {name} a {role}?"
+QUESTION_IMPORTANCE = "How strategically important is {name} to your platform objectives?"
+QUESTION_CHANNELS = "What's the best way to communicate with {name}?"
+QUESTION_FREQUENCY = "How often should you engage with {name}?"
+
+# Confidence classification codes for new stakeholder candidates
+CLASSIFY_LOW = 0
+CLASSIFY_PROFILE = 1
+CLASSIFY_AUTO = 2
+
+
+def classify_confidence(confidence: float, auto_threshold: float,
+                        profiling_threshold: float) -> int:
+    """Classify a candidate confidence score against the detection thresholds"""
+    if confidence >= auto_threshold:
+        return CLASSIFY_AUTO
+    if confidence >= profiling_threshold:
+        return CLASSIFY_PROFILE
+    return CLASSIFY_LOW
+
+
+@lru_cache(maxsize=256)
+def _map_profile_signature(role: Optional[str], importance: str, style: Optional[str],
+                           channels: Tuple[str, ...]) -> Dict:
+    """Build the stakeholder profile for a (role, importance, style, channels) signature"""
+    
+    profile = {}
+    
+    # Map role
+    if role:
+        role_mapping = {
+            'executive': role.title(),
+            'director': 'Director',
+            'manager': 'Manager',
+            'principal': 'Principal',
+            'senior': 'Senior',
+            'external': 'External Partner'
+        }
+        profile['role_title'] = role_mapping.get(role, role.title())
+    
+    # Map communication preferences
+    if channels:
+        profile['preferred_channels'] = list(channels)
+    
+    if style:
+        profile['communication_style'] = style
+    
+    # Infer meeting frequency based on importance
+    profile['meeting_frequency'] = FREQUENCY_MAPPING.get(importance, 'monthly')
+    
+    # Suggest personas based on role and style
+    profile['suggested_personas'] = _suggest_personas(role, importance, style)
+    
+    return profile
+
+
+def _suggest_personas(role: Optional[str], importance: str, style: Optional[str]) -> List[str]:
+    """Suggest SuperClaude personas based on stakeholder analysis"""
+    
+    personas = []
+    
+    # Role-based persona suggestions
+    if role == 'executive':
+        personas.extend(['camille', 'alvaro'])
+    elif role == 'director':
+        personas.extend(['diego', 'alvaro'])
+    elif role == 'manager':
+        personas.extend(['diego', 'marcus'])
+    elif role == 'principal':
+        personas.extend(['martin', 'diego'])
+    
+    # Style-based adjustments
+    if style == 'data_driven':
+        personas.append('alvaro')
+    elif style == 'visual':
+        personas.append('rachel')
+    elif style == 'collaborative':
+        personas.append('diego')
+    
+    # Importance-based adjustments
+    if importance == 'critical':
+        personas.extend(['camille', 'alvaro'])
+    
+    # Remove duplicates and limit to top 3
+    return list(dict.fromkeys(personas))[:3]
+
 
 class IntelligentStakeholderDetector:
     """Intelligent stakeholder detection with local AI and adaptive profiling"""
@@ -31,6 +148,8 @@ class IntelligentStakeholderDetector:
         self.auto_create_enabled = True
         self.profiling_enabled = True
         self.update_detection_enabled = True
+        
+        self._schema_ready = False
     
     def process_content_for_stakeholders(self, content: str, context: Dict) -> Dict:
         """Process content for stakeholder detection and management"""
@@ -43,6 +162,11 @@ class IntelligentStakeholderDetector:
             'actions_taken': []
         }
         
+        # Names need a capitalized word and email-derived names need an '@'
+        if len(content) < MIN_CONTENT_LENGTH or not (
+                '@' in content or any(ch.isupper() for ch in content)):
+            return result
+        
         try:
             self.logger.info("Processing content for stakeholder detection", 
                            content_length=len(content),
@@ -52,16 +176,31 @@ class IntelligentStakeholderDetector:
             candidates = self.ai_engine.detect_stakeholders_in_content(content, context)
             result['candidates_detected'] = len(candidates)
             
+            # Collapse aliases of the same stakeholder, keeping the most confident analysis
+            best_candidates = {}
             for candidate in candidates:
-                action = self._process_stakeholder_candidate(candidate)
-                result['actions_taken'].append(action)
-                
-                if action['type'] == 'auto_created':
-                    result['auto_created'] += 1
-                elif action['type'] == 'profiling_initiated':
-                    result['profiling_needed'] += 1
-                elif action['type'] == 'update_suggested':
-                    result['updates_suggested'] += 1
+                previous = best_candidates.get(candidate['stakeholder_key'])
+                if previous is None or candidate['confidence_score'] > previous['confidence_score']:
+                    best_candidates[candidate['stakeholder_key']] = candidate
+            candidates = list(best_candidates.values())
+            
+            # Look up every candidate's existing profile in one query
+            actions = result['actions_taken']
+            existing_cache = dict.fromkeys(best_candidates)
+            existing_cache.update(self.ai_engine.check_existing_stakeholders(list(best_candidates)))
+            for candidate in candidates:
+                actions.append(self._process_stakeholder_candidate(candidate, existing_cache))
+            
+            # Tally action types in a single pass instead of branching per candidate
+            action_counts = Counter(action['type'] for action in actions)
+            for action_type, counter_name in ACTION_RESULT_COUNTERS.items():
+                result[counter_name] = action_counts[action_type]
+            
+            # Refresh recommendations once per batch, only for stakeholders saved since the last
+            # refresh (this batch's new ones included) rather than the whole directory
+            if result['auto_created']:
+                self.engagement_engine.generate_engagement_recommendations(
+                    only=self.engagement_engine.dirty_stakeholders)
             
             self.logger.info("Stakeholder detection completed", **result)
             return result
@@ -70,20 +209,31 @@ class IntelligentStakeholderDetector:
             self.logger.error("Failed to process content for stakeholders", error=str(e))
             return result
     
-    def _process_stakeholder_candidate(self, candidate: Dict) -> Dict:
+    def _process_stakeholder_candidate(
+        self, candidate: Dict, existing_cache: Optional[Dict[str, Optional[Dict]]] = None
+    ) -> Dict:
         """Process individual stakeholder candidate"""
         
         stakeholder_key = candidate['stakeholder_key']
         
-        # Check if stakeholder already exists
-        existing = self.ai_engine.check_existing_stakeholder(stakeholder_key)
+        # Check if stakeholder already exists, reusing lookups from this processing call
+        if existing_cache is not None and stakeholder_key in existing_cache:
+            existing = existing_cache[stakeholder_key]
+        else:
+            existing = self.ai_engine.check_existing_stakeholder(stakeholder_key)
+            if existing_cache is not None:
+                existing_cache[stakeholder_key] = existing
         
         if existing:
             # Existing stakeholder - check for updates
             return self._handle_existing_stakeholder(stakeholder_key, candidate, existing)
         else:
             # New stakeholder - determine creation approach
-            return self._handle_new_stakeholder(candidate)
+            action = self._handle_new_stakeholder(candidate)
+            if existing_cache is not None and action['type'] == 'auto_created':
+                # Stakeholder now exists; later mentions must re-read it
+                existing_cache.pop(stakeholder_key, None)
+            return action
     
     def _handle_existing_stakeholder(self, stakeholder_key: str, candidate: Dict, existing: Dict) -> Dict:
         """Handle updates to existing stakeholders"""
@@ -92,11 +242,13 @@ class IntelligentStakeholderDetector:
             return {'type': 'no_action', 'reason': 'update_detection_disabled'}
         
         # Check for suggested updates
-        suggestions = self.ai_engine.suggest_stakeholder_updates(stakeholder_key, candidate)
+        suggestions = self.ai_engine.suggest_stakeholder_updates(stakeholder_key, candidate,
+                                                                 existing)
         
         if suggestions:
             # Store update suggestions for user review
-            self._store_update_suggestions(stakeholder_key, suggestions)
+            stakeholder_name = existing.get('display_name') or candidate['name']
+            self._store_update_suggestions(stakeholder_key, stakeholder_name, suggestions)
             
             return {
                 'type': 'update_suggested',
@@ -115,12 +267,15 @@ class IntelligentStakeholderDetector:
         """Handle new stakeholder discovery"""
         
         confidence = candidate['confidence_score']
+        classification = classify_confidence(confidence,
+                                             self.ai_engine.AUTO_CREATE_THRESHOLD,
+                                             self.ai_engine.PROFILING_THRESHOLD)
         
-        if confidence >= self.ai_engine.AUTO_CREATE_THRESHOLD and self.auto_create_enabled:
+        if classification == CLASSIFY_AUTO and self.auto_create_enabled:
             # High confidence - auto-create
             return self._auto_create_stakeholder(candidate)
         
-        elif confidence >= self.ai_engine.PROFILING_THRESHOLD and self.profiling_enabled:
+        elif classification >= CLASSIFY_PROFILE and self.profiling_enabled:
             # Medium confidence - initiate smart profiling
             return self._initiate_smart_profiling(candidate)
         
@@ -153,9 +308,6 @@ class IntelligentStakeholderDetector:
                 # Update detailed preferences
                 self._update_stakeholder_preferences(candidate['stakeholder_key'], profile)
                 
-                # Generate initial recommendations
-                self.engagement_engine.generate_engagement_recommendations()
-                
                 self.logger.info("Auto-created stakeholder", 
                                stakeholder_key=candidate['stakeholder_key'],
                                confidence=candidate['confidence_score'])
@@ -189,7 +341,8 @@ class IntelligentStakeholderDetector:
         
         try:
             # Generate targeted questions based on what we know
-            questions = self._generate_smart_questions(candidate)
+            profile = self._map_candidate_to_profile(candidate)
+            questions = self._generate_smart_questions(candidate, profile)
             
             # Store profiling task for user interaction
             profiling_task = {
@@ -201,8 +354,7 @@ class IntelligentStakeholderDetector:
                     'importance': candidate['strategic_importance'],
                     'communication_prefs': candidate.get('communication_preferences', {})
                 },
-                'questions': questions,
-                'created_at': datetime.now().isoformat()
+                'questions': questions
             }
             
             self._store_profiling_task(profiling_task)
@@ -228,96 +380,44 @@ class IntelligentStakeholderDetector:
     def _map_candidate_to_profile(self, candidate: Dict) -> Dict:
         """Map AI analysis to stakeholder profile format"""
         
-        profile = {}
-        
-        # Map role
-        if candidate.get('detected_role'):
-            role_mapping = {
-                'executive': candidate['detected_role'].title(),
-                'director': 'Director',
-                'manager': 'Manager',
-                'principal': 'Principal',
-                'senior': 'Senior',
-                'external': 'External Partner'
-            }
-            profile['role_title'] = role_mapping.get(candidate['detected_role'], candidate['detected_role'].title())
-        
-        # Map communication preferences
         comm_prefs = candidate.get('communication_preferences', {})
-        if comm_prefs.get('channels'):
-            profile['preferred_channels'] = comm_prefs['channels']
-        
-        if comm_prefs.get('style'):
-            profile['communication_style'] = comm_prefs['style']
-        
-        # Infer meeting frequency based on importance
-        importance = candidate['strategic_importance']
-        frequency_mapping = {
-            'critical': 'weekly',
-            'high': 'biweekly',
-            'medium': 'monthly',
-            'low': 'quarterly'
-        }
-        profile['meeting_frequency'] = frequency_mapping.get(importance, 'monthly')
-        
-        # Suggest personas based on role and style
-        profile['suggested_personas'] = self._suggest_personas(candidate)
-        
-        return profile
-    
-    def _suggest_personas(self, candidate: Dict) -> List[str]:
-        """Suggest SuperClaude personas based on stakeholder analysis"""
-        
-        personas = []
-        
-        role = candidate.get('detected_role')
-        importance = candidate['strategic_importance']
-        style = candidate.get('communication_preferences', {}).get('style')
-        
-        # Role-based persona suggestions
-        if role == 'executive':
-            personas.extend(['camille', 'alvaro'])
-        elif role == 'director':
-            personas.extend(['diego', 'alvaro'])
-        elif role == 'manager':
-            personas.extend(['diego', 'marcus'])
-        elif role == 'principal':
-            personas.extend(['martin', 'diego'])
-        
-        # Style-based adjustments
-        if style == 'data_driven':
-            personas.append('alvaro')
-        elif style == 'visual':
-            personas.append('rachel')
-        elif style == 'collaborative':
-            personas.append('diego')
-        
-        # Importance-based adjustments
-        if importance == 'critical':
-            personas.extend(['camille', 'alvaro'])
-        
-        # Remove duplicates and limit to top 3
-        return list(dict.fromkeys(personas))[:3]
+        profile = _map_profile_signature(
+            candidate.get('detected_role'),
+            candidate['strategic_importance'],
+            comm_prefs.get('style'),
+            tuple(comm_prefs.get('channels') or ())
+        )
+        
+        # Copy list values so callers never mutate the cached profile
+        return {key: list(value) if isinstance(value, list) else value
+                for key, value in profile.items()}
     
-    def _generate_smart_questions(self, candidate: Dict) -> List[Dict]:
+    def _generate_smart_questions(self, candidate: Dict,
+                                  profile: Optional[Dict] = None) -> List[Dict]:
         """Generate targeted questions based on detected information"""
         
+        if profile is None:
+            profile = self._map_candidate_to_profile(candidate)
+        
+        name = candidate['name']
+        detected_role = candidate.get('detected_role')
         questions = []
         
         # Role confirmation if detected with medium confidence
-        if candidate.get('detected_role') and candidate.get('role_confidence', 0) < 0.8:
+        if detected_role and candidate.get('role_confidence', 0) < 0.8:
             questions.append({
                 'type': 'role_confirmation',
-                'question': f"Is {candidate['name']} a {candidate['detected_role'].title()}?",
+                'question': QUESTION_ROLE_CONFIRMATION.format(name=name,
+                                                              role=detected_role.title()),
                 'options': ['yes', 'no', 'similar_role'],
-                'pre_filled': candidate['detected_role']
+                'pre_filled': detected_role
             })
         
         # Strategic importance if unclear
         if candidate['importance_score'] < 3:
             questions.append({
                 'type': 'importance_clarification',
-                'question': f"How strategically important is {candidate['name']} to your platform objectives?",
+                'question': QUESTION_IMPORTANCE.format(name=name),
                 'options': ['critical', 'high', 'medium', 'low'],
                 'pre_filled': candidate['strategic_importance']
             })
@@ -327,7 +427,7 @@ class IntelligentStakeholderDetector:
         if not comm_prefs.get('channels'):
             questions.append({
                 'type': 'communication_channels',
-                'question': f"What's the best way to communicate with {candidate['name']}?",
+                'question': QUESTION_CHANNELS.format(name=name),
                 'options': ['slack', 'email', 'in_person', 'video'],
                 'multiple_choice': True
             })
@@ -335,28 +435,18 @@ class IntelligentStakeholderDetector:
         # Meeting frequency based on importance
         questions.append({
             'type': 'meeting_frequency',
-            'question': f"How often should you engage with {candidate['name']}?",
+            'question': QUESTION_FREQUENCY.format(name=name),
             'options': ['weekly', 'biweekly', 'monthly', 'quarterly', 'as_needed'],
-            'pre_filled': self._suggest_frequency(candidate['strategic_importance'])
+            'pre_filled': profile['meeting_frequency']
         })
         
         return questions
     
-    def _suggest_frequency(self, importance: str) -> str:
-        """Suggest meeting frequency based on importance"""
-        mapping = {
-            'critical': 'weekly',
-            'high': 'biweekly', 
-            'medium': 'monthly',
-            'low': 'quarterly'
-        }
-        return mapping.get(importance, 'monthly')
-    
     def _update_stakeholder_preferences(self, stakeholder_key: str, profile: Dict):
         """Update stakeholder preferences in database"""
         
         try:
-            with self.engagement_engine.get_connection() as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -368,9 +458,9 @@ class IntelligentStakeholderDetector:
                     WHERE stakeholder_key = ?
                 """, (
                     profile.get('meeting_frequency'),
-                    json.dumps(profile.get('preferred_channels', [])),
+                    _json_dumps(profile.get('preferred_channels', [])),
                     profile.get('communication_style'),
-                    json.dumps(profile.get('suggested_personas', [])),
+                    _json_dumps(profile.get('suggested_personas', [])),
                     stakeholder_key
                 ))
                 
@@ -378,67 +468,110 @@ class IntelligentStakeholderDetector:
             self.logger.error("Failed to update stakeholder preferences", 
                             stakeholder_key=stakeholder_key, error=str(e))
     
+    def _get_connection(self):
+        """Get this thread's engagement engine connection, already tuned by CONNECTION_PRAGMAS"""
+        
+        return self.engagement_engine.get_connection()
+    
+    def _ensure_schema(self, cursor):
+        """Create detector tables and indexes on first use"""
+        
+        if self._schema_ready:
+            return
+        
+        # WAL persists in the database file; lets readers run alongside inserts
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS stakeholder_profiling_tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                stakeholder_key TEXT NOT NULL,
+                task_data TEXT NOT NULL,
+                status TEXT DEFAULT 'pending',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS stakeholder_update_suggestions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                stakeholder_key TEXT NOT NULL,
+                stakeholder_name TEXT,
+                suggestions TEXT NOT NULL,
+                status TEXT DEFAULT 'pending',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Older databases predate the denormalized stakeholder_name column
+        cursor.execute("PRAGMA table_info(stakeholder_update_suggestions)")
+        if 'stakeholder_name' not in {column['name'] for column in cursor.fetchall()}:
+            cursor.execute(
+                "ALTER TABLE stakeholder_update_suggestions ADD COLUMN stakeholder_name TEXT"
+            )
+            cursor.execute("""
+                UPDATE stakeholder_update_suggestions
+                SET stakeholder_name = (
+                    SELECT display_name FROM stakeholder_profiles_enhanced p
+                    WHERE p.stakeholder_key = stakeholder_update_suggestions.stakeholder_key
+                )
+            """)
+        
+        # Pending-queue lookups filter on status and order by created_at
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_profiling_tasks_pending
+            ON stakeholder_profiling_tasks(status, created_at)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_update_suggestions_pending
+            ON stakeholder_update_suggestions(status, created_at)
+        """)
+        
+        self._schema_ready = True
+    
     def _store_profiling_task(self, task: Dict):
         """Store profiling task for user interaction"""
         
         try:
             # Store in database for later retrieval
-            with self.engagement_engine.get_connection() as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Create profiling tasks table if not exists
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS stakeholder_profiling_tasks (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        stakeholder_key TEXT NOT NULL,
-                        task_data TEXT NOT NULL,
-                        status TEXT DEFAULT 'pending',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
+                self._ensure_schema(cursor)
                 
                 cursor.execute("""
                     INSERT INTO stakeholder_profiling_tasks 
                     (stakeholder_key, task_data)
                     VALUES (?, ?)
-                """, (task['stakeholder_key'], json.dumps(task)))
+                """, (task['stakeholder_key'], _json_dumps(task)))
                 
         except Exception as e:
             self.logger.error("Failed to store profiling task", error=str(e))
     
-    def _store_update_suggestions(self, stakeholder_key: str, suggestions: List[Dict]):
+    def _store_update_suggestions(self, stakeholder_key: str, stakeholder_name: str,
+                                  suggestions: List[Dict]):
         """Store update suggestions for user review"""
         
         try:
-            with self.engagement_engine.get_connection() as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Create update suggestions table if not exists
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS stakeholder_update_suggestions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        stakeholder_key TEXT NOT NULL,
-                        suggestions TEXT NOT NULL,
-                        status TEXT DEFAULT 'pending',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
+                self._ensure_schema(cursor)
                 
                 cursor.execute("""
                     INSERT INTO stakeholder_update_suggestions 
-                    (stakeholder_key, suggestions)
-                    VALUES (?, ?)
-                """, (stakeholder_key, json.dumps(suggestions)))
+                    (stakeholder_key, stakeholder_name, suggestions)
+                    VALUES (?, ?, ?)
+                """, (stakeholder_key, stakeholder_name, _json_dumps(suggestions)))
                 
         except Exception as e:
             self.logger.error("Failed to store update suggestions", error=str(e))
     
-    def get_pending_profiling_tasks(self) -> List[Dict]:
-        """Get pending profiling tasks for user interaction"""
+    def iter_pending_profiling_tasks(self) -> Iterator[Dict]:
+        """Stream pending profiling tasks one row at a time"""
         
         try:
-            with self.engagement_engine.get_connection() as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
+                self._ensure_schema(cursor)
                 
                 cursor.execute("""
                     SELECT id, stakeholder_key, task_data, created_at
@@ -447,51 +580,50 @@ class IntelligentStakeholderDetector:
                     ORDER BY created_at ASC
                 """)
                 
-                tasks = []
-                for row in cursor.fetchall():
-                    task_data = json.loads(row[2])
-                    task_data['task_id'] = row[0]
-                    task_data['created_at'] = row[3]
-                    tasks.append(task_data)
-                
-                return tasks
+                for row in cursor:
+                    yield {
+                        **_json_loads(row['task_data']),
+                        'task_id': row['id'],
+                        'created_at': row['created_at']
+                    }
                 
         except Exception as e:
             self.logger.error("Failed to get pending profiling tasks", error=str(e))
-            return []
     
-    def get_pending_update_suggestions(self) -> List[Dict]:
-        """Get pending update suggestions for user review"""
+    def get_pending_profiling_tasks(self) -> List[Dict]:
+        """Get pending profiling tasks for user interaction"""
+        return list(self.iter_pending_profiling_tasks())
+    
+    def iter_pending_update_suggestions(self) -> Iterator[Dict]:
+        """Stream pending update suggestions one row at a time"""
         
         try:
-            with self.engagement_engine.get_connection() as conn:
+            with self._get_connection() as conn:
                 cursor = conn.cursor()
+                self._ensure_schema(cursor)
                 
                 cursor.execute("""
-                    SELECT s.id, s.stakeholder_key, s.suggestions, s.created_at,
-                           p.display_name
-                    FROM stakeholder_update_suggestions s
-                    JOIN stakeholder_profiles_enhanced p ON s.stakeholder_key = p.stakeholder_key
-                    WHERE s.status = 'pending'
-                    ORDER BY s.created_at ASC
+                    SELECT id, stakeholder_key, suggestions, created_at, stakeholder_name
+                    FROM stakeholder_update_suggestions
+                    WHERE status = 'pending'
+                    ORDER BY created_at ASC
                 """)
                 
-                suggestions = []
-                for row in cursor.fetchall():
-                    suggestion_data = {
-                        'suggestion_id': row[0],
-                        'stakeholder_key': row[1],
-                        'suggestions': json.loads(row[2]),
-                        'created_at': row[3],
-                        'stakeholder_name': row[4]
+                for row in cursor:
+                    yield {
+                        'suggestion_id': row['id'],
+                        'stakeholder_key': row['stakeholder_key'],
+                        'suggestions': _json_loads(row['suggestions']),
+                        'created_at': row['created_at'],
+                        'stakeholder_name': row['stakeholder_name']
                     }
-                    suggestions.append(suggestion_data)
-                
-                return suggestions
                 
         except Exception as e:
             self.logger.error("Failed to get pending update suggestions", error=str(e))
-            return []
+    
+    def get_pending_update_suggestions(self) -> List[Dict]:
+        """Get pending update suggestions for user review"""
+        return list(self.iter_pending_update_suggestions())
 
 
 def main():
@@ -501,8 +633,10 @@ def main():
     parser = argparse.ArgumentParser(description="Intelligent Stakeholder Detection Engine")
     parser.add_argument("--process-file", help="Process file for stakeholder detection")
     parser.add_argument("--context", help="JSON context for processing")
-    parser.add_argument("--show-profiling-tasks", action="store_true", help="Show pending profiling tasks")
-    parser.add_argument("--show-update-suggestions", action="store_true", help="Show pending update suggestions")
+    parser.add_argument("--show-profiling-tasks", action="store_true",
+                        help="Show pending profiling tasks")
+    parser.add_argument("--show-update-suggestions", action="store_true",
+                        help="Show pending update suggestions")
     
     args = parser.parse_args()
     
@@ -545,40 +679,38 @@ def main():
             print(f"❌ Error processing file: {e}")
     
     elif args.show_profiling_tasks:
-        tasks = detector.get_pending_profiling_tasks()
-        
         print("❓ Pending Stakeholder Profiling Tasks:")
         print("=" * 40)
         
-        if not tasks:
-            print("No pending profiling tasks.")
-            return
-        
-        for task in tasks:
+        found = False
+        for task in detector.iter_pending_profiling_tasks():
+            found = True
             print(f"👤 {task['name']} ({task['stakeholder_key']})")
             print(f"   Confidence: {task['confidence']:.1%}")
             print(f"   Questions: {len(task['questions'])}")
             for q in task['questions']:
                 print(f"     • {q['question']}")
             print()
+        
+        if not found:
+            print("No pending profiling tasks.")
     
     elif args.show_update_suggestions:
-        suggestions = detector.get_pending_update_suggestions()
-        
         print("🔄 Pending Stakeholder Update Suggestions:")
         print("=" * 45)
         
-        if not suggestions:
-            print("No pending update suggestions.")
-            return
-        
-        for suggestion in suggestions:
+        found = False
+        for suggestion in detector.iter_pending_update_suggestions():
+            found = True
             print(f"👤 {suggestion['stakeholder_name']} ({suggestion['stakeholder_key']})")
             print(f"   Suggestions: {len(suggestion['suggestions'])}")
             for s in suggestion['suggestions']:
                 print(f"     • {s['type']}: {s['current_value']} → {s['suggested_value']}")
                 print(f"       Confidence: {s['confidence']:.1%} - {s['reason']}")
             print()
+        
+        if not found:
+            print("No pending update suggestions.")
     
     else:
         parser.print_help()
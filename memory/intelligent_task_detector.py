@@ -4,41 +4,239 @@ Intelligent Task Detection Engine
 Automatically detect tasks, assignments, and follow-ups from meeting content
 """
 
+import copy
+import hashlib
 import json
+import math
+import os
 import re
 import sqlite3
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Pattern, Tuple
 
 import structlog
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import regex
+except ImportError:
+    regex = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = structlog.get_logger()
 
+# Extracted task: (task_text, assignee, match_start, match_end)
+TaskMatch = Tuple[str, Optional[str], int, int]
+
+# Shortest assignment prefix ("I'll ") plus the 5-character minimum task text
+MIN_TASK_CONTENT_LENGTH = 10
+
+# Task text captured by assignment patterns: a run of 5-200 characters up to the sentence
+# boundary, so over-long runs give up after at most 200 characters instead of scanning to
+# the end. Atomic groups would skip even that backtracking but need Python 3.11
+TASK_TEXT_GROUP = r'([^.!?\n]{5,200})(?![^.!?\n])'
+
+# Candidate count at which analysis is spread across worker processes; below this,
+# process startup and pattern compilation in each worker outweigh the analysis itself
+PARALLEL_ANALYSIS_MIN_CANDIDATES = 512
+
+# Detection results kept per detector for re-analyzed transcripts
+RESULT_CACHE_SIZE = 128
+
+# Markdown emphasis/code characters removed during normalization
+MARKDOWN_STRIP_TABLE = str.maketrans('', '', '*_`')
+
+# Assignment matches never cross these characters, so sentences can be scanned independently
+SENTENCE_BOUNDARY_CHARS = '.!?\n'
+
+# Date parsing patterns and lookups
+DATE_MDY_RE = re.compile(r'(\d{1,2})\/(\d{1,2})\/(\d{2,4})')
+DATE_MD_RE = re.compile(r'(\d{1,2})\/(\d{1,2})')
+IN_X_UNITS_RE = re.compile(r'in\s+(\d+)\s+(days?|weeks?|months?)')
+WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+
+class KeywordMatcher:
+    """Substring membership test for a fixed keyword list"""
+    
+    def __init__(self, keywords: List[str]):
+        self.keywords = tuple(keywords)
+        self._automaton = None
+        
+        # Aho-Corasick finds any keyword in a single pass over the text
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def search(self, text: str) -> bool:
+        """Return True if any keyword occurs in text"""
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return any(keyword in text for keyword in self.keywords)
+
+
+def _lowercase_view(content: str) -> Optional[str]:
+    """Lowercase content for offset slicing, or None if lowering changes its length"""
+    content_lower = content.lower()
+    return content_lower if len(content_lower) == len(content) else None
+
+
+# Detector built once per analysis worker process
+_worker_detector = None
+
+
+def _init_analysis_worker(db_path: str, use_regex_module: bool):
+    """Build the worker's detector so compiled patterns are never pickled"""
+    global _worker_detector
+    _worker_detector = IntelligentTaskDetector(db_path, use_regex_module=use_regex_module)
+
+
+def _analyze_candidate_chunk(full_content: str, context: Dict,
+                             candidates: List[Tuple[TaskMatch, str]]) -> List[Dict]:
+    """Analyze a chunk of task candidates in a worker process"""
+    full_content_lower = _lowercase_view(full_content)
+    return [
+        _worker_detector._analyze_task_candidate(task_text, assignment_direction, full_content,
+                                                 context, assignee=assignee, span=(start, end),
+                                                 full_content_lower=full_content_lower)
+        for (task_text, assignee, start, end), assignment_direction in candidates
+    ]
+
 
 class IntelligentTaskDetector:
     """AI-powered task detection from meeting content and communications"""
     
-    def __init__(self, db_path: Optional[str] = None):
-        """Initialize with local-only task detection patterns"""
+    # Compiled pattern libraries and matchers, keyed by regex engine name
+    _pattern_library_cache: Dict[str, Dict] = {}
+    
+    def __init__(self, db_path: Optional[str] = None, use_regex_module: bool = False):
+        """Initialize with local-only task detection patterns
+        
+        Args:
+            db_path: Path to the strategic memory database
+            use_regex_module: Compile detection patterns with the third-party
+                ``regex`` engine when it is installed (stdlib ``re`` otherwise)
+        """
         if db_path:
             self.db_path = Path(db_path)
         else:
             self.db_path = Path(__file__).parent / "strategic_memory.db"
         
         self.logger = logger.bind(component="intelligent_task_detector")
-        
-        # Local pattern libraries for task detection
-        self.task_patterns = self._build_task_patterns()
-        self.assignment_patterns = self._build_assignment_patterns()
-        self.timeline_patterns = self._build_timeline_patterns()
-        self.priority_indicators = self._build_priority_indicators()
+        # Per-thread connections; each closes via close() or when its thread exits
+        self._local = threading.local()
+        self._result_cache = OrderedDict()
+        
+        # Pattern libraries may run on the ``regex`` engine; normalization regexes stay on
+        # stdlib re, whose \s matches the same characters as str.isspace
+        self._use_regex_module = use_regex_module
+        self._pattern_module = regex if use_regex_module and regex is not None else re
+        
+        # Compiled libraries are built once per engine and shared by every instance
+        library = self._pattern_library_cache.get(self._pattern_module.__name__)
+        if library is None:
+            library = self._build_pattern_library()
+            self._pattern_library_cache[self._pattern_module.__name__] = library
+        for name, value in library.items():
+            setattr(self, name, value)
         
         # Detection thresholds
         self.AUTO_CREATE_THRESHOLD = 0.8
         self.REVIEW_THRESHOLD = 0.6
         self.MINIMUM_CONFIDENCE = 0.4
     
+    def _build_pattern_library(self) -> Dict:
+        """Compile the local pattern libraries and keyword matchers for task detection"""
+        
+        task_patterns = self._build_task_patterns()
+        assignment_patterns = self._build_assignment_patterns()
+        timeline_patterns = self._build_timeline_patterns()
+        priority_indicators = self._build_priority_indicators()
+        
+        # Compile pattern libraries once so scans reuse the same Pattern objects
+        task_patterns['task_indicators'] = self._compile_patterns(task_patterns['task_indicators'])
+        for direction, patterns in assignment_patterns.items():
+            assignment_patterns[direction] = self._compile_patterns([
+                pattern.replace(r'([^.!?]+)', TASK_TEXT_GROUP) for pattern in patterns
+            ])
+        for timeline_type, patterns in timeline_patterns.items():
+            timeline_patterns[timeline_type] = self._compile_patterns(patterns)
+        for priority_data in priority_indicators.values():
+            # Keywords are literal signals, so they join the level's patterns in one regex
+            keywords = '|'.join(map(re.escape, priority_data['keywords']))
+            keyword_pattern = r'\b(?:' + keywords + r')\b'
+            priority_data['signal_pattern'] = self._compile_patterns(
+                ['|'.join([keyword_pattern] + priority_data['patterns'])])[0]
+        
+        return {
+            'task_patterns': task_patterns,
+            'assignment_patterns': assignment_patterns,
+            'timeline_patterns': timeline_patterns,
+            'priority_indicators': priority_indicators,
+            
+            # One alternation per timeline category; only the first parseable date is used
+            '_timeline_explicit_union': self._compile_union(timeline_patterns['explicit_dates']),
+            '_timeline_relative_union': self._compile_union(timeline_patterns['relative_dates']),
+            
+            # Optional Hyperscan database that finds sentences worth scanning in one pass
+            '_assignment_prefilter': self._build_assignment_prefilter(assignment_patterns),
+            
+            # Keyword membership tests for validation, categorization and follow-up
+            '_action_verb_matcher': KeywordMatcher(task_patterns['action_verbs']),
+            '_exclusion_matcher': KeywordMatcher(task_patterns['exclusions']),
+            '_category_matchers': [
+                ('platform_initiative', KeywordMatcher([
+                    'platform', 'architecture', 'system', 'infrastructure'
+                ])),
+                ('stakeholder_followup', KeywordMatcher([
+                    'follow up', 'check in', 'circle back', 'touch base'
+                ])),
+                ('strategic_project', KeywordMatcher([
+                    'strategic', 'roadmap', 'vision', 'planning'
+                ]))
+            ],
+            '_scope_matchers': [
+                ('platform_wide', KeywordMatcher([
+                    'platform', 'all teams', 'organization', 'company'
+                ])),
+                ('cross_team', KeywordMatcher(['cross-team', 'multiple teams', 'coordination'])),
+                ('single_team', KeywordMatcher(['team', 'group', 'department']))
+            ],
+            '_follow_up_matcher': KeywordMatcher([
+                'follow up', 'check in', 'circle back', 'touch base',
+                'get back to', 'update on', 'report back'
+            ]),
+            '_high_impact_matcher': KeywordMatcher([
+                'platform', 'strategic', 'critical', 'important'
+            ]),
+            '_confidence_verb_matcher': KeywordMatcher([
+                'implement', 'design', 'review', 'update', 'create', 'build', 'fix', 'analyze'
+            ]),
+            
+            '_irregular_whitespace_re': re.compile(r'\s\s|[^\S ]'),
+            '_bullet_re': re.compile(r'^[-*•]\s+', re.MULTILINE),
+            '_assignee_re': re.compile(r'^[A-Za-z][A-Za-z\s.-]+$')
+        }
+    
     def _build_task_patterns(self) -> Dict:
         """Build task detection patterns"""
         return {
@@ -175,23 +373,149 @@ class IntelligentTaskDetector:
             }
         }
     
+    def _compile_patterns(self, patterns: List[str]) -> List[Pattern]:
+        """Compile raw pattern strings with the detector's matching flags"""
+        engine = self._pattern_module
+        return [engine.compile(pattern, engine.IGNORECASE | engine.MULTILINE)
+                for pattern in patterns]
+    
+    def _compile_union(self, patterns: List[Pattern]) -> Tuple[Pattern, Dict[str, Tuple[int, ...]]]:
+        """Combine patterns into one alternation, mapping each branch to its capture groups"""
+        
+        branches = []
+        branch_groups = {}
+        next_group = 1
+        for index, pattern in enumerate(patterns):
+            name = f"p{index}"
+            branches.append(f"(?P<{name}>{pattern.pattern})")
+            branch_groups[name] = tuple(range(next_group + 1, next_group + 1 + pattern.groups))
+            next_group += 1 + pattern.groups
+        
+        engine = self._pattern_module
+        union = engine.compile('|'.join(branches), engine.IGNORECASE | engine.MULTILINE)
+        return union, branch_groups
+    
+    def _build_assignment_prefilter(
+        self, assignment_patterns: Dict
+    ) -> Optional[Tuple[object, List[str]]]:
+        """Compile all assignment patterns into one Hyperscan prefilter database"""
+        
+        if hyperscan is None:
+            return None
+        
+        expressions = []
+        pattern_directions = []
+        for direction, patterns in assignment_patterns.items():
+            for pattern in patterns:
+                expressions.append(pattern.pattern.encode())
+                pattern_directions.append(direction)
+        
+        # Prefilter mode approximates constructs Hyperscan lacks (captures, atomic groups,
+        # lookahead) while still reporting every real match
+        flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE
+                 | hyperscan.HS_FLAG_PREFILTER)
+        try:
+            database = hyperscan.Database()
+            database.compile(expressions=expressions, ids=list(range(len(expressions))),
+                             elements=len(expressions), flags=[flags] * len(expressions))
+        except Exception as e:
+            self.logger.warning("Hyperscan prefilter unavailable", error=str(e))
+            return None
+        
+        return database, pattern_directions
+    
+    def _prefilter_assignment_spans(
+        self, content: str
+    ) -> Optional[Dict[str, List[Tuple[int, int]]]]:
+        """Sentence spans that may hold assignment matches, by direction (None means scan all)"""
+        
+        # Hyperscan's \w, \b and \s are ASCII-only, so only ASCII content is prefiltered
+        if self._assignment_prefilter is None or not content.isascii():
+            return None
+        
+        database, pattern_directions = self._assignment_prefilter
+        match_ends = {direction: set() for direction in self.assignment_patterns}
+        
+        def on_match(pattern_id, start, end, flags, context):
+            match_ends[pattern_directions[pattern_id]].add(end)
+        
+        database.scan(content.encode(), match_event_handler=on_match)
+        
+        spans = {}
+        for direction, ends in match_ends.items():
+            direction_spans = []
+            for end in sorted(ends):
+                if direction_spans and end - 1 <= direction_spans[-1][1]:
+                    continue
+                span_start = max(content.rfind(char, 0, end - 1)
+                                 for char in SENTENCE_BOUNDARY_CHARS) + 1
+                boundaries = (content.find(char, end - 1) for char in SENTENCE_BOUNDARY_CHARS)
+                span_end = min((index for index in boundaries if index != -1),
+                               default=len(content))
+                direction_spans.append((span_start, span_end))
+            spans[direction] = direction_spans
+        
+        return spans
+    
+    def _iter_assignment_matches(self, direction: str, content: str,
+                                 spans: Optional[List[Tuple[int, int]]] = None):
+        """Yield assignment matches with their capture groups, limited to spans if given"""
+        
+        # One scan per pattern: assignments nest ("I will ... and I need to ..."), and an
+        # alternation would only report the leftmost of two overlapping matches
+        for pattern in self.assignment_patterns[direction]:
+            groups = tuple(range(1, pattern.groups + 1))
+            for pos, endpos in spans if spans is not None else [(0, len(content))]:
+                for match in pattern.finditer(content, pos, endpos):
+                    yield match, groups
+    
     def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's database connection, opened and tuned on first use"""
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            self._local.connection = conn
+        return conn
+    
+    def close(self):
+        """Close this thread's database connection"""
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
     
     def detect_tasks_in_content(self, content: str, context: Dict) -> List[Dict]:
         """Detect tasks from content using local AI patterns"""
         
         task_candidates = []
         
+        if not content or len(content) < MIN_TASK_CONTENT_LENGTH:
+            return task_candidates
+        
+        # Identical transcripts re-analyzed on retries or re-ingest reuse earlier results
+        cache_key = self._result_cache_key(content, context)
+        cached_candidates = self._result_cache.get(cache_key)
+        if cached_candidates is not None:
+            self._result_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached_candidates)
+        
         try:
             # Clean and normalize content
             normalized_content = self._normalize_content(content)
             
             # Extract potential tasks using different patterns
-            incoming_tasks = self._extract_incoming_tasks(normalized_content)
-            outgoing_tasks = self._extract_outgoing_tasks(normalized_content)
-            self_tasks = self._extract_self_assigned_tasks(normalized_content)
+            spans = self._prefilter_assignment_spans(normalized_content) or {}
+            incoming_tasks = self._extract_incoming_tasks(normalized_content,
+                                                          spans.get('incoming_to_me'))
+            outgoing_tasks = self._extract_outgoing_tasks(normalized_content,
+                                                          spans.get('outgoing_from_me'))
+            self_tasks = self._extract_self_assigned_tasks(normalized_content,
+                                                           spans.get('self_assigned'))
             
             # Process all detected tasks
             all_tasks = []
@@ -199,18 +523,25 @@ class IntelligentTaskDetector:
             all_tasks.extend([(task, 'outgoing') for task in outgoing_tasks])
             all_tasks.extend([(task, 'self_assigned') for task in self_tasks])
             
-            for task_text, assignment_direction in all_tasks:
-                analysis = self._analyze_task_candidate(task_text, assignment_direction, normalized_content, context)
-                
+            for analysis in self._analyze_task_candidates(all_tasks, normalized_content, context):
                 if analysis['confidence_score'] >= self.MINIMUM_CONFIDENCE:
                     task_candidates.append(analysis)
             
             # Sort by confidence score
-            task_candidates.sort(key=lambda x: x['confidence_score'], reverse=True)
+            task_candidates.sort(key=itemgetter('confidence_score'), reverse=True)
+            
+            # Sorted descending, so high-confidence tasks form a prefix of the list
+            high_confidence = next((index for index, task in enumerate(task_candidates)
+                                    if task['confidence_score'] < self.AUTO_CREATE_THRESHOLD),
+                                   len(task_candidates))
             
             self.logger.info("Detected task candidates", 
                            count=len(task_candidates),
-                           high_confidence=len([t for t in task_candidates if t['confidence_score'] >= self.AUTO_CREATE_THRESHOLD]))
+                           high_confidence=high_confidence)
+            
+            self._result_cache[cache_key] = copy.deepcopy(task_candidates)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
             
             return task_candidates
             
@@ -218,77 +549,125 @@ class IntelligentTaskDetector:
             self.logger.error("Failed to detect tasks in content", error=str(e))
             return []
     
+    def _result_cache_key(self, content: str, context: Dict) -> Tuple:
+        """Cache key covering everything detection results depend on"""
+        
+        # Relative due dates are resolved against today, so results expire at midnight
+        return (
+            hashlib.blake2b(content.encode(), digest_size=16).digest(),
+            json.dumps(context, sort_keys=True, default=str),
+            self.MINIMUM_CONFIDENCE,
+            datetime.now().date()
+        )
+    
+    def _analyze_task_candidates(self, all_tasks: List[Tuple[TaskMatch, str]], full_content: str,
+                                 context: Dict) -> List[Dict]:
+        """Analyze task candidates, spreading long transcripts across worker processes"""
+        
+        workers = os.cpu_count() or 1
+        if len(all_tasks) >= PARALLEL_ANALYSIS_MIN_CANDIDATES and workers > 1:
+            chunk_size = -(-len(all_tasks) // workers)
+            chunks = [all_tasks[i:i + chunk_size] for i in range(0, len(all_tasks), chunk_size)]
+            try:
+                initargs = (str(self.db_path), self._use_regex_module)
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_analysis_worker,
+                                         initargs=initargs) as executor:
+                    results = executor.map(_analyze_candidate_chunk,
+                                           [full_content] * len(chunks), [context] * len(chunks),
+                                           chunks)
+                    return [analysis for chunk_results in results for analysis in chunk_results]
+            except Exception as e:
+                self.logger.warning("Parallel task analysis failed, analyzing sequentially",
+                                    error=str(e))
+        
+        # Lowercase once so every candidate slices its priority context from the same view
+        full_content_lower = _lowercase_view(full_content)
+        return [
+            self._analyze_task_candidate(task_text, assignment_direction, full_content, context,
+                                         assignee=assignee, span=(start, end),
+                                         full_content_lower=full_content_lower)
+            for (task_text, assignee, start, end), assignment_direction in all_tasks
+        ]
+    
     def _normalize_content(self, content: str) -> str:
         """Normalize content for better analysis"""
-        # Remove excessive whitespace
-        content = re.sub(r'\s+', ' ', content)
-        
-        # Remove markdown formatting but preserve structure
-        content = re.sub(r'[*_`]', '', content)
+        # Already-clean single-line text needs none of the substitutions below
+        if (not self._irregular_whitespace_re.search(content)
+                and not any(char in content for char in '*_`')
+                and content[:1] not in '-•'):
+            return content.strip()
+        
+        # Collapse whitespace runs (str.split uses the same whitespace class as \s),
+        # keeping edge whitespace as a single space like a \s+ substitution would
+        collapsed = ' '.join(content.split())
+        if content[:1].isspace():
+            collapsed = ' ' + collapsed
+        if content[-1:].isspace():
+            collapsed += ' '
+        
+        # Remove markdown formatting in one C-level pass
+        content = collapsed.translate(MARKDOWN_STRIP_TABLE)
         
         # Normalize bullet points
-        content = re.sub(r'^[-*•]\s+', '• ', content, flags=re.MULTILINE)
+        content = self._bullet_re.sub('• ', content)
         
         return content.strip()
     
-    def _extract_incoming_tasks(self, content: str) -> List[str]:
+    def _extract_incoming_tasks(self, content: str,
+                                spans: Optional[List[Tuple[int, int]]] = None) -> List[TaskMatch]:
         """Extract tasks assigned TO me"""
         tasks = []
         
-        for pattern in self.assignment_patterns['incoming_to_me']:
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                if match.groups():
-                    task_text = match.group(1).strip()
-                    if self._is_valid_task(task_text):
-                        tasks.append(task_text)
+        for match, groups in self._iter_assignment_matches('incoming_to_me', content, spans):
+            if groups:
+                task_text = match.group(groups[0]).strip()
+                if self._is_valid_task(task_text):
+                    tasks.append((task_text, None, match.start(groups[0]), match.end(groups[0])))
         
         return self._deduplicate_tasks(tasks)
     
-    def _extract_outgoing_tasks(self, content: str) -> List[Tuple[str, str]]:
+    def _extract_outgoing_tasks(self, content: str,
+                                spans: Optional[List[Tuple[int, int]]] = None) -> List[TaskMatch]:
         """Extract tasks assigned BY me to others"""
         tasks = []
         
-        for pattern in self.assignment_patterns['outgoing_from_me']:
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                if len(match.groups()) >= 2:
-                    assignee = match.group(1).strip()
-                    task_text = match.group(2).strip()
-                    if self._is_valid_task(task_text) and self._is_valid_assignee(assignee):
-                        tasks.append((task_text, assignee))
+        for match, groups in self._iter_assignment_matches('outgoing_from_me', content, spans):
+            if len(groups) >= 2:
+                assignee = match.group(groups[0]).strip()
+                task_text = match.group(groups[1]).strip()
+                if self._is_valid_task(task_text) and self._is_valid_assignee(assignee):
+                    tasks.append((task_text, assignee,
+                                  match.start(groups[1]), match.end(groups[1])))
         
         return tasks
     
-    def _extract_self_assigned_tasks(self, content: str) -> List[str]:
+    def _extract_self_assigned_tasks(
+        self, content: str, spans: Optional[List[Tuple[int, int]]] = None
+    ) -> List[TaskMatch]:
         """Extract tasks I assign to myself"""
         tasks = []
         
-        for pattern in self.assignment_patterns['self_assigned']:
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                if match.groups():
-                    task_text = match.group(1).strip()
-                    if self._is_valid_task(task_text):
-                        tasks.append(task_text)
+        for match, groups in self._iter_assignment_matches('self_assigned', content, spans):
+            if groups:
+                task_text = match.group(groups[0]).strip()
+                if self._is_valid_task(task_text):
+                    tasks.append((task_text, None, match.start(groups[0]), match.end(groups[0])))
         
         return self._deduplicate_tasks(tasks)
     
     def _is_valid_task(self, task_text: str) -> bool:
         """Validate if text represents a meaningful task"""
-        # Minimum length
-        if len(task_text) < 5 or len(task_text) > 200:
+        # Minimum length (assignment patterns already cap captures at 200 characters)
+        if len(task_text) < 5:
             return False
         
         # Check for exclusion patterns
         task_lower = task_text.lower()
-        for exclusion in self.task_patterns['exclusions']:
-            if exclusion in task_lower:
-                return False
+        if self._exclusion_matcher.search(task_lower):
+            return False
         
         # Must contain action-oriented language
-        has_action = any(verb in task_lower for verb in self.task_patterns['action_verbs'])
-        if not has_action:
+        if not self._action_verb_matcher.search(task_lower):
             return False
         
         # Avoid questions and hypotheticals
@@ -304,52 +683,85 @@ class IntelligentTaskDetector:
             return False
         
         # Should look like a name or role
-        if re.match(r'^[A-Za-z][A-Za-z\s.-]+$', assignee):
+        if self._assignee_re.match(assignee):
             return True
         
         return False
     
-    def _deduplicate_tasks(self, tasks: List[str]) -> List[str]:
+    def _deduplicate_tasks(self, tasks: List[TaskMatch], threshold: float = 0.8) -> List[TaskMatch]:
         """Remove duplicate and very similar tasks"""
         if not tasks:
             return []
         
+        signatures = [frozenset(task[0].lower().split()) for task in tasks]
+        token_counts = Counter(token for signature in signatures for token in signature)
+        
         unique_tasks = []
-        for task in tasks:
-            # Simple deduplication by similarity
-            is_duplicate = False
-            for existing in unique_tasks:
-                if self._tasks_similar(task, existing):
-                    is_duplicate = True
-                    break
+        unique_signatures = []
+        prefix_index = {}  # prefix token -> indexes of unique tasks
+        
+        for task, signature in zip(tasks, signatures):
+            # Prefix filter: with tokens ordered rarest first, two sets reaching the
+            # Jaccard threshold must share a token within their prefixes
+            prefix = sorted(signature, key=lambda token: (token_counts[token], token))
+            del prefix[self._prefix_length(len(signature), threshold):]
+            
+            candidates = {index for token in prefix for index in prefix_index.get(token, ())}
+            if any(self._signatures_similar(signature, unique_signatures[index], threshold)
+                   for index in candidates):
+                continue
             
-            if not is_duplicate:
-                unique_tasks.append(task)
+            for token in prefix:
+                prefix_index.setdefault(token, []).append(len(unique_tasks))
+            unique_tasks.append(task)
+            unique_signatures.append(signature)
         
         return unique_tasks
     
+    @staticmethod
+    def _prefix_length(size: int, threshold: float) -> int:
+        """Number of rarest tokens that must be indexed for a set of the given size"""
+        if size == 0:
+            return 0
+        # Epsilon keeps float products like 0.8 * 5 from rounding up a whole token
+        return size - math.ceil(threshold * size - 1e-9) + 1
+    
     def _tasks_similar(self, task1: str, task2: str, threshold: float = 0.8) -> bool:
         """Check if two tasks are similar enough to be considered duplicates"""
-        # Simple word-based similarity
-        words1 = set(task1.lower().split())
-        words2 = set(task2.lower().split())
-        
+        return self._signatures_similar(frozenset(task1.lower().split()),
+                                        frozenset(task2.lower().split()), threshold)
+    
+    @staticmethod
+    def _signatures_similar(words1: FrozenSet[str], words2: FrozenSet[str],
+                            threshold: float = 0.8) -> bool:
+        """Word-set Jaccard similarity check on precomputed task signatures"""
         if len(words1) == 0 or len(words2) == 0:
             return False
         
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
+        # Jaccard can never exceed the size ratio of the two sets
+        if min(len(words1), len(words2)) < threshold * max(len(words1), len(words2)):
+            return False
+        
+        intersection = len(words1 & words2)
+        union = len(words1) + len(words2) - intersection
         
-        similarity = intersection / union if union > 0 else 0
-        return similarity >= threshold
+        return intersection / union >= threshold
     
-    def _analyze_task_candidate(self, task_text: str, assignment_direction: str, full_content: str, context: Dict) -> Dict:
+    def _analyze_task_candidate(self, task_text: str, assignment_direction: str,
+                                full_content: str, context: Dict,
+                                assignee: Optional[str] = None,
+                                span: Optional[Tuple[int, int]] = None,
+                                full_content_lower: Optional[str] = None) -> Dict:
         """Analyze a task candidate and extract metadata"""
         
+        if span is None:
+            span = self._locate_task(task_text, full_content)
+        task_lower = task_text.lower()
+        
         analysis = {
             'task_text': task_text,
             'assignment_direction': assignment_direction,
-            'assignee': None,
+            'assignee': assignee,
             'priority': 'medium',
             'priority_score': 5,
             'due_date': None,
@@ -361,54 +773,56 @@ class IntelligentTaskDetector:
             'detection_metadata': {}
         }
         
-        # Extract assignee for outgoing tasks
-        if assignment_direction == 'outgoing' and isinstance(task_text, tuple):
-            analysis['task_text'] = task_text[0]
-            analysis['assignee'] = task_text[1]
-        
         # Analyze priority
-        priority_analysis = self._analyze_priority(task_text, full_content)
+        priority_analysis = self._analyze_priority(task_text, full_content, span,
+                                                   task_lower=task_lower,
+                                                   full_content_lower=full_content_lower)
         analysis['priority'] = priority_analysis['level']
         analysis['priority_score'] = priority_analysis['score']
         
         # Analyze timeline
-        timeline_analysis = self._analyze_timeline(task_text, full_content)
+        timeline_analysis = self._analyze_timeline(task_text, full_content, span)
         analysis['due_date'] = timeline_analysis.get('due_date')
         
         # Analyze category and scope
-        category_analysis = self._analyze_category_and_scope(task_text, context)
+        category_analysis = self._analyze_category_and_scope(task_text, context,
+                                                             task_lower=task_lower)
         analysis['category'] = category_analysis['category']
         analysis['impact_scope'] = category_analysis['scope']
         
         # Determine if follow-up is required
-        analysis['follow_up_required'] = self._requires_follow_up(task_text, assignment_direction)
+        analysis['follow_up_required'] = self._requires_follow_up(task_text, assignment_direction,
+                                                                  task_lower=task_lower)
         
         # Calculate confidence score
-        analysis['confidence_score'] = self._calculate_task_confidence(analysis, full_content, context)
+        analysis['confidence_score'] = self._calculate_task_confidence(
+            analysis, full_content, context, task_lower=task_lower)
         
         return analysis
     
-    def _analyze_priority(self, task_text: str, full_content: str) -> Dict:
+    def _analyze_priority(self, task_text: str, full_content: str,
+                          span: Optional[Tuple[int, int]] = None,
+                          task_lower: Optional[str] = None,
+                          full_content_lower: Optional[str] = None) -> Dict:
         """Analyze task priority based on language patterns"""
         
-        task_context = self._extract_task_context(task_text, full_content, window=100)
-        combined_text = f"{task_text} {task_context}".lower()
+        if span is None:
+            span = self._locate_task(task_text, full_content)
+        if task_lower is None:
+            task_lower = task_text.lower()
+        if full_content_lower is not None:
+            context_lower = self._extract_task_context(full_content_lower, span, window=100)
+        else:
+            context_lower = self._extract_task_context(full_content, span, window=100).lower()
+        combined_text = f"{task_lower} {context_lower}"
         
         best_priority = 'medium'
         best_score = 5
         
         for priority_level, priority_data in self.priority_indicators.items():
-            score = 0
-            
-            # Check keywords
-            for keyword in priority_data['keywords']:
-                if keyword in combined_text:
-                    score += priority_data['weight']
-            
-            # Check patterns
-            for pattern in priority_data['patterns']:
-                if re.search(pattern, combined_text, re.IGNORECASE):
-                    score += priority_data['weight']
+            # One scan per level; every keyword or pattern occurrence adds the level weight
+            signal_count = len(priority_data['signal_pattern'].findall(combined_text))
+            score = signal_count * priority_data['weight']
             
             if score > best_score:
                 best_score = score
@@ -419,61 +833,49 @@ class IntelligentTaskDetector:
             'score': best_score
         }
     
-    def _analyze_timeline(self, task_text: str, full_content: str) -> Dict:
+    def _analyze_timeline(self, task_text: str, full_content: str,
+                          span: Optional[Tuple[int, int]] = None) -> Dict:
         """Analyze task timeline and due dates"""
         
-        task_context = self._extract_task_context(task_text, full_content, window=150)
+        if span is None:
+            span = self._locate_task(task_text, full_content)
+        task_context = self._extract_task_context(full_content, span, window=150)
         combined_text = f"{task_text} {task_context}"
         
         timeline_info = {}
         
-        # Look for explicit dates
-        for pattern in self.timeline_patterns['explicit_dates']:
-            match = re.search(pattern, combined_text, re.IGNORECASE)
-            if match:
-                date_text = match.group(1)
-                parsed_date = self._parse_date_text(date_text)
-                if parsed_date:
-                    timeline_info['due_date'] = parsed_date
-                    break
-        
-        # Look for relative dates if no explicit date found
-        if 'due_date' not in timeline_info:
-            for pattern in self.timeline_patterns['relative_dates']:
-                match = re.search(pattern, combined_text, re.IGNORECASE)
-                if match:
-                    relative_text = match.group(1)
-                    parsed_date = self._parse_relative_date(relative_text)
-                    if parsed_date:
-                        timeline_info['due_date'] = parsed_date
-                        break
+        # Explicit dates take precedence; within each union the earliest parseable mention wins
+        union, branch_groups = self._timeline_explicit_union
+        for match in union.finditer(combined_text):
+            parsed_date = self._parse_date_text(match.group(branch_groups[match.lastgroup][0]))
+            if parsed_date:
+                timeline_info['due_date'] = parsed_date
+                return timeline_info
+        
+        # Relative phrases are parsed whole so "in 3 days" keeps its unit
+        union, _ = self._timeline_relative_union
+        for match in union.finditer(combined_text):
+            parsed_date = self._parse_relative_date(match.group(match.lastgroup))
+            if parsed_date:
+                timeline_info['due_date'] = parsed_date
+                return timeline_info
         
         return timeline_info
     
-    def _analyze_category_and_scope(self, task_text: str, context: Dict) -> Dict:
+    def _analyze_category_and_scope(self, task_text: str, context: Dict,
+                                    task_lower: Optional[str] = None) -> Dict:
         """Analyze task category and impact scope"""
         
-        task_lower = task_text.lower()
+        if task_lower is None:
+            task_lower = task_text.lower()
         
         # Determine category
-        category = 'operational'  # default
-        
-        if any(word in task_lower for word in ['platform', 'architecture', 'system', 'infrastructure']):
-            category = 'platform_initiative'
-        elif any(word in task_lower for word in ['follow up', 'check in', 'circle back', 'touch base']):
-            category = 'stakeholder_followup'
-        elif any(word in task_lower for word in ['strategic', 'roadmap', 'vision', 'planning']):
-            category = 'strategic_project'
+        category = next((name for name, matcher in self._category_matchers
+                         if matcher.search(task_lower)), 'operational')
         
         # Determine scope
-        scope = 'individual'  # default
-        
-        if any(word in task_lower for word in ['platform', 'all teams', 'organization', 'company']):
-            scope = 'platform_wide'
-        elif any(word in task_lower for word in ['cross-team', 'multiple teams', 'coordination']):
-            scope = 'cross_team'
-        elif any(word in task_lower for word in ['team', 'group', 'department']):
-            scope = 'single_team'
+        scope = next((name for name, matcher in self._scope_matchers
+                      if matcher.search(task_lower)), 'individual')
         
         # Context-based adjustments
         if context.get('meeting_type') in ['vp_1on1', 'strategic_planning']:
@@ -487,18 +889,15 @@ class IntelligentTaskDetector:
             'scope': scope
         }
     
-    def _requires_follow_up(self, task_text: str, assignment_direction: str) -> bool:
+    def _requires_follow_up(self, task_text: str, assignment_direction: str,
+                            task_lower: Optional[str] = None) -> bool:
         """Determine if task requires follow-up"""
         
-        task_lower = task_text.lower()
+        if task_lower is None:
+            task_lower = task_text.lower()
         
         # Explicit follow-up language
-        follow_up_indicators = [
-            'follow up', 'check in', 'circle back', 'touch base',
-            'get back to', 'update on', 'report back'
-        ]
-        
-        if any(indicator in task_lower for indicator in follow_up_indicators):
+        if self._follow_up_matcher.search(task_lower):
             return True
         
         # Outgoing tasks typically require follow-up
@@ -506,22 +905,30 @@ class IntelligentTaskDetector:
             return True
         
         # High-impact tasks require follow-up
-        if any(word in task_lower for word in ['platform', 'strategic', 'critical', 'important']):
+        if self._high_impact_matcher.search(task_lower):
             return True
         
         return False
     
-    def _extract_task_context(self, task_text: str, full_content: str, window: int = 100) -> str:
-        """Extract context around task mention"""
+    def _locate_task(self, task_text: str, full_content: str) -> Optional[Tuple[int, int]]:
+        """Find the span of a task mention when no match offsets are available"""
         
-        # Find task in content
         task_pos = full_content.lower().find(task_text.lower())
         if task_pos == -1:
+            return None
+        
+        return task_pos, task_pos + len(task_text)
+    
+    def _extract_task_context(self, full_content: str, span: Optional[Tuple[int, int]],
+                              window: int = 100) -> str:
+        """Extract context around task mention"""
+        
+        if span is None:
             return ""
         
         # Extract window around task
-        start = max(0, task_pos - window)
-        end = min(len(full_content), task_pos + len(task_text) + window)
+        start = max(0, span[0] - window)
+        end = min(len(full_content), span[1] + window)
         
         return full_content[start:end]
     
@@ -529,15 +936,10 @@ class IntelligentTaskDetector:
         """Parse date text into ISO format"""
         
         # Handle weekdays (relative to current week)
-        weekdays = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-        
         date_lower = date_text.lower()
-        if date_lower in weekdays:
+        if date_lower in WEEKDAYS:
             today = datetime.now()
-            target_weekday = weekdays[date_lower]
+            target_weekday = WEEKDAYS[date_lower]
             current_weekday = today.weekday()
             
             days_ahead = target_weekday - current_weekday
@@ -548,13 +950,8 @@ class IntelligentTaskDetector:
             return target_date.strftime('%Y-%m-%d')
         
         # Handle MM/DD or MM/DD/YY formats
-        date_patterns = [
-            r'(\d{1,2})\/(\d{1,2})\/(\d{2,4})',
-            r'(\d{1,2})\/(\d{1,2})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.match(pattern, date_text)
+        for pattern in (DATE_MDY_RE, DATE_MD_RE):
+            match = pattern.match(date_text)
             if match:
                 try:
                     month = int(match.group(1))
@@ -612,7 +1009,7 @@ class IntelligentTaskDetector:
             target_date = today
         else:
             # Try to parse "in X days/weeks/months"
-            match = re.match(r'in\s+(\d+)\s+(days?|weeks?|months?)', relative_lower)
+            match = IN_X_UNITS_RE.match(relative_lower)
             if match:
                 amount = int(match.group(1))
                 unit = match.group(2)
@@ -630,13 +1027,16 @@ class IntelligentTaskDetector:
         
         return target_date.strftime('%Y-%m-%d')
     
-    def _calculate_task_confidence(self, analysis: Dict, full_content: str, context: Dict) -> float:
+    def _calculate_task_confidence(self, analysis: Dict, full_content: str, context: Dict,
+                                   task_lower: Optional[str] = None) -> float:
         """Calculate confidence score for task detection"""
         
         score = 0.0
         
         # Base task clarity (40%)
         task_text = analysis['task_text']
+        if task_lower is None:
+            task_lower = task_text.lower()
         
         # Length and clarity
         if 10 <= len(task_text) <= 100:
@@ -645,8 +1045,7 @@ class IntelligentTaskDetector:
             score += 0.1
         
         # Action-oriented language
-        action_verbs = ['implement', 'design', 'review', 'update', 'create', 'build', 'fix', 'analyze']
-        if any(verb in task_text.lower() for verb in action_verbs):
+        if self._confidence_verb_matcher.search(task_lower):
             score += 0.2
         
         # Assignment direction clarity (25%)
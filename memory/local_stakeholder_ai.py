@@ -4,18 +4,118 @@ Local Stakeholder Intelligence Engine
 Privacy-first automated stakeholder detection and profiling with local-only processing
 """
 
+import bisect
+import copy
+import hashlib
 import json
 import re
 import sqlite3
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 import structlog
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = structlog.get_logger()
 
+# Keys per IN (...) lookup, below SQLite's default host parameter limit
+EXISTING_LOOKUP_BATCH_SIZE = 500
+
+# Profile columns returned by existing-stakeholder lookups
+PROFILE_LOOKUP_COLUMNS = """
+    stakeholder_key, display_name, role_title, strategic_importance,
+    optimal_meeting_frequency, preferred_communication_channels,
+    communication_style, most_effective_personas
+"""
+
+# Importance score cut-offs and the level for each band (below 2, 2-5, 5-8, 8 and up)
+IMPORTANCE_THRESHOLDS = [2, 5, 8]
+IMPORTANCE_LEVELS = ['low', 'medium', 'high', 'critical']
+
+# CLI confidence indicator for each band (below 0.6, 0.6-0.8, 0.8 and up)
+CONFIDENCE_EMOJI_THRESHOLDS = [0.6, 0.8]
+CONFIDENCE_EMOJIS = ['🔴', '🟡', '🟢']
+
+# Detection results kept per engine for re-analyzed documents
+RESULT_CACHE_SIZE = 256
+
+# Stakeholder key mapping for ASCII: spaces and hyphens become underscores, anything
+# outside [a-z0-9_] is dropped
+STAKEHOLDER_KEY_TABLE = str.maketrans(
+    {chr(code): None for code in range(128) if not (chr(code).isalnum() or chr(code) == '_')}
+)
+STAKEHOLDER_KEY_TABLE.update({ord(' '): '_', ord('-'): '_'})
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex definition of a word character"""
+    return char.isalnum() or char == '_'
+
+
+class KeywordScanner:
+    """Finds which of a fixed set of keywords occur in a text"""
+    
+    def __init__(self, keywords: List[str], whole_words: bool = False):
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+        self.whole_words = whole_words
+        self._automaton = None
+        self._word_res = None
+        
+        # Aho-Corasick reports every keyword hit in a single pass over the text
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+        elif whole_words:
+            self._word_res = [
+                (keyword, re.compile(r'(?<!\w)' + re.escape(keyword) + r'(?!\w)'))
+                for keyword in self.keywords
+            ]
+    
+    def find(self, text: str) -> Set[str]:
+        """Return the keywords that occur in an already-lowercased text"""
+        if self._automaton is not None:
+            if not self.whole_words:
+                return {keyword for _, keyword in self._automaton.iter(text)}
+            
+            # Keep only hits that are not glued to a neighbouring word character
+            found = set()
+            for end, keyword in self._automaton.iter(text):
+                if keyword in found:
+                    continue
+                start = end - len(keyword) + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end + 1 < len(text) and _is_word_char(text[end + 1]):
+                    continue
+                found.add(keyword)
+            return found
+        
+        if self._word_res is not None:
+            return {keyword for keyword, word_re in self._word_res if word_re.search(text)}
+        return {keyword for keyword in self.keywords if keyword in text}
+
 
 class LocalStakeholderAI:
     """Local-only AI engine for stakeholder detection and profiling"""
@@ -28,6 +128,9 @@ class LocalStakeholderAI:
             self.db_path = Path(__file__).parent / "strategic_memory.db"
         
         self.logger = logger.bind(component="local_stakeholder_ai")
+        self._result_cache = OrderedDict()
+        # Per-thread connections; each closes via close() or when its thread exits
+        self._local = threading.local()
         
         # Local pattern libraries - no external dependencies
         self.name_patterns = self._build_name_patterns()
@@ -35,6 +138,58 @@ class LocalStakeholderAI:
         self.importance_indicators = self._build_importance_indicators()
         self.communication_patterns = self._build_communication_patterns()
         
+        # Compile patterns once; each name shape is scanned separately because shapes
+        # overlap ("M. Smith" inside "John M. Smith") and an alternation keeps only one
+        self._name_res = [re.compile(pattern) for pattern in self.name_patterns['name_indicators']]
+        self._email_res = [re.compile(pattern) for pattern in self.name_patterns['email_patterns']]
+        self._whitespace_re = re.compile(r'\s+')
+        self._markdown_re = re.compile(r'[#*`_]')
+        self._key_strip_re = re.compile(r'[^a-z0-9_]')
+        self._exclusions = self.name_patterns['exclusions']
+        
+        # Keyword scanners for the role, importance and communication analyzers; role titles
+        # must be whole words so "dir" or "cto" never match inside "direct" or "doctor", while
+        # communication indicators still match as substrings so plurals like "emails" count
+        self._role_scanner = KeywordScanner([
+            title for role_data in self.role_patterns.values() for title in role_data['titles']
+        ], whole_words=True)
+        self._importance_scanner = KeywordScanner([
+            indicator
+            for indicators in self.importance_indicators.values()
+            for indicator in indicators
+        ])
+        self._communication_scanner = KeywordScanner([
+            indicator
+            for indicator_group in self.communication_patterns.values()
+            for indicators in indicator_group.values()
+            for indicator in indicators
+        ])
+        
+        # Keyword sets and weights so scoring works on the hits instead of every keyword;
+        # each role title lists the (role, weight) pairs it contributes to
+        self._role_title_weights = {}
+        for role_category, role_data in self.role_patterns.items():
+            for title in dict.fromkeys(title.lower() for title in role_data['titles']):
+                self._role_title_weights.setdefault(title, []).append(
+                    (role_category, role_data['weight']))
+        self._max_role_weight = max(role_data['weight']
+                                    for role_data in self.role_patterns.values())
+        self._importance_weights = Counter()
+        for indicators in self.importance_indicators.values():
+            for indicator, weight in indicators.items():
+                self._importance_weights[indicator.lower()] += weight
+        self._channel_indicator_sets = [
+            (channel, frozenset(indicator.lower() for indicator in indicators))
+            for channel, indicators in self.communication_patterns['channel_indicators'].items()
+        ]
+        self._style_indicator_sets = [
+            (style, frozenset(indicator.lower() for indicator in indicators))
+            for style, indicators in self.communication_patterns['style_indicators'].items()
+        ]
+        
+        # Optional Hyperscan database that finds names in one pass
+        self._name_scanner = self._build_name_scanner()
+        
         # Detection thresholds
         self.AUTO_CREATE_THRESHOLD = 0.85
         self.PROFILING_THRESHOLD = 0.65
@@ -52,10 +207,10 @@ class LocalStakeholderAI:
             'email_patterns': [
                 r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
             ],
-            'exclusions': [
+            'exclusions': frozenset([
                 'engineering', 'product', 'design', 'marketing', 'legal',
                 'meeting', 'project', 'initiative', 'team', 'group'
-            ]
+            ])
         }
     
     def _build_role_patterns(self) -> Dict:
@@ -134,9 +289,41 @@ class LocalStakeholderAI:
             }
         }
     
+    def _build_name_scanner(self):
+        """Compile the name indicator patterns into one Hyperscan database"""
+        
+        if hyperscan is None:
+            return None
+        
+        expressions = self.name_patterns['name_indicators']
+        try:
+            database = hyperscan.Database()
+            database.compile(expressions=[pattern.encode() for pattern in expressions],
+                             ids=list(range(len(expressions))), elements=len(expressions),
+                             flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions))
+        except Exception as e:
+            self.logger.warning("Hyperscan name scanner unavailable", error=str(e))
+            return None
+        
+        return database
+    
     def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's database connection, opened and tuned on first use"""
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=128)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+        return conn
+    
+    def close(self):
+        """Close this thread's database connection"""
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
     
     def detect_stakeholders_in_content(self, content: str, context: Dict) -> List[Dict]:
         """Detect potential stakeholders in content using local NLP"""
@@ -144,25 +331,47 @@ class LocalStakeholderAI:
         stakeholder_candidates = []
         
         try:
+            # Identical documents re-analyzed by the CLI or re-ingest reuse earlier results
+            cache_key = self._result_cache_key(content, context)
+            cached_candidates = self._result_cache.get(cache_key)
+            if cached_candidates is not None:
+                self._result_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached_candidates)
+            
             # Clean and normalize content
             normalized_content = self._normalize_content(content)
             
             # Extract potential names
             potential_names = self._extract_names(normalized_content)
             
-            # Analyze each potential stakeholder
-            for name in potential_names:
-                analysis = self._analyze_stakeholder_candidate(name, normalized_content, context)
+            # Analyze each potential stakeholder against one shared lowercase view, keeping
+            # the confidence scores alongside so sorting and counting never touch the dicts
+            content_lower = normalized_content.lower()
+            analyses = []
+            confidence_scores = []
+            for name_lower, name in potential_names.items():
+                analysis = self._analyze_stakeholder_candidate(name, normalized_content, context,
+                                                               content_lower=content_lower,
+                                                               name_lower=name_lower)
                 
-                if analysis['confidence_score'] >= self.PROFILING_THRESHOLD:
-                    stakeholder_candidates.append(analysis)
+                if (analysis is not None
+                        and analysis['confidence_score'] >= self.PROFILING_THRESHOLD):
+                    analyses.append(analysis)
+                    confidence_scores.append(analysis['confidence_score'])
             
             # Sort by confidence score
-            stakeholder_candidates.sort(key=lambda x: x['confidence_score'], reverse=True)
+            order = sorted(range(len(confidence_scores)), key=confidence_scores.__getitem__,
+                           reverse=True)
+            stakeholder_candidates = [analyses[i] for i in order]
             
             self.logger.info("Detected stakeholder candidates", 
                            count=len(stakeholder_candidates),
-                           high_confidence=len([s for s in stakeholder_candidates if s['confidence_score'] >= self.AUTO_CREATE_THRESHOLD]))
+                           high_confidence=sum(score >= self.AUTO_CREATE_THRESHOLD
+                                               for score in confidence_scores))
+            
+            self._result_cache[cache_key] = copy.deepcopy(stakeholder_candidates)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
             
             return stakeholder_candidates
             
@@ -170,55 +379,90 @@ class LocalStakeholderAI:
             self.logger.error("Failed to detect stakeholders in content", error=str(e))
             return []
     
+    def _result_cache_key(self, content: str, context: Dict) -> Tuple:
+        """Cache key covering everything detection results depend on"""
+        return (
+            hashlib.blake2b(content.encode(), digest_size=16).digest(),
+            json.dumps(context, sort_keys=True, default=str),
+            self.PROFILING_THRESHOLD
+        )
+    
     def _normalize_content(self, content: str) -> str:
         """Normalize content for better analysis"""
         # Remove excessive whitespace
-        content = re.sub(r'\s+', ' ', content)
+        content = self._whitespace_re.sub(' ', content)
         
         # Remove markdown formatting
-        content = re.sub(r'[#*`_]', '', content)
+        content = self._markdown_re.sub('', content)
         
         # Normalize case for analysis while preserving names
         return content.strip()
     
-    def _extract_names(self, content: str) -> Set[str]:
-        """Extract potential names using local regex patterns"""
-        potential_names = set()
+    def _extract_names(self, content: str) -> Dict[str, str]:
+        """Extract potential names using local regex patterns, keyed by lowercased name"""
         
-        # Extract from various name patterns
-        for pattern in self.name_patterns['name_indicators']:
-            matches = re.findall(pattern, content)
-            potential_names.update(matches)
+        # Extract from various name patterns; Hyperscan's \b is ASCII-only and its offsets
+        # are bytes, so it only handles ASCII content
+        if self._name_scanner is not None and content.isascii():
+            potential_names = self._scan_names(content)
+        else:
+            potential_names = [name for name_re in self._name_res
+                               for name in name_re.findall(content)]
         
         # Extract from email addresses
-        for email_pattern in self.name_patterns['email_patterns']:
-            email_matches = re.findall(email_pattern, content)
-            for email in email_matches:
-                # Extract name part before @
-                name_part = email.split('@')[0]
-                # Convert dot/underscore separated to proper name
-                if '.' in name_part:
-                    name_parts = name_part.split('.')
-                    if len(name_parts) == 2:
-                        potential_name = f"{name_parts[0].title()} {name_parts[1].title()}"
-                        potential_names.add(potential_name)
-        
-        # Filter out obvious non-names
-        filtered_names = set()
+        email_matches = [email for email_re in self._email_res
+                         for email in email_re.findall(content)] if '@' in content else []
+        for email in email_matches:
+            # Extract name part before @
+            name_part = email.split('@')[0]
+            # Convert dot/underscore separated to proper name
+            if '.' in name_part:
+                name_parts = name_part.split('.')
+                if len(name_parts) == 2:
+                    potential_name = f"{name_parts[0].title()} {name_parts[1].title()}"
+                    potential_names.append(potential_name)
+        
+        # Filter out obvious non-names and merge mentions that differ only in case; they
+        # match the same positions, so one analysis covers them all
+        filtered_names = {}
         for name in potential_names:
-            if not self._is_excluded_name(name.lower()):
-                filtered_names.add(name)
+            name_lower = name.lower()
+            # Keep the first mention unless a title-cased form turns up later
+            if name_lower in filtered_names and name != name.title():
+                continue
+            if not self._is_excluded_name(name):
+                filtered_names[name_lower] = name
         
         return filtered_names
     
+    def _scan_names(self, content: str) -> List[str]:
+        """Find name matches with a single Hyperscan pass, in per-pattern findall order"""
+        
+        spans = [[] for _ in self.name_patterns['name_indicators']]
+        
+        def on_match(pattern_id, start, end, flags, context):
+            spans[pattern_id].append((start, end))
+        
+        self._name_scanner.scan(content.encode(), match_event_handler=on_match)
+        
+        # Hyperscan reports overlapping matches; each name shape has one match per start,
+        # so keeping each pattern's leftmost non-overlapping spans reproduces its findall
+        matches = []
+        for pattern_spans in spans:
+            last_end = 0
+            for start, end in sorted(pattern_spans):
+                if start >= last_end:
+                    matches.append(content[start:end])
+                    last_end = end
+        
+        return matches
+    
     def _is_excluded_name(self, name: str) -> bool:
         """Check if name should be excluded"""
-        name_lower = name.lower()
-        
-        # Check against exclusion list
-        for exclusion in self.name_patterns['exclusions']:
-            if exclusion in name_lower:
-                return True
+        # Check against exclusion list; whole words only, so a surname that merely
+        # contains an excluded word is kept
+        if not self._exclusions.isdisjoint(name.lower().split()):
+            return True
         
         # Must have at least one capital letter (proper name)
         if not any(c.isupper() for c in name):
@@ -230,8 +474,17 @@ class LocalStakeholderAI:
         
         return False
     
-    def _analyze_stakeholder_candidate(self, name: str, content: str, context: Dict) -> Dict:
-        """Analyze a potential stakeholder candidate"""
+    def _analyze_stakeholder_candidate(self, name: str, content: str, context: Dict,
+                                       content_lower: Optional[str] = None,
+                                       name_lower: Optional[str] = None) -> Optional[Dict]:
+        """Analyze a stakeholder candidate, or None if it cannot reach the profiling threshold"""
+        
+        # Lowercase once; each analyzer gets a window sliced from the lowercased content
+        if content_lower is None:
+            content_lower = content.lower()
+        if name_lower is None:
+            name_lower = name.lower()
+        positions = self._find_name_positions(name, content_lower, name_lower)
         
         analysis = {
             'name': name,
@@ -246,18 +499,30 @@ class LocalStakeholderAI:
             'source_context': context
         }
         
+        # Slice the role and importance windows together in one pass over the positions
+        role_context, importance_context = self._slice_windows(content_lower, positions,
+                                                               len(name_lower), (50, 100))
+        
         # Analyze role indicators
-        role_analysis = self._analyze_role_indicators(name, content)
+        role_analysis = self._analyze_role_indicators(name, content, role_context)
         analysis['detected_role'] = role_analysis['role']
         analysis['role_confidence'] = role_analysis['confidence']
         
         # Analyze strategic importance
-        importance_analysis = self._analyze_importance_indicators(name, content, context)
+        importance_analysis = self._analyze_importance_indicators(name, content, context,
+                                                                  importance_context)
         analysis['strategic_importance'] = importance_analysis['level']
         analysis['importance_score'] = importance_analysis['score']
         
+        # Even perfect communication signals cannot lift this candidate to the profiling
+        # threshold, so skip the widest context window
+        if self._calculate_confidence_score(analysis, comm_score=1.0) < self.PROFILING_THRESHOLD:
+            return None
+        
         # Analyze communication preferences
-        comm_analysis = self._analyze_communication_patterns(name, content)
+        comm_analysis = self._analyze_communication_patterns(
+            name, content,
+            self._slice_windows(content_lower, positions, len(name_lower), (150,))[0])
         analysis['communication_preferences'] = comm_analysis
         
         # Calculate overall confidence
@@ -267,36 +532,37 @@ class LocalStakeholderAI:
     
     def _generate_stakeholder_key(self, name: str) -> str:
         """Generate a stakeholder key from name"""
-        # Convert "John Smith" to "john_smith"
-        key = name.lower().replace(' ', '_').replace('.', '').replace('-', '_')
-        # Remove any special characters
-        key = re.sub(r'[^a-z0-9_]', '', key)
+        # Convert "John Smith" to "john_smith" and drop special characters in one pass
+        key = name.lower().translate(STAKEHOLDER_KEY_TABLE)
+        # Non-ASCII characters fall outside the table
+        if not key.isascii():
+            key = self._key_strip_re.sub('', key)
         return key
     
-    def _analyze_role_indicators(self, name: str, content: str) -> Dict:
+    def _analyze_role_indicators(self, name: str, content: str,
+                                 name_context_lower: Optional[str] = None) -> Dict:
         """Analyze role indicators around the name"""
         
         # Look for role indicators near the name
-        name_context = self._extract_name_context(name, content, window=50)
-        
-        best_role = None
-        best_score = 0.0
-        
-        for role_category, role_data in self.role_patterns.items():
-            score = 0.0
-            
-            for title in role_data['titles']:
-                # Case-insensitive search
-                if title.lower() in name_context.lower():
-                    score += role_data['weight']
-            
-            if score > best_score:
-                best_score = score
-                best_role = role_category
+        if name_context_lower is None:
+            name_context_lower = self._extract_name_context(name, content, window=50).lower()
+        found_titles = self._role_scanner.find(name_context_lower)
+        
+        # Accumulate every role's score in one pass over the hits
+        role_scores = dict.fromkeys(self.role_patterns, 0.0)
+        for title in found_titles:
+            for role_category, weight in self._role_title_weights[title]:
+                role_scores[role_category] += weight
+        
+        # The first role with the highest positive score wins
+        best_role = max(role_scores, key=role_scores.get)
+        best_score = role_scores[best_role]
+        if best_score <= 0:
+            best_role = None
+            best_score = 0.0
         
         # Normalize confidence
-        max_possible_score = max(role_data['weight'] for role_data in self.role_patterns.values())
-        confidence = min(1.0, best_score / max_possible_score) if best_score > 0 else 0.0
+        confidence = min(1.0, best_score / self._max_role_weight) if best_score > 0 else 0.0
         
         return {
             'role': best_role,
@@ -304,18 +570,17 @@ class LocalStakeholderAI:
             'raw_score': best_score
         }
     
-    def _analyze_importance_indicators(self, name: str, content: str, context: Dict) -> Dict:
+    def _analyze_importance_indicators(self, name: str, content: str, context: Dict,
+                                       name_context_lower: Optional[str] = None) -> Dict:
         """Analyze strategic importance indicators"""
         
-        name_context = self._extract_name_context(name, content, window=100)
-        
-        total_score = 0.0
+        if name_context_lower is None:
+            name_context_lower = self._extract_name_context(name, content, window=100).lower()
+        found_indicators = self._importance_scanner.find(name_context_lower)
         
         # Check various importance indicators
-        for category, indicators in self.importance_indicators.items():
-            for indicator, weight in indicators.items():
-                if indicator.lower() in name_context.lower():
-                    total_score += weight
+        total_score = float(sum(self._importance_weights[indicator]
+                                for indicator in found_indicators))
         
         # Context-based scoring
         if context.get('file_type') == 'vp_meeting':
@@ -324,24 +589,20 @@ class LocalStakeholderAI:
             total_score += 1
         
         # Determine importance level
-        if total_score >= 8:
-            level = 'critical'
-        elif total_score >= 5:
-            level = 'high'
-        elif total_score >= 2:
-            level = 'medium'
-        else:
-            level = 'low'
+        level = IMPORTANCE_LEVELS[bisect.bisect_right(IMPORTANCE_THRESHOLDS, total_score)]
         
         return {
             'level': level,
             'score': total_score
         }
     
-    def _analyze_communication_patterns(self, name: str, content: str) -> Dict:
+    def _analyze_communication_patterns(self, name: str, content: str,
+                                        name_context_lower: Optional[str] = None) -> Dict:
         """Analyze communication preferences from content"""
         
-        name_context = self._extract_name_context(name, content, window=150)
+        if name_context_lower is None:
+            name_context_lower = self._extract_name_context(name, content, window=150).lower()
+        found_indicators = self._communication_scanner.find(name_context_lower)
         
         preferences = {
             'channels': [],
@@ -349,53 +610,73 @@ class LocalStakeholderAI:
             'frequency_indicators': []
         }
         
-        # Detect preferred channels
-        for channel, indicators in self.communication_patterns['channel_indicators'].items():
-            for indicator in indicators:
-                if indicator.lower() in name_context.lower():
-                    preferences['channels'].append(channel)
+        # Detect preferred channels, ranked by how many of their indicators appear
+        channel_counts = Counter()
+        for channel, indicators in self._channel_indicator_sets:
+            hits = len(indicators & found_indicators)
+            if hits:
+                channel_counts[channel] = hits
+        preferences['channels'] = [channel for channel, _ in channel_counts.most_common(3)]
         
         # Detect communication style
-        style_scores = {}
-        for style, indicators in self.communication_patterns['style_indicators'].items():
-            score = sum(1 for indicator in indicators if indicator.lower() in name_context.lower())
-            if score > 0:
-                style_scores[style] = score
+        style_counts = Counter()
+        for style, indicators in self._style_indicator_sets:
+            hits = len(indicators & found_indicators)
+            if hits:
+                style_counts[style] = hits
         
-        if style_scores:
-            preferences['style'] = max(style_scores, key=style_scores.get)
-        
-        # Remove duplicates and limit
-        preferences['channels'] = list(set(preferences['channels']))[:3]
+        if style_counts:
+            preferences['style'] = style_counts.most_common(1)[0][0]
         
         return preferences
     
-    def _extract_name_context(self, name: str, content: str, window: int = 100) -> str:
-        """Extract context around a name mention"""
+    def _find_name_positions(self, name: str, content_lower: str,
+                             name_lower: Optional[str] = None) -> List[int]:
+        """Find every (possibly overlapping) position of a name in lowercased content"""
         
-        # Find all occurrences of the name
-        contexts = []
-        content_lower = content.lower()
-        name_lower = name.lower()
+        positions = []
+        if name_lower is None:
+            name_lower = name.lower()
         
         start = 0
         while True:
             pos = content_lower.find(name_lower, start)
             if pos == -1:
                 break
-            
-            # Extract window around the name
-            context_start = max(0, pos - window)
-            context_end = min(len(content), pos + len(name) + window)
-            context = content[context_start:context_end]
-            contexts.append(context)
-            
+            positions.append(pos)
             start = pos + 1
         
-        return ' '.join(contexts)
+        return positions
     
-    def _calculate_confidence_score(self, analysis: Dict) -> float:
-        """Calculate overall confidence score for stakeholder detection"""
+    def _extract_name_context(self, name: str, content: str, window: int = 100,
+                              positions: Optional[List[int]] = None) -> str:
+        """Extract context around a name mention"""
+        
+        # Find all occurrences of the name
+        if positions is None:
+            positions = self._find_name_positions(name, content.lower())
+        
+        # Extract window around each occurrence
+        return self._slice_windows(content, positions, len(name), (window,))[0]
+    
+    def _slice_windows(self, content: str, positions: List[int], name_length: int,
+                       windows: Tuple[int, ...]) -> Tuple[str, ...]:
+        """Join the context around every name position for each window width in one pass"""
+        
+        window_slices = [[] for _ in windows]
+        for pos in positions:
+            end = pos + name_length
+            for slices, window in zip(window_slices, windows):
+                slices.append(content[max(0, pos - window):end + window])
+        
+        return tuple(' '.join(slices) for slices in window_slices)
+    
+    def _calculate_confidence_score(self, analysis: Dict,
+                                    comm_score: Optional[float] = None) -> float:
+        """Calculate overall confidence score for stakeholder detection
+        
+        Passing comm_score overrides the communication component, e.g. 1.0 for an upper bound
+        """
         
         score = 0.0
         
@@ -407,11 +688,12 @@ class LocalStakeholderAI:
         score += importance_normalized * 0.3
         
         # Communication preferences contribute 20%
-        comm_score = 0.0
-        if analysis['communication_preferences']['channels']:
-            comm_score += 0.5
-        if analysis['communication_preferences']['style']:
-            comm_score += 0.5
+        if comm_score is None:
+            comm_score = 0.0
+            if analysis['communication_preferences']['channels']:
+                comm_score += 0.5
+            if analysis['communication_preferences']['style']:
+                comm_score += 0.5
         score += comm_score * 0.2
         
         # Context relevance contributes 10%
@@ -428,42 +710,78 @@ class LocalStakeholderAI:
         """Check if stakeholder already exists"""
         
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT stakeholder_key, display_name, role_title, strategic_importance,
-                           optimal_meeting_frequency, preferred_communication_channels,
-                           communication_style, most_effective_personas
-                    FROM stakeholder_profiles_enhanced
-                    WHERE stakeholder_key = ?
-                """, (stakeholder_key,))
-                
-                row = cursor.fetchone()
-                
-                if row:
-                    return {
-                        'stakeholder_key': row[0],
-                        'display_name': row[1],
-                        'role_title': row[2],
-                        'strategic_importance': row[3],
-                        'optimal_meeting_frequency': row[4],
-                        'preferred_communication_channels': json.loads(row[5]) if row[5] else [],
-                        'communication_style': row[6],
-                        'most_effective_personas': json.loads(row[7]) if row[7] else []
-                    }
-                
-                return None
-                
+            # Read-only lookup on the persistent connection; the prepared statement is cached
+            cursor = self.get_connection().execute(f"""
+                SELECT {PROFILE_LOOKUP_COLUMNS}
+                FROM stakeholder_profiles_enhanced
+                WHERE stakeholder_key = ?
+            """, (stakeholder_key,))
+            
+            row = cursor.fetchone()
+            
+            if row:
+                return self._profile_from_row(row)
+            
+            return None
+            
         except Exception as e:
             self.logger.error("Failed to check existing stakeholder", 
                             stakeholder_key=stakeholder_key, error=str(e))
             return None
     
-    def suggest_stakeholder_updates(self, stakeholder_key: str, new_analysis: Dict) -> List[Dict]:
+    def check_existing_stakeholders(self, stakeholder_keys: List[str]) -> Dict[str, Dict]:
+        """Fetch existing stakeholders for many keys, keyed by stakeholder_key"""
+        
+        keys = list(dict.fromkeys(stakeholder_keys))
+        existing = {}
+        
+        try:
+            conn = self.get_connection()
+            for batch_start in range(0, len(keys), EXISTING_LOOKUP_BATCH_SIZE):
+                batch = keys[batch_start:batch_start + EXISTING_LOOKUP_BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                cursor = conn.execute(f"""
+                    SELECT {PROFILE_LOOKUP_COLUMNS}
+                    FROM stakeholder_profiles_enhanced
+                    WHERE stakeholder_key IN ({placeholders})
+                """, batch)
+                
+                for row in cursor:
+                    existing[row['stakeholder_key']] = self._profile_from_row(row)
+            
+            return existing
+            
+        except Exception as e:
+            self.logger.error("Failed to check existing stakeholders", 
+                            stakeholder_count=len(keys), error=str(e))
+            return {}
+    
+    @staticmethod
+    def _profile_from_row(row: sqlite3.Row) -> Dict:
+        """Convert a stakeholder profile row into a profile dict"""
+        return {
+            'stakeholder_key': row['stakeholder_key'],
+            'display_name': row['display_name'],
+            'role_title': row['role_title'],
+            'strategic_importance': row['strategic_importance'],
+            'optimal_meeting_frequency': row['optimal_meeting_frequency'],
+            'preferred_communication_channels': (
+                _json_loads(row['preferred_communication_channels'])
+                if row['preferred_communication_channels'] else []
+            ),
+            'communication_style': row['communication_style'],
+            'most_effective_personas': (
+                _json_loads(row['most_effective_personas'])
+                if row['most_effective_personas'] else []
+            )
+        }
+    
+    def suggest_stakeholder_updates(self, stakeholder_key: str, new_analysis: Dict,
+                                    existing: Optional[Dict] = None) -> List[Dict]:
         """Suggest updates to existing stakeholder based on new analysis"""
         
-        existing = self.check_existing_stakeholder(stakeholder_key)
+        if existing is None:
+            existing = self.check_existing_stakeholder(stakeholder_key)
         if not existing:
             return []
         
@@ -538,7 +856,8 @@ def main():
         print("=" * 45)
         
         for candidate in candidates:
-            confidence_emoji = "🟢" if candidate['confidence_score'] >= 0.8 else "🟡" if candidate['confidence_score'] >= 0.6 else "🔴"
+            confidence_emoji = CONFIDENCE_EMOJIS[
+                bisect.bisect_right(CONFIDENCE_EMOJI_THRESHOLDS, candidate['confidence_score'])]
             
             print(f"{confidence_emoji} {candidate['name']} ({candidate['stakeholder_key']})")
             print(f"   Role: {candidate['detected_role']} (confidence: {candidate['role_confidence']:.1%})")
@@ -4,15 +4,118 @@ SuperClaude Meeting Intelligence System
 Automated meeting preparation tracking and strategic memory integration
 """
 
-import hashlib
 import json
 import os
 import re
 import sqlite3
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _json_dumps = json.dumps
+
+# Enhanced meeting-tracking schema, shipped alongside this module
+ENHANCED_SCHEMA_PATH = Path(__file__).parent / "enhanced_schema.sql"
+
+# Per-connection tuning; WAL persists in the database file once set
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Agenda items: lines starting with a number or bullet
+AGENDA_ITEM_RE = re.compile(r"^[\d\-\*]\s*(.+)$", re.MULTILINE)
+
+# Strategic themes: markdown headers
+HEADER_RE = re.compile(r"^#+\s*(.+)$", re.MULTILINE)
+
+# A bullet or header marker with nothing after it; its match continues onto the next
+# non-blank line, so such lines are matched together with what follows
+BARE_MARKER_RE = re.compile(r"(?:[\d\-\*]|#+)\s*")
+
+# Per-file limits on collected agenda items and themes, and the prep notes excerpt length
+AGENDA_ITEMS_PER_FILE = 10
+THEMES_PER_FILE = 5
+PREP_NOTES_LENGTH = 500
+
+# Directory name pattern -> primary stakeholder key in one alternation; group numbers
+# follow the original check order, which decides between several matches in a path
+STAKEHOLDER_RE = re.compile(
+    r"(?P<raghu_datta>raghu)"
+    r"|(?P<vp_engineering>vp[_-]?engineering)"
+    r"|(?P<vp_product>vp[_-]?product)"
+    r"|(?P<vp_design>vp[_-]?design)"
+    r"|(?P<design_director>design[_-]?director)"
+    r"|(?P<platform_lead>platform[_-]?lead)"
+)
+
+# Meeting session upsert; values are meeting_key followed by
+# MeetingIntelligenceManager._session_values
+UPSERT_SESSION_SQL = """
+    INSERT INTO meeting_sessions
+    (meeting_key, meeting_type, stakeholder_primary, stakeholder_secondary,
+     prep_file_path, agenda_items, preparation_notes, strategic_themes, persona_activated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(meeting_key) DO UPDATE SET
+        meeting_type = excluded.meeting_type,
+        stakeholder_primary = excluded.stakeholder_primary,
+        stakeholder_secondary = excluded.stakeholder_secondary,
+        prep_file_path = excluded.prep_file_path,
+        agenda_items = excluded.agenda_items,
+        preparation_notes = excluded.preparation_notes,
+        strategic_themes = excluded.strategic_themes,
+        persona_activated = excluded.persona_activated,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# Meeting type rules, checked in order: a rule matches when every substring of any
+# one of its alternatives appears in the lowercased path
+MEETING_TYPE_RULES = [
+    ((("vp", "1on1"),), "vp_1on1"),
+    ((("reports", "1on1"),), "1on1_reports"),
+    ((("slt",), ("leadership",)), "slt_review"),
+    ((("vendor",),), "vendor"),
+    ((("cross-team",), ("coordination",)), "cross_team"),
+]
+
+
+@lru_cache(maxsize=1024)
+def _generate_meeting_key_str(path_parts: str, date_str: str) -> str:
+    """Build the meeting key for a prep path (relative to meeting-prep) on a given day."""
+    # Create readable key
+    if "raghu" in path_parts:
+        return f"raghu-1on1-{date_str}"
+    elif "vp" in path_parts:
+        return f"vp-1on1-{date_str}"
+    elif "slt" in path_parts or "leadership" in path_parts:
+        return f"slt-review-{date_str}"
+    else:
+        # Only generic meeting directories need a hash; keep hashlib off the import path
+        import hashlib
+
+        path_hash = hashlib.blake2s(path_parts.encode(), digest_size=4).hexdigest()
+        return f"meeting-{path_hash}-{date_str}"
+
+
+@lru_cache(maxsize=1024)
+def _detect_meeting_type_str(path_str: str) -> str:
+    """Detect the meeting type of a lowercased prep path."""
+    for alternatives, meeting_type in MEETING_TYPE_RULES:
+        if any(all(part in path_str for part in parts) for parts in alternatives):
+            return meeting_type
+
+    return "strategic_planning"
+
 
 class MeetingIntelligenceManager:
     """Manages meeting preparation tracking and strategic memory integration."""
@@ -25,7 +128,8 @@ class MeetingIntelligenceManager:
 
     def ensure_enhanced_schema(self):
         """Apply enhanced schema for meeting tracking."""
-        enhanced_schema_path = Path("memory/enhanced_schema.sql")
+        # Resolved next to this module so the schema loads whatever the working directory
+        enhanced_schema_path = ENHANCED_SCHEMA_PATH
         if not enhanced_schema_path.exists():
             print("Enhanced schema not found - using basic schema")
             return
@@ -34,16 +138,27 @@ class MeetingIntelligenceManager:
             with open(enhanced_schema_path, "r") as f:
                 schema_sql = f.read()
 
-            with sqlite3.connect(self.db_path) as conn:
-                # Split and execute each statement
-                statements = [stmt.strip() for stmt in schema_sql.split(";") if stmt.strip()]
+            with self._connect() as conn:
+                # Split and execute each statement, dropping the comment lines that precede
+                # it so commented statements (tables, indexes) are not skipped
+                statements = []
+                for chunk in schema_sql.split(";"):
+                    lines = [
+                        line for line in chunk.splitlines() if not line.lstrip().startswith("--")
+                    ]
+                    statements.append("\n".join(lines).strip())
+
                 for statement in statements:
-                    if statement and not statement.startswith("--"):
+                    if statement:
                         try:
                             conn.execute(statement)
                         except sqlite3.OperationalError as e:
                             if "already exists" not in str(e).lower():
                                 print(f"Schema warning: {e}")
+                        except sqlite3.IntegrityError as e:
+                            # Only the default rows seeded by an earlier run are expected
+                            if not statement.upper().startswith("INSERT"):
+                                print(f"Schema warning: {e}")
 
                 conn.commit()
                 print("✅ Enhanced meeting tracking schema applied")
@@ -51,18 +166,30 @@ class MeetingIntelligenceManager:
         except Exception as e:
             print(f"Schema application error: {e}")
 
-    def parse_meeting_prep_directory(self, dir_path: Path) -> Dict[str, Any]:
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """Open a database connection with CONNECTION_PRAGMAS applied."""
+        conn = sqlite3.connect(self.db_path, **kwargs)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def parse_meeting_prep_directory(
+        self, dir_path: Path, date_str: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Parse a meeting prep directory and extract strategic intelligence."""
+        # Every path-based detector works on the same lowercased path
+        path_str = str(dir_path).lower()
+        meeting_type = self._detect_meeting_type(dir_path, path_str)
         meeting_data = {
-            "meeting_key": self._generate_meeting_key(dir_path),
-            "meeting_type": self._detect_meeting_type(dir_path),
-            "stakeholder_primary": self._extract_primary_stakeholder(dir_path),
+            "meeting_key": self._generate_meeting_key(dir_path, path_str, date_str),
+            "meeting_type": meeting_type,
+            "stakeholder_primary": self._extract_primary_stakeholder(dir_path, path_str),
             "stakeholder_secondary": self._extract_secondary_stakeholders(dir_path),
             "prep_file_path": str(dir_path),
             "agenda_items": [],
             "preparation_notes": "",
             "strategic_themes": [],
-            "persona_activated": self._suggest_personas(dir_path),
+            "persona_activated": self._suggest_personas(dir_path, meeting_type),
         }
 
         # Analyze content of files in the directory
@@ -71,59 +198,43 @@ class MeetingIntelligenceManager:
 
         return meeting_data
 
-    def _generate_meeting_key(self, dir_path: Path) -> str:
+    def _generate_meeting_key(
+        self, dir_path: Path, path_str: Optional[str] = None, date_str: Optional[str] = None
+    ) -> str:
         """Generate unique meeting key from path and current date."""
+        if path_str is None:
+            path_str = str(dir_path).lower()
+        if date_str is None:
+            date_str = date.today().strftime("%Y-%m-%d")
+
         # Extract meaningful parts of the path
-        path_parts = str(dir_path).lower().replace("workspace/meeting-prep/", "")
-        path_hash = hashlib.md5(path_parts.encode()).hexdigest()[:8]
-        date_str = date.today().strftime("%Y-%m-%d")
-
-        # Create readable key
-        if "raghu" in path_parts:
-            return f"raghu-1on1-{date_str}"
-        elif "vp" in path_parts:
-            return f"vp-1on1-{date_str}"
-        elif "slt" in path_parts or "leadership" in path_parts:
-            return f"slt-review-{date_str}"
-        else:
-            return f"meeting-{path_hash}-{date_str}"
-
-    def _detect_meeting_type(self, dir_path: Path) -> str:
+        path_parts = path_str.replace("workspace/meeting-prep/", "")
+        return _generate_meeting_key_str(path_parts, date_str)
+
+    def _detect_meeting_type(self, dir_path: Path, path_str: Optional[str] = None) -> str:
         """Detect meeting type from directory path and structure."""
-        path_str = str(dir_path).lower()
+        if path_str is None:
+            path_str = str(dir_path).lower()
 
-        if "vp" in path_str and "1on1" in path_str:
-            return "vp_1on1"
-        elif "reports" in path_str and "1on1" in path_str:
-            return "1on1_reports"
-        elif "slt" in path_str or "leadership" in path_str:
-            return "slt_review"
-        elif "vendor" in path_str:
-            return "vendor"
-        elif "cross-team" in path_str or "coordination" in path_str:
-            return "cross_team"
-        else:
-            return "strategic_planning"
-
-    def _extract_primary_stakeholder(self, dir_path: Path) -> Optional[str]:
-        """Extract primary stakeholder from directory name and content."""
-        path_str = str(dir_path).lower()
+        return _detect_meeting_type_str(path_str)
 
-        # Common stakeholder patterns
-        stakeholder_patterns = {
-            r"raghu": "raghu_datta",
-            r"vp[_-]?engineering": "vp_engineering",
-            r"vp[_-]?product": "vp_product",
-            r"vp[_-]?design": "vp_design",
-            r"design[_-]?director": "design_director",
-            r"platform[_-]?lead": "platform_lead",
-        }
+    def _extract_primary_stakeholder(
+        self, dir_path: Path, path_str: Optional[str] = None
+    ) -> Optional[str]:
+        """Extract primary stakeholder from directory name and content."""
+        if path_str is None:
+            path_str = str(dir_path).lower()
 
-        for pattern, stakeholder_key in stakeholder_patterns.items():
-            if re.search(pattern, path_str):
-                return stakeholder_key
+        # Common stakeholder patterns: one pass over the path, where the earliest listed
+        # pattern wins rather than the leftmost match
+        best = None
+        for match in STAKEHOLDER_RE.finditer(path_str):
+            if best is None or match.lastindex < best.lastindex:
+                best = match
+                if best.lastindex == 1:
+                    break
 
-        return None
+        return best.lastgroup if best else None
 
     def _extract_secondary_stakeholders(self, dir_path: Path) -> List[str]:
         """Extract additional stakeholders from content analysis."""
@@ -131,9 +242,10 @@ class MeetingIntelligenceManager:
         # For now, return empty list - can be enhanced with NLP
         return []
 
-    def _suggest_personas(self, dir_path: Path) -> List[str]:
+    def _suggest_personas(self, dir_path: Path, meeting_type: Optional[str] = None) -> List[str]:
         """Suggest SuperClaude personas based on meeting type and context."""
-        meeting_type = self._detect_meeting_type(dir_path)
+        if meeting_type is None:
+            meeting_type = self._detect_meeting_type(dir_path)
 
         persona_mapping = {
             "vp_1on1": ["camille", "alvaro", "diego"],
@@ -158,96 +270,126 @@ class MeetingIntelligenceManager:
         if not dir_path.exists():
             return analysis
 
-        # Analyze markdown files for content
-        md_files = list(dir_path.glob("*.md"))
-        for md_file in md_files:
-            try:
-                with open(md_file, "r", encoding="utf-8") as f:
-                    content = f.read()
+        # Analyze markdown files for content; scandir entries answer is_file() without
+        # another stat for regular files
+        md_count = 0
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if not (entry.name.endswith(".md") and entry.is_file()):
+                    continue
+                md_count += 1
 
-                # Extract agenda items (lines starting with numbers or bullets)
-                agenda_items = re.findall(r"^[\d\-\*]\s*(.+)$", content, re.MULTILINE)
-                analysis["agenda_items"].extend(agenda_items[:10])  # Limit to 10 items
+                try:
+                    is_prep = "prep" in entry.name.lower()
+                    agenda_items, themes, prep_notes = self._scan_markdown_file(entry.path, is_prep)
 
-                # Extract strategic themes (headers and key phrases)
-                themes = re.findall(r"^#+\s*(.+)$", content, re.MULTILINE)
-                analysis["strategic_themes"].extend(themes[:5])  # Limit to 5 themes
+                    # Agenda items (lines starting with numbers or bullets) and strategic
+                    # themes (headers), limited per file
+                    analysis["agenda_items"].extend(agenda_items)
+                    analysis["strategic_themes"].extend(themes)
 
-                # Build preparation notes summary
-                if "prep" in md_file.name.lower():
-                    analysis["preparation_notes"] = (
-                        content[:500] + "..." if len(content) > 500 else content
-                    )
+                    # Build preparation notes summary
+                    if is_prep:
+                        analysis["preparation_notes"] = prep_notes
 
-            except Exception as e:
-                print(f"Error analyzing {md_file}: {e}")
+                except Exception as e:
+                    print(f"Error analyzing {entry.path}: {e}")
 
         # Generate content summary
         analysis["content_summary"] = (
-            f"Meeting prep with {len(md_files)} documents, "
+            f"Meeting prep with {md_count} documents, "
             f"{len(analysis['agenda_items'])} agenda items, "
             f"{len(analysis['strategic_themes'])} strategic themes"
         )
 
         return analysis
 
-    def store_meeting_session(self, meeting_data: Dict[str, Any]) -> int:
-        """Store meeting session in strategic memory database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Check if meeting session already exists
-            cursor.execute(
-                "SELECT id FROM meeting_sessions WHERE meeting_key = ?",
-                (meeting_data["meeting_key"],),
-            )
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update existing session
-                cursor.execute(
-                    """
-                    UPDATE meeting_sessions
-                    SET meeting_type = ?, stakeholder_primary = ?, stakeholder_secondary = ?,
-                        prep_file_path = ?, agenda_items = ?, preparation_notes = ?,
-                        strategic_themes = ?, persona_activated = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE meeting_key = ?
-                """,
-                    (
-                        meeting_data["meeting_type"],
-                        meeting_data["stakeholder_primary"],
-                        json.dumps(meeting_data["stakeholder_secondary"]),
-                        meeting_data["prep_file_path"],
-                        json.dumps(meeting_data["agenda_items"]),
-                        meeting_data["preparation_notes"],
-                        json.dumps(meeting_data["strategic_themes"]),
-                        json.dumps(meeting_data["persona_activated"]),
-                        meeting_data["meeting_key"],
-                    ),
+    def _scan_markdown_file(
+        self, md_path: str, want_prep_notes: bool
+    ) -> Tuple[List[str], List[str], Optional[str]]:
+        """Collect agenda items, themes and a prep notes excerpt, stopping once all are full."""
+        agenda_items = []
+        themes = []
+        prefix_parts = []
+        prefix_size = 0
+        pending = []
+
+        def collect(chunk: str) -> None:
+            if len(agenda_items) < AGENDA_ITEMS_PER_FILE:
+                agenda_items.extend(
+                    AGENDA_ITEM_RE.findall(chunk)[: AGENDA_ITEMS_PER_FILE - len(agenda_items)]
                 )
-                return existing[0]
+            if len(themes) < THEMES_PER_FILE:
+                themes.extend(HEADER_RE.findall(chunk)[: THEMES_PER_FILE - len(themes)])
+
+        with open(md_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if want_prep_notes and prefix_size <= PREP_NOTES_LENGTH:
+                    prefix_parts.append(line)
+                    prefix_size += len(line)
+
+                # Hold bare markers and the blank lines after them until the line they
+                # continue onto arrives
+                if BARE_MARKER_RE.fullmatch(line) or (pending and line.isspace()):
+                    pending.append(line)
+                    continue
+
+                if pending:
+                    pending.append(line)
+                    collect("".join(pending))
+                    pending = []
+                else:
+                    collect(line)
+
+                if (
+                    len(agenda_items) >= AGENDA_ITEMS_PER_FILE
+                    and len(themes) >= THEMES_PER_FILE
+                    and (not want_prep_notes or prefix_size > PREP_NOTES_LENGTH)
+                ):
+                    break
             else:
-                # Insert new session
-                cursor.execute(
-                    """
-                    INSERT INTO meeting_sessions
-                    (meeting_key, meeting_type, stakeholder_primary, stakeholder_secondary,
-                     prep_file_path, agenda_items, preparation_notes, strategic_themes, persona_activated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        meeting_data["meeting_key"],
-                        meeting_data["meeting_type"],
-                        meeting_data["stakeholder_primary"],
-                        json.dumps(meeting_data["stakeholder_secondary"]),
-                        meeting_data["prep_file_path"],
-                        json.dumps(meeting_data["agenda_items"]),
-                        meeting_data["preparation_notes"],
-                        json.dumps(meeting_data["strategic_themes"]),
-                        json.dumps(meeting_data["persona_activated"]),
-                    ),
-                )
-                return cursor.lastrowid
+                if pending:
+                    collect("".join(pending))
+
+        prep_notes = None
+        if want_prep_notes:
+            prefix = "".join(prefix_parts)
+            prep_notes = (
+                prefix[:PREP_NOTES_LENGTH] + "..." if prefix_size > PREP_NOTES_LENGTH else prefix
+            )
+
+        return agenda_items, themes, prep_notes
+
+    def store_meeting_session(
+        self, meeting_data: Dict[str, Any], conn: Optional[sqlite3.Connection] = None
+    ) -> int:
+        """Store meeting session in strategic memory database."""
+        # Insert or update in one statement, returning the session id either way. A
+        # caller-supplied connection is reused and its transaction left to the caller
+        values = (meeting_data["meeting_key"],) + self._session_values(meeting_data)
+        if conn is not None:
+            return conn.execute(UPSERT_SESSION_SQL + " RETURNING id", values).fetchone()[0]
+
+        conn = self._connect()
+        try:
+            with conn:
+                return conn.execute(UPSERT_SESSION_SQL + " RETURNING id", values).fetchone()[0]
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _session_values(meeting_data: Dict[str, Any]) -> Tuple:
+        """Session column values shared by inserts and updates, after meeting_key."""
+        return (
+            meeting_data["meeting_type"],
+            meeting_data["stakeholder_primary"],
+            _json_dumps(meeting_data["stakeholder_secondary"]),
+            meeting_data["prep_file_path"],
+            _json_dumps(meeting_data["agenda_items"]),
+            meeting_data["preparation_notes"],
+            _json_dumps(meeting_data["strategic_themes"]),
+            _json_dumps(meeting_data["persona_activated"]),
+        )
 
     def scan_and_process_meeting_prep(self) -> Dict[str, Any]:
         """Scan meeting-prep directory and process all meetings."""
@@ -257,45 +399,97 @@ class MeetingIntelligenceManager:
             results["errors"].append(f"Meeting prep directory not found: {self.meeting_prep_root}")
             return results
 
-        # Process each subdirectory as a potential meeting
-        for item in self.meeting_prep_root.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
+        # One connection and one transaction for the whole scan
+        conn = self._connect(isolation_level=None)
+        try:
+            # Session ids by key, loaded once; upserts keep the id of an existing row
+            try:
+                meeting_ids = dict(conn.execute("SELECT meeting_key, id FROM meeting_sessions"))
+            except sqlite3.Error as e:
+                results["errors"].append(f"Error reading meeting sessions: {e}")
+                return results
+
+            # Each visible subdirectory is a potential meeting; scandir entries carry their
+            # type, so no extra stat per entry
+            with os.scandir(self.meeting_prep_root) as entries:
+                meeting_dirs = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                ]
+
+            # Process each meeting directory, batching the writes; every key uses the
+            # date the scan started
+            date_str = date.today().strftime("%Y-%m-%d")
+            known_keys = set(meeting_ids)
+            pending = []
+            rows = []
+            for item in meeting_dirs:
                 try:
-                    meeting_data = self.parse_meeting_prep_directory(item)
+                    meeting_data = self.parse_meeting_prep_directory(item, date_str)
+                    meeting_key = meeting_data["meeting_key"]
 
-                    # Check if this is a new meeting
-                    with sqlite3.connect(self.db_path) as conn:
-                        cursor = conn.cursor()
-                        cursor.execute(
-                            "SELECT id FROM meeting_sessions WHERE meeting_key = ?",
-                            (meeting_data["meeting_key"],),
-                        )
-                        exists = cursor.fetchone()
+                    # A key seen earlier in this scan is an update of the row it inserted
+                    exists = meeting_key in known_keys
+                    known_keys.add(meeting_key)
+                    rows.append((meeting_key,) + self._session_values(meeting_data))
 
-                    meeting_id = self.store_meeting_session(meeting_data)
+                    pending.append((item, meeting_data, exists))
 
-                    if exists:
-                        results["updated_meetings"] += 1
-                    else:
-                        results["new_meetings"] += 1
-
-                    results["processed"] += 1
+                except Exception as e:
+                    error_msg = f"Error processing {item.name}: {e}"
+                    results["errors"].append(error_msg)
+                    print(f"❌ {error_msg}")
 
-                    print(
-                        f"✅ Processed meeting: {meeting_data['meeting_key']} "
-                        f"({meeting_data['meeting_type']}) -> ID {meeting_id}"
-                    )
+            if not pending:
+                return results
 
-                except Exception as e:
+            # Upserts run in scan order, so a key shared by two directories keeps the later one
+            try:
+                conn.execute("BEGIN")
+                conn.executemany(UPSERT_SESSION_SQL, rows)
+                conn.execute("COMMIT")
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                for item, _, _ in pending:
                     error_msg = f"Error processing {item.name}: {e}"
                     results["errors"].append(error_msg)
                     print(f"❌ {error_msg}")
+                return results
+
+            # Only rows inserted by this scan need their ids read back
+            new_keys = list(known_keys.difference(meeting_ids))
+            if new_keys:
+                placeholders = ",".join("?" * len(new_keys))
+                meeting_ids.update(
+                    conn.execute(
+                        "SELECT meeting_key, id FROM meeting_sessions "
+                        f"WHERE meeting_key IN ({placeholders})",
+                        new_keys,
+                    )
+                )
+        finally:
+            conn.close()
+
+        for item, meeting_data, exists in pending:
+            if exists:
+                results["updated_meetings"] += 1
+            else:
+                results["new_meetings"] += 1
+
+            results["processed"] += 1
+
+            print(
+                f"✅ Processed meeting: {meeting_data['meeting_key']} "
+                f"({meeting_data['meeting_type']}) -> ID {meeting_ids[meeting_data['meeting_key']]}"
+            )
 
         return results
 
     def get_meeting_intelligence_summary(self) -> Dict[str, Any]:
         """Get summary of all meeting intelligence in the system."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -11,6 +11,15 @@ import sqlite3
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
+# Tables reported by get_database_status, in display order
+STATUS_TABLES = (
+    "executive_sessions",
+    "strategic_initiatives",
+    "stakeholder_profiles",
+    "platform_intelligence",
+    "budget_intelligence",
+)
+
 
 class StrategicMemoryManager:
     """Manages strategic memory database operations for SuperClaude framework"""
@@ -279,24 +288,28 @@ class StrategicMemoryManager:
 
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Get table counts
-                tables = [
-                    "executive_sessions",
-                    "strategic_initiatives",
-                    "stakeholder_profiles",
-                    "platform_intelligence",
-                    "budget_intelligence",
-                ]
-
-                for table in tables:
-                    try:
-                        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                        count = cursor.fetchone()[0]
-                        status["tables"][table] = count
-                    except sqlite3.OperationalError:
-                        status["tables"][table] = "Table not found"
+                placeholders = ",".join("?" * len(STATUS_TABLES))
+                existing = {
+                    name
+                    for (name,) in conn.execute(
+                        "SELECT name FROM sqlite_master "
+                        f"WHERE type = 'table' AND name IN ({placeholders})",
+                        STATUS_TABLES,
+                    )
+                }
+
+                # Get table counts for every existing table in one statement
+                counts = {}
+                if existing:
+                    query = " UNION ALL ".join(
+                        f"SELECT '{table}', COUNT(*) FROM {table}"
+                        for table in STATUS_TABLES
+                        if table in existing
+                    )
+                    counts = dict(conn.execute(query))
+
+                for table in STATUS_TABLES:
+                    status["tables"][table] = counts.get(table, "Table not found")
 
                 status["status"] = "operational"
         except Exception as e:
@@ -5,16 +5,251 @@ Intelligent recommendation engine for strategic relationship management
 """
 
 import json
+import logging
 import sqlite3
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import structlog
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 logger = structlog.get_logger()
 
+# Per-connection tuning; WAL persists in the database file once set
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Composite indexes for the engine's lookups and sorts, by name. The schema creates them on
+# new databases; older databases get them when the engine first connects
+ENGAGEMENT_INDEXES = {
+    "idx_eng_stk_date": "CREATE INDEX IF NOT EXISTS idx_eng_stk_date "
+    "ON stakeholder_engagements(stakeholder_key, engagement_date DESC)",
+    "idx_rec_pending": "CREATE INDEX IF NOT EXISTS idx_rec_pending "
+    "ON engagement_recommendations(recommendation_status, stakeholder_key, expires_at)",
+    "idx_rec_pending_live": "CREATE INDEX IF NOT EXISTS idx_rec_pending_live "
+    "ON engagement_recommendations(urgency_level DESC, confidence_score DESC, created_at ASC, "
+    "stakeholder_key) WHERE recommendation_status = 'pending'",
+    "idx_spi_active": "CREATE INDEX IF NOT EXISTS idx_spi_active "
+    "ON stakeholder_project_interests(stakeholder_key, active)",
+    "idx_prof_key": "CREATE INDEX IF NOT EXISTS idx_prof_key "
+    "ON stakeholder_profiles_enhanced(stakeholder_key, display_name)",
+}
+
+# Recompute of a profile's last_engagement_date from its engagements, shared by the triggers
+# below and the backfill of databases that predate the column
+LAST_ENGAGEMENT_UPDATE_SQL = """
+    UPDATE stakeholder_profiles_enhanced
+    SET last_engagement_date = (
+        SELECT MAX(e.engagement_date)
+        FROM stakeholder_engagements e
+        WHERE e.stakeholder_key = stakeholder_profiles_enhanced.stakeholder_key
+    )
+"""
+
+# Triggers keeping stakeholder_profiles_enhanced.last_engagement_date at the latest engagement
+LAST_ENGAGEMENT_TRIGGERS = {
+    "trg_eng_last_insert": "CREATE TRIGGER IF NOT EXISTS trg_eng_last_insert "
+    "AFTER INSERT ON stakeholder_engagements BEGIN"
+    + LAST_ENGAGEMENT_UPDATE_SQL
+    + "    WHERE stakeholder_key = NEW.stakeholder_key; END",
+    "trg_eng_last_update": "CREATE TRIGGER IF NOT EXISTS trg_eng_last_update "
+    "AFTER UPDATE OF stakeholder_key, engagement_date ON stakeholder_engagements BEGIN"
+    + LAST_ENGAGEMENT_UPDATE_SQL
+    + "    WHERE stakeholder_key IN (OLD.stakeholder_key, NEW.stakeholder_key); END",
+    "trg_eng_last_delete": "CREATE TRIGGER IF NOT EXISTS trg_eng_last_delete "
+    "AFTER DELETE ON stakeholder_engagements BEGIN"
+    + LAST_ENGAGEMENT_UPDATE_SQL
+    + "    WHERE stakeholder_key = OLD.stakeholder_key; END",
+    "trg_profile_last_insert": "CREATE TRIGGER IF NOT EXISTS trg_profile_last_insert "
+    "AFTER INSERT ON stakeholder_profiles_enhanced BEGIN"
+    + LAST_ENGAGEMENT_UPDATE_SQL
+    + "    WHERE id = NEW.id; END",
+}
+
+# Indexes superseded by ENGAGEMENT_INDEXES, dropped from databases that still carry them
+RETIRED_INDEXES = ("idx_rec_sort",)
+
+# Days without contact before a check-in is overdue, by optimal meeting frequency, then the
+# threshold for any other frequency
+FREQUENCY_THRESHOLDS = {
+    "weekly": 10,  # Allow some buffer
+    "biweekly": 18,
+    "monthly": 35,
+    "quarterly": 100,
+    "as_needed": 180,  # Flag if no contact for 6 months
+}
+DEFAULT_FREQUENCY_THRESHOLD = 60
+
+# Urgency of an overdue check-in by strategic importance: (ratio, urgency) steps checked in
+# order against days-since over threshold, then the urgency when no step is exceeded
+URGENCY_STEPS = {
+    "critical": (((2.0, "urgent"), (1.5, "high")), "medium"),
+    "high": (((2.5, "urgent"), (2.0, "high")), "medium"),
+}
+DEFAULT_URGENCY_STEPS = (((3.0, "high"), (2.0, "medium")), "low")
+
+# Marker shown next to each urgency level in CLI listings
+URGENCY_EMOJI = {"urgent": "🔴", "high": "🟡", "medium": "🟢", "low": "🔵"}
+
+# Room for every statement the engine and its callers issue on the shared connection
+CACHED_STATEMENTS = 512
+
+# Every stakeholder with their trigger-maintained latest engagement date, followed by the
+# communication preferences used to suggest an engagement approach
+STAKEHOLDER_STATE_SQL = """
+    SELECT s.stakeholder_key, s.display_name, s.strategic_importance,
+           s.optimal_meeting_frequency,
+           s.last_engagement_date,
+           s.preferred_communication_channels, s.communication_style,
+           s.most_effective_personas
+    FROM stakeholder_profiles_enhanced s
+"""
+
+# Active project interests of all stakeholders
+PROJECT_INTERESTS_SQL = """
+    SELECT stakeholder_key, project_initiative_key, interest_level, update_frequency_needed
+    FROM stakeholder_project_interests
+    WHERE active = 1
+"""
+
+# Restriction of the two queries above to the stakeholder keys in a bound JSON array
+SCOPED_STAKEHOLDER_STATE_SQL = (
+    STAKEHOLDER_STATE_SQL + "    WHERE s.stakeholder_key IN (SELECT value FROM json_each(?))\n"
+)
+SCOPED_PROJECT_INTERESTS_SQL = (
+    PROJECT_INTERESTS_SQL + "    AND stakeholder_key IN (SELECT value FROM json_each(?))\n"
+)
+
+# A stakeholder's profile, five most recent engagements and pending recommendations as one
+# JSON document; JSON columns are embedded decoded, with NULL or empty text as []. Each
+# part is wrapped in json() so nested documents stay JSON through the subqueries
+STAKEHOLDER_SUMMARY_SQL = """
+    SELECT json_object(
+        'profile', json((
+            SELECT json_object(
+                'display_name', display_name,
+                'role_title', role_title,
+                'organization', organization,
+                'strategic_importance', strategic_importance,
+                'preferred_channels',
+                COALESCE(json(NULLIF(preferred_communication_channels, '')), json_array()),
+                'effective_personas',
+                COALESCE(json(NULLIF(most_effective_personas, '')), json_array())
+            )
+            FROM stakeholder_profiles_enhanced
+            WHERE stakeholder_key = ?
+        )),
+        'recent_engagements', json((
+            SELECT json_group_array(json_object(
+                'date', engagement_date,
+                'type', engagement_type,
+                'quality', engagement_quality,
+                'topics', COALESCE(json(NULLIF(topics_discussed, '')), json_array())
+            ))
+            FROM (
+                SELECT engagement_date, engagement_type, engagement_quality, topics_discussed
+                FROM stakeholder_engagements
+                WHERE stakeholder_key = ?
+                ORDER BY engagement_date DESC
+                LIMIT 5
+            )
+        )),
+        'pending_recommendations', json((
+            SELECT json_group_array(json_object(
+                'type', recommendation_type,
+                'urgency', urgency_level,
+                'reason', trigger_reason,
+                'approach', suggested_approach
+            ))
+            FROM (
+                SELECT recommendation_type, urgency_level, trigger_reason, suggested_approach
+                FROM engagement_recommendations
+                WHERE stakeholder_key = ?
+                AND recommendation_status = 'pending'
+                ORDER BY urgency_level DESC
+            )
+        ))
+    )
+"""
+
+# Stakeholder profile upsert keyed on the unique stakeholder_key
+UPSERT_STAKEHOLDER_SQL = """
+    INSERT INTO stakeholder_profiles_enhanced
+    (stakeholder_key, display_name, role_title, organization, strategic_importance)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(stakeholder_key) DO UPDATE SET
+        display_name = excluded.display_name,
+        role_title = excluded.role_title,
+        organization = excluded.organization,
+        strategic_importance = excluded.strategic_importance,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# Recommendation insert, one row per generated recommendation
+INSERT_RECOMMENDATION_SQL = """
+    INSERT INTO engagement_recommendations
+    (stakeholder_key, recommendation_type, urgency_level, trigger_reason, suggested_approach,
+     confidence_score, strategic_context, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Dead recommendations: pending ones past expiry, which reads already skip, and completed ones
+# beyond the 30-day retention window
+PURGE_RECOMMENDATIONS_SQL = """
+    DELETE FROM engagement_recommendations
+    WHERE (recommendation_status = 'pending' AND expires_at <= CURRENT_TIMESTAMP)
+    OR (recommendation_status = 'completed' AND completed_date < date('now', '-30 days'))
+"""
+
+# Minimum interval between purges run by one engine
+PURGE_INTERVAL_SECONDS = 3600
+
+# Live pending recommendations; the urgency filter is bound twice and NULL disables it,
+# so filtered and unfiltered reads share one prepared statement
+PENDING_RECOMMENDATIONS_SQL = """
+    SELECT r.stakeholder_key, s.display_name, r.recommendation_type,
+           r.urgency_level, r.trigger_reason, r.suggested_approach,
+           r.confidence_score, r.created_at
+    FROM engagement_recommendations r
+    JOIN stakeholder_profiles_enhanced s ON r.stakeholder_key = s.stakeholder_key
+    WHERE r.recommendation_status = 'pending'
+    AND (r.expires_at IS NULL OR r.expires_at > CURRENT_TIMESTAMP)
+    AND (? IS NULL OR r.urgency_level = ?)
+    ORDER BY r.urgency_level DESC, r.confidence_score DESC, r.created_at ASC
+"""
+
+
+@lru_cache(maxsize=4096)
+def _parse_engagement_date(value: str) -> date:
+    """Parse a stored engagement date; engagements cluster on few dates, so each is parsed once"""
+    # ISO dates take the C parser; anything else still goes through strptime
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+
 
 class StakeholderEngagementEngine:
     """Intelligent stakeholder engagement management and recommendation system"""
@@ -28,10 +263,101 @@ class StakeholderEngagementEngine:
             self.db_path = Path(__file__).parent / "strategic_memory.db"
 
         self.logger = logger.bind(component="stakeholder_engagement")
+        # Resolved once so per-operation info events cost nothing when INFO is filtered out
+        is_enabled_for = getattr(self.logger, "is_enabled_for", None)
+        self._info_enabled = is_enabled_for is None or is_enabled_for(logging.INFO)
+        # One connection per thread; detectors call in from watchdog threads
+        self._local = threading.local()
+        # Stakeholders engaged or edited since their recommendations were last generated
+        self.dirty_stakeholders = set()
+        self._last_purge = None
 
     def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's database connection, opening it on first use"""
+        # Kept for the life of the thread; `with` blocks commit or roll back but do not close it
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=CACHED_STATEMENTS)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            # Rows index by position as before and by column name for dict(row)
+            conn.row_factory = sqlite3.Row
+            self._ensure_indexes(conn)
+            self._ensure_last_engagement_date(conn)
+            self._local.connection = conn
+        return conn
+
+    def _ensure_indexes(self, conn: sqlite3.Connection):
+        """Create any ENGAGEMENT_INDEXES missing from the database"""
+        existing = {
+            name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+
+        created = False
+        for name in RETIRED_INDEXES:
+            if name in existing:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+        for name, statement in ENGAGEMENT_INDEXES.items():
+            if name in existing:
+                continue
+            try:
+                conn.execute(statement)
+                created = True
+            except sqlite3.OperationalError:
+                # Table not there yet; the schema creates the index along with it
+                pass
+
+        # Refresh planner statistics so the new indexes are picked up
+        if created:
+            conn.execute("ANALYZE")
+
+    def _ensure_last_engagement_date(self, conn: sqlite3.Connection):
+        """Add, backfill and maintain last_engagement_date on databases that predate it"""
+        existing = {
+            name
+            for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        }
+        if existing.issuperset(LAST_ENGAGEMENT_TRIGGERS):
+            return
+
+        try:
+            columns = {
+                row[1] for row in conn.execute("PRAGMA table_info(stakeholder_profiles_enhanced)")
+            }
+            if "last_engagement_date" not in columns:
+                conn.execute(
+                    "ALTER TABLE stakeholder_profiles_enhanced ADD COLUMN last_engagement_date DATE"
+                )
+
+            for name, statement in LAST_ENGAGEMENT_TRIGGERS.items():
+                if name not in existing:
+                    conn.execute(statement)
+
+            conn.execute(LAST_ENGAGEMENT_UPDATE_SQL)
+            conn.commit()
+        except sqlite3.OperationalError:
+            # Tables not there yet; the schema creates the column and triggers along with them
+            conn.rollback()
+
+    def _purge_stale_recommendations(self, conn: sqlite3.Connection):
+        """Delete dead recommendations, at most once per PURGE_INTERVAL_SECONDS"""
+        now = time.monotonic()
+        if self._last_purge is not None and now - self._last_purge < PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+
+        deleted = conn.execute(PURGE_RECOMMENDATIONS_SQL).rowcount
+        # Only incremental auto-vacuum (mode 2) returns freed pages without a full VACUUM
+        if deleted and conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            conn.execute("PRAGMA incremental_vacuum")
+
+    def close(self):
+        """Close this thread's database connection"""
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
 
     def apply_engagement_schema(self):
         """Apply the stakeholder engagement schema to the database"""
@@ -63,54 +389,16 @@ class StakeholderEngagementEngine:
 
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Check if stakeholder exists
-                cursor.execute(
-                    "SELECT id FROM stakeholder_profiles_enhanced WHERE stakeholder_key = ?",
-                    (stakeholder_key,),
+                conn.execute(
+                    UPSERT_STAKEHOLDER_SQL,
+                    (stakeholder_key, display_name, role_title, organization, strategic_importance),
                 )
-                existing = cursor.fetchone()
-
-                if existing:
-                    # Update existing stakeholder
-                    cursor.execute(
-                        """
-                        UPDATE stakeholder_profiles_enhanced
-                        SET display_name = ?, role_title = ?, organization = ?,
-                            strategic_importance = ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE stakeholder_key = ?
-                    """,
-                        (
-                            display_name,
-                            role_title,
-                            organization,
-                            strategic_importance,
-                            stakeholder_key,
-                        ),
-                    )
 
-                    self.logger.info("Updated stakeholder profile", stakeholder=stakeholder_key)
-                else:
-                    # Insert new stakeholder
-                    cursor.execute(
-                        """
-                        INSERT INTO stakeholder_profiles_enhanced
-                        (stakeholder_key, display_name, role_title, organization, strategic_importance)
-                        VALUES (?, ?, ?, ?, ?)
-                    """,
-                        (
-                            stakeholder_key,
-                            display_name,
-                            role_title,
-                            organization,
-                            strategic_importance,
-                        ),
-                    )
-
-                    self.logger.info("Created new stakeholder profile", stakeholder=stakeholder_key)
+                if self._info_enabled:
+                    self.logger.info("Saved stakeholder profile", stakeholder=stakeholder_key)
 
-                return True
+            self.dirty_stakeholders.add(stakeholder_key)
+            return True
 
         except Exception as e:
             self.logger.error(
@@ -149,22 +437,25 @@ class StakeholderEngagementEngine:
                         engagement_type,
                         engagement_date,
                         engagement_quality,
-                        json.dumps(topics_discussed) if topics_discussed else None,
-                        json.dumps(action_items) if action_items else None,
+                        _json_dumps(topics_discussed) if topics_discussed else None,
+                        _json_dumps(action_items) if action_items else None,
                     ),
                 )
 
-                self.logger.info(
-                    "Recorded engagement",
-                    stakeholder=stakeholder_key,
-                    type=engagement_type,
-                    quality=engagement_quality,
-                )
+                if self._info_enabled:
+                    self.logger.info(
+                        "Recorded engagement",
+                        stakeholder=stakeholder_key,
+                        type=engagement_type,
+                        quality=engagement_quality,
+                    )
 
-                # Trigger recommendation update
-                self._update_recommendations_for_stakeholder(stakeholder_key)
+                # Update recommendations in the same transaction as the engagement
+                self._update_recommendations_for_stakeholder(conn, stakeholder_key)
 
-                return True
+            self.dirty_stakeholders.add(stakeholder_key)
+
+            return True
 
         except Exception as e:
             self.logger.error(
@@ -172,122 +463,120 @@ class StakeholderEngagementEngine:
             )
             return False
 
-    def generate_engagement_recommendations(self) -> List[Dict]:
-        """Generate proactive engagement recommendations for all stakeholders"""
+    def generate_engagement_recommendations(
+        self, only: Optional[Iterable[str]] = None
+    ) -> List[Dict]:
+        """Generate proactive engagement recommendations for all stakeholders or the given ones"""
 
         recommendations = []
+        # Copied so `only=engine.dirty_stakeholders` is safe while the set is updated below
+        keys = None if only is None else set(only)
 
         try:
             with self.get_connection() as conn:
+                self._purge_stale_recommendations(conn)
                 cursor = conn.cursor()
 
-                # Get all stakeholders
-                cursor.execute(
-                    """
-                    SELECT stakeholder_key, display_name, strategic_importance,
-                           optimal_meeting_frequency
-                    FROM stakeholder_profiles_enhanced
-                """
-                )
+                # Get the stakeholders with their latest engagement date in one query
+                if keys is None:
+                    cursor.execute(STAKEHOLDER_STATE_SQL)
+                else:
+                    cursor.execute(SCOPED_STAKEHOLDER_STATE_SQL, (_json_dumps(list(keys)),))
 
                 stakeholders = cursor.fetchall()
+                project_interests = self._load_project_interests(conn, keys)
+                today = date.today()
 
                 for stakeholder in stakeholders:
-                    stakeholder_key, display_name, importance, frequency = stakeholder
+                    stakeholder_key, _, importance, frequency, last_engaged = stakeholder[:5]
+                    preferences = stakeholder[5:]
 
                     # Generate recommendations for this stakeholder
                     stakeholder_recs = self._generate_stakeholder_recommendations(
-                        stakeholder_key, importance, frequency
+                        stakeholder_key,
+                        importance,
+                        frequency,
+                        last_engaged,
+                        preferences,
+                        project_interests.get(stakeholder_key, []),
+                        today,
                     )
 
                     recommendations.extend(stakeholder_recs)
 
                 # Store recommendations in database
-                self._store_recommendations(recommendations)
+                self._store_recommendations(conn, recommendations)
 
                 self.logger.info("Generated engagement recommendations", count=len(recommendations))
 
-                return recommendations
+            if keys is None:
+                self.dirty_stakeholders.clear()
+            else:
+                self.dirty_stakeholders.difference_update(keys)
+
+            return recommendations
 
         except Exception as e:
             self.logger.error("Failed to generate recommendations", error=str(e))
             return []
 
     def _generate_stakeholder_recommendations(
-        self, stakeholder_key: str, importance: str, frequency: str
+        self,
+        stakeholder_key: str,
+        importance: str,
+        frequency: str,
+        last_date_str: Optional[str],
+        preferences: Tuple,
+        projects: List[Tuple],
+        today: date,
     ) -> List[Dict]:
-        """Generate recommendations for a specific stakeholder"""
+        """Generate recommendations for a specific stakeholder from their last engagement date"""
 
         recommendations = []
 
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Get last engagement
-                cursor.execute(
-                    """
-                    SELECT engagement_date, engagement_type, engagement_quality
-                    FROM stakeholder_engagements
-                    WHERE stakeholder_key = ?
-                    ORDER BY engagement_date DESC
-                    LIMIT 1
-                """,
-                    (stakeholder_key,),
+            if last_date_str is None:
+                # No previous engagement - recommend initial meeting
+                recommendations.append(
+                    {
+                        "stakeholder_key": stakeholder_key,
+                        "recommendation_type": "initial_connection",
+                        "urgency_level": "high" if importance == "critical" else "medium",
+                        "trigger_reason": "No previous engagement recorded",
+                        "suggested_approach": "Schedule initial strategic alignment meeting",
+                        "confidence_score": 0.9,
+                    }
                 )
+                return recommendations
 
-                last_engagement = cursor.fetchone()
-
-                if not last_engagement:
-                    # No previous engagement - recommend initial meeting
-                    recommendations.append(
-                        {
-                            "stakeholder_key": stakeholder_key,
-                            "recommendation_type": "initial_connection",
-                            "urgency_level": "high" if importance == "critical" else "medium",
-                            "trigger_reason": "No previous engagement recorded",
-                            "suggested_approach": "Schedule initial strategic alignment meeting",
-                            "confidence_score": 0.9,
-                        }
-                    )
-                    return recommendations
-
-                last_date_str = last_engagement[0]
-                last_date = datetime.strptime(last_date_str, "%Y-%m-%d")
-                days_since = (datetime.now() - last_date).days
-
-                # Determine if engagement is overdue based on frequency
-                frequency_thresholds = {
-                    "weekly": 10,  # Allow some buffer
-                    "biweekly": 18,
-                    "monthly": 35,
-                    "quarterly": 100,
-                    "as_needed": 180,  # Flag if no contact for 6 months
-                }
+            days_since = (today - _parse_engagement_date(last_date_str)).days
 
-                threshold = frequency_thresholds.get(frequency, 60)
-
-                if days_since > threshold:
-                    urgency = self._calculate_urgency(days_since, threshold, importance)
-
-                    recommendations.append(
-                        {
-                            "stakeholder_key": stakeholder_key,
-                            "recommendation_type": "overdue_check_in",
-                            "urgency_level": urgency,
-                            "trigger_reason": f"Last engagement {days_since} days ago (threshold: {threshold})",
-                            "suggested_approach": self._suggest_engagement_approach(
-                                stakeholder_key
-                            ),
-                            "confidence_score": min(0.9, 0.5 + (days_since / threshold) * 0.4),
-                        }
-                    )
+            # Determine if engagement is overdue based on frequency
+            threshold = FREQUENCY_THRESHOLDS.get(frequency, DEFAULT_FREQUENCY_THRESHOLD)
 
-                # Check for strategic opportunities
-                strategic_recs = self._check_strategic_opportunities(stakeholder_key)
-                recommendations.extend(strategic_recs)
+            if days_since > threshold:
+                urgency = self._calculate_urgency(days_since, threshold, importance)
 
-                return recommendations
+                recommendations.append(
+                    {
+                        "stakeholder_key": stakeholder_key,
+                        "recommendation_type": "overdue_check_in",
+                        "urgency_level": urgency,
+                        "trigger_reason": (
+                            f"Last engagement {days_since} days ago (threshold: {threshold})"
+                        ),
+                        "suggested_approach": self._suggest_engagement_approach(
+                            stakeholder_key, preferences
+                        ),
+                        "confidence_score": min(0.9, 0.5 + (days_since / threshold) * 0.4),
+                    }
+                )
+
+            # Check for strategic opportunities
+            strategic_recs = self._check_strategic_opportunities(stakeholder_key, projects)
+            recommendations.extend(strategic_recs)
+
+            return recommendations
 
         except Exception as e:
             self.logger.error(
@@ -302,59 +591,30 @@ class StakeholderEngagementEngine:
 
         ratio = days_since / threshold
 
-        if importance == "critical":
-            if ratio > 2.0:
-                return "urgent"
-            elif ratio > 1.5:
-                return "high"
-            else:
-                return "medium"
-        elif importance == "high":
-            if ratio > 2.5:
-                return "urgent"
-            elif ratio > 2.0:
-                return "high"
-            else:
-                return "medium"
-        else:
-            if ratio > 3.0:
-                return "high"
-            elif ratio > 2.0:
-                return "medium"
-            else:
-                return "low"
+        steps, urgency = URGENCY_STEPS.get(importance, DEFAULT_URGENCY_STEPS)
+        for cutoff, step_urgency in steps:
+            if ratio > cutoff:
+                return step_urgency
 
-    def _suggest_engagement_approach(self, stakeholder_key: str) -> str:
-        """Suggest the best engagement approach for a stakeholder"""
+        return urgency
 
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Get stakeholder preferences
-                cursor.execute(
-                    """
-                    SELECT preferred_communication_channels, communication_style,
-                           most_effective_personas
-                    FROM stakeholder_profiles_enhanced
-                    WHERE stakeholder_key = ?
-                """,
-                    (stakeholder_key,),
-                )
+    def _suggest_engagement_approach(self, stakeholder_key: str, preferences: Tuple) -> str:
+        """Suggest the best engagement approach for a stakeholder from their preferences"""
 
-                prefs = cursor.fetchone()
+        try:
+            channels_json, style, personas_json = preferences
 
-                if prefs:
-                    channels = json.loads(prefs[0]) if prefs[0] else ["meeting"]
-                    style = prefs[1] or "collaborative"
-                    personas = json.loads(prefs[2]) if prefs[2] else ["diego"]
+            channels = _json_loads(channels_json) if channels_json else ["meeting"]
+            style = style or "collaborative"
+            personas = _json_loads(personas_json) if personas_json else ["diego"]
 
-                    primary_channel = channels[0] if channels else "meeting"
-                    primary_persona = personas[0] if personas else "diego"
+            primary_channel = channels[0] if channels else "meeting"
+            primary_persona = personas[0] if personas else "diego"
 
-                    return f"Reach out via {primary_channel} with {style} approach, use @{primary_persona} persona"
-                else:
-                    return "Schedule a brief check-in meeting to maintain relationship"
+            return (
+                f"Reach out via {primary_channel} with {style} approach, "
+                f"use @{primary_persona} persona"
+            )
 
         except Exception as e:
             self.logger.error(
@@ -362,105 +622,105 @@ class StakeholderEngagementEngine:
             )
             return "Schedule a check-in meeting"
 
-    def _check_strategic_opportunities(self, stakeholder_key: str) -> List[Dict]:
-        """Check for strategic opportunities requiring stakeholder engagement"""
+    def _load_project_interests(
+        self, conn: sqlite3.Connection, keys: Optional[set] = None
+    ) -> Dict[str, List[Tuple]]:
+        """Load active project interests for all stakeholders or the given keys, by stakeholder"""
 
-        opportunities = []
+        project_interests = defaultdict(list)
 
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
+            cursor = conn.cursor()
+            if keys is None:
+                cursor.execute(PROJECT_INTERESTS_SQL)
+            else:
+                cursor.execute(SCOPED_PROJECT_INTERESTS_SQL, (_json_dumps(list(keys)),))
 
-                # Check for projects they're interested in that might need updates
-                cursor.execute(
-                    """
-                    SELECT project_initiative_key, interest_level, update_frequency_needed
-                    FROM stakeholder_project_interests
-                    WHERE stakeholder_key = ? AND active = 1
-                """,
-                    (stakeholder_key,),
-                )
+            for stakeholder_key, project_key, interest, frequency in cursor.fetchall():
+                project_interests[stakeholder_key].append((project_key, interest, frequency))
 
-                projects = cursor.fetchall()
+        except Exception as e:
+            self.logger.error("Failed to load project interests", error=str(e))
 
-                for project in projects:
-                    project_key, interest, frequency = project
+        return project_interests
 
-                    if interest in ["critical", "high"] and frequency in ["weekly", "biweekly"]:
-                        opportunities.append(
-                            {
-                                "stakeholder_key": stakeholder_key,
-                                "recommendation_type": "project_update",
-                                "urgency_level": "medium",
-                                "trigger_reason": f"High interest in {project_key} requiring {frequency} updates",
-                                "suggested_approach": f"Provide strategic update on {project_key}",
-                                "strategic_context": json.dumps(
-                                    {"project": project_key, "interest_level": interest}
-                                ),
-                                "confidence_score": 0.7,
-                            }
-                        )
+    def _check_strategic_opportunities(
+        self, stakeholder_key: str, projects: List[Tuple]
+    ) -> List[Dict]:
+        """Check for strategic opportunities requiring stakeholder engagement"""
 
-                return opportunities
+        opportunities = []
 
-        except Exception as e:
-            self.logger.error(
-                "Failed to check strategic opportunities", stakeholder=stakeholder_key, error=str(e)
-            )
-            return []
+        # Check for projects they're interested in that might need updates
+        for project in projects:
+            project_key, interest, frequency = project
 
-    def _store_recommendations(self, recommendations: List[Dict]):
-        """Store recommendations in the database"""
+            if interest in ["critical", "high"] and frequency in ["weekly", "biweekly"]:
+                opportunities.append(
+                    {
+                        "stakeholder_key": stakeholder_key,
+                        "recommendation_type": "project_update",
+                        "urgency_level": "medium",
+                        "trigger_reason": (
+                            f"High interest in {project_key} requiring {frequency} updates"
+                        ),
+                        "suggested_approach": f"Provide strategic update on {project_key}",
+                        "strategic_context": _json_dumps(
+                            {"project": project_key, "interest_level": interest}
+                        ),
+                        "confidence_score": 0.7,
+                    }
+                )
+
+        return opportunities
+
+    def _store_recommendations(self, conn: sqlite3.Connection, recommendations: List[Dict]):
+        """Store recommendations on the caller's connection and transaction"""
 
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
+            # Every recommendation in a batch expires together, one week out
+            expires_at = (datetime.now() + timedelta(days=7)).isoformat()
+            rows = [
+                (
+                    rec["stakeholder_key"],
+                    rec["recommendation_type"],
+                    rec["urgency_level"],
+                    rec["trigger_reason"],
+                    rec["suggested_approach"],
+                    rec["confidence_score"],
+                    rec.get("strategic_context"),
+                    expires_at,
+                )
+                for rec in recommendations
+            ]
 
-                for rec in recommendations:
-                    cursor.execute(
-                        """
-                        INSERT INTO engagement_recommendations
-                        (stakeholder_key, recommendation_type, urgency_level,
-                         trigger_reason, suggested_approach, confidence_score,
-                         strategic_context, expires_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            rec["stakeholder_key"],
-                            rec["recommendation_type"],
-                            rec["urgency_level"],
-                            rec["trigger_reason"],
-                            rec["suggested_approach"],
-                            rec["confidence_score"],
-                            rec.get("strategic_context"),
-                            (datetime.now() + timedelta(days=7)).isoformat(),  # Expire in 1 week
-                        ),
-                    )
+            conn.executemany(INSERT_RECOMMENDATION_SQL, rows)
 
+            if self._info_enabled:
                 self.logger.info("Stored recommendations", count=len(recommendations))
 
         except Exception as e:
             self.logger.error("Failed to store recommendations", error=str(e))
 
-    def _update_recommendations_for_stakeholder(self, stakeholder_key: str):
-        """Update recommendations after a new engagement"""
+    def _update_recommendations_for_stakeholder(
+        self, conn: sqlite3.Connection, stakeholder_key: str
+    ):
+        """Update recommendations after a new engagement, on the caller's transaction"""
 
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Mark overdue check-in recommendations as completed
-                cursor.execute(
-                    """
-                    UPDATE engagement_recommendations
-                    SET recommendation_status = 'completed', completed_date = CURRENT_DATE
-                    WHERE stakeholder_key = ?
-                    AND recommendation_type = 'overdue_check_in'
-                    AND recommendation_status = 'pending'
-                """,
-                    (stakeholder_key,),
-                )
+            # Mark overdue check-in recommendations as completed
+            conn.execute(
+                """
+                UPDATE engagement_recommendations
+                SET recommendation_status = 'completed', completed_date = CURRENT_DATE
+                WHERE stakeholder_key = ?
+                AND recommendation_type = 'overdue_check_in'
+                AND recommendation_status = 'pending'
+            """,
+                (stakeholder_key,),
+            )
 
+            if self._info_enabled:
                 self.logger.info(
                     "Updated recommendations after engagement", stakeholder=stakeholder_key
                 )
@@ -475,41 +735,15 @@ class StakeholderEngagementEngine:
 
         try:
             with self.get_connection() as conn:
+                self._purge_stale_recommendations(conn)
                 cursor = conn.cursor()
 
-                query = """
-                    SELECT r.stakeholder_key, s.display_name, r.recommendation_type,
-                           r.urgency_level, r.trigger_reason, r.suggested_approach,
-                           r.confidence_score, r.created_at
-                    FROM engagement_recommendations r
-                    JOIN stakeholder_profiles_enhanced s ON r.stakeholder_key = s.stakeholder_key
-                    WHERE r.recommendation_status = 'pending'
-                    AND (r.expires_at IS NULL OR r.expires_at > CURRENT_TIMESTAMP)
-                """
+                # An empty filter means no filter, as before
+                urgency = urgency_filter or None
+                cursor.execute(PENDING_RECOMMENDATIONS_SQL, (urgency, urgency))
 
-                params = []
-                if urgency_filter:
-                    query += " AND r.urgency_level = ?"
-                    params.append(urgency_filter)
-
-                query += " ORDER BY r.urgency_level DESC, r.confidence_score DESC, r.created_at ASC"
-
-                cursor.execute(query, params)
-                recommendations = cursor.fetchall()
-
-                return [
-                    {
-                        "stakeholder_key": row[0],
-                        "display_name": row[1],
-                        "recommendation_type": row[2],
-                        "urgency_level": row[3],
-                        "trigger_reason": row[4],
-                        "suggested_approach": row[5],
-                        "confidence_score": row[6],
-                        "created_at": row[7],
-                    }
-                    for row in recommendations
-                ]
+                # Column names in the query are the result keys
+                return [dict(row) for row in cursor.fetchall()]
 
         except Exception as e:
             self.logger.error("Failed to get pending recommendations", error=str(e))
@@ -522,73 +756,19 @@ class StakeholderEngagementEngine:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
-                # Get stakeholder profile
-                cursor.execute(
-                    """
-                    SELECT display_name, role_title, organization, strategic_importance,
-                           preferred_communication_channels, most_effective_personas
-                    FROM stakeholder_profiles_enhanced
-                    WHERE stakeholder_key = ?
-                """,
-                    (stakeholder_key,),
-                )
-
-                profile = cursor.fetchone()
+                # Profile, engagements and recommendations in a single round trip
+                cursor.execute(STAKEHOLDER_SUMMARY_SQL, (stakeholder_key,) * 3)
+                summary = _json_loads(cursor.fetchone()[0])
 
+                profile = summary["profile"]
                 if not profile:
                     return {}
 
-                # Get recent engagements
-                cursor.execute(
-                    """
-                    SELECT engagement_date, engagement_type, engagement_quality,
-                           topics_discussed
-                    FROM stakeholder_engagements
-                    WHERE stakeholder_key = ?
-                    ORDER BY engagement_date DESC
-                    LIMIT 5
-                """,
-                    (stakeholder_key,),
-                )
-
-                engagements = cursor.fetchall()
-
-                # Get pending recommendations
-                cursor.execute(
-                    """
-                    SELECT recommendation_type, urgency_level, trigger_reason,
-                           suggested_approach
-                    FROM engagement_recommendations
-                    WHERE stakeholder_key = ?
-                    AND recommendation_status = 'pending'
-                    ORDER BY urgency_level DESC
-                """,
-                    (stakeholder_key,),
-                )
-
-                recommendations = cursor.fetchall()
-
                 return {
                     "stakeholder_key": stakeholder_key,
-                    "display_name": profile[0],
-                    "role_title": profile[1],
-                    "organization": profile[2],
-                    "strategic_importance": profile[3],
-                    "preferred_channels": json.loads(profile[4]) if profile[4] else [],
-                    "effective_personas": json.loads(profile[5]) if profile[5] else [],
-                    "recent_engagements": [
-                        {
-                            "date": eng[0],
-                            "type": eng[1],
-                            "quality": eng[2],
-                            "topics": json.loads(eng[3]) if eng[3] else [],
-                        }
-                        for eng in engagements
-                    ],
-                    "pending_recommendations": [
-                        {"type": rec[0], "urgency": rec[1], "reason": rec[2], "approach": rec[3]}
-                        for rec in recommendations
-                    ],
+                    **profile,
+                    "recent_engagements": summary["recent_engagements"],
+                    "pending_recommendations": summary["pending_recommendations"],
                 }
 
         except Exception as e:
@@ -635,51 +815,53 @@ def main():
         print(f"✅ Generated {len(recommendations)} recommendations")
 
     elif args.show_recommendations:
-        print("📋 Pending Engagement Recommendations:")
-        print("=" * 50)
         recommendations = engine.get_pending_recommendations(args.urgency)
 
+        # Assemble the listing and write it once instead of printing line by line
+        out = ["📋 Pending Engagement Recommendations:", "=" * 50]
         if not recommendations:
-            print("No pending recommendations found.")
-            return
+            out.append("No pending recommendations found.")
 
         for rec in recommendations:
-            urgency_emoji = {"urgent": "🔴", "high": "🟡", "medium": "🟢", "low": "🔵"}.get(
-                rec["urgency_level"], "⚪"
-            )
-
-            print(f"{urgency_emoji} {rec['display_name']} ({rec['stakeholder_key']})")
-            print(f"   Type: {rec['recommendation_type']}")
-            print(f"   Reason: {rec['trigger_reason']}")
-            print(f"   Approach: {rec['suggested_approach']}")
-            print(f"   Confidence: {rec['confidence_score']:.1%}")
-            print()
+            out += [
+                f"{URGENCY_EMOJI.get(rec['urgency_level'], '⚪')} "
+                f"{rec['display_name']} ({rec['stakeholder_key']})",
+                f"   Type: {rec['recommendation_type']}",
+                f"   Reason: {rec['trigger_reason']}",
+                f"   Approach: {rec['suggested_approach']}",
+                f"   Confidence: {rec['confidence_score']:.1%}",
+                "",
+            ]
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     elif args.stakeholder:
-        print(f"📊 Stakeholder Summary: {args.stakeholder}")
-        print("=" * 50)
         summary = engine.get_stakeholder_summary(args.stakeholder)
 
+        out = [f"📊 Stakeholder Summary: {args.stakeholder}", "=" * 50]
         if not summary:
-            print("Stakeholder not found.")
-            return
-
-        print(f"Name: {summary['display_name']}")
-        print(f"Role: {summary['role_title']}")
-        print(f"Organization: {summary['organization']}")
-        print(f"Strategic Importance: {summary['strategic_importance']}")
-        print(f"Effective Personas: {', '.join(summary['effective_personas'])}")
-
-        print(f"\nRecent Engagements ({len(summary['recent_engagements'])}):")
-        for eng in summary["recent_engagements"]:
-            print(f"  • {eng['date']} - {eng['type']} ({eng['quality']})")
-
-        print(f"\nPending Recommendations ({len(summary['pending_recommendations'])}):")
-        for rec in summary["pending_recommendations"]:
-            urgency_emoji = {"urgent": "🔴", "high": "🟡", "medium": "🟢", "low": "🔵"}.get(
-                rec["urgency"], "⚪"
-            )
-            print(f"  {urgency_emoji} {rec['type']}: {rec['reason']}")
+            out.append("Stakeholder not found.")
+        else:
+            out += [
+                f"Name: {summary['display_name']}",
+                f"Role: {summary['role_title']}",
+                f"Organization: {summary['organization']}",
+                f"Strategic Importance: {summary['strategic_importance']}",
+                f"Effective Personas: {', '.join(summary['effective_personas'])}",
+                f"\nRecent Engagements ({len(summary['recent_engagements'])}):",
+            ]
+            out += [
+                f"  • {eng['date']} - {eng['type']} ({eng['quality']})"
+                for eng in summary["recent_engagements"]
+            ]
+
+            out.append(f"\nPending Recommendations ({len(summary['pending_recommendations'])}):")
+            out += [
+                f"  {URGENCY_EMOJI.get(rec['urgency'], '⚪')} {rec['type']}: {rec['reason']}"
+                for rec in summary["pending_recommendations"]
+            ]
+
+        sys.stdout.write("\n".join(out) + "\n")
 
     else:
         parser.print_help()
@@ -32,6 +32,7 @@ CREATE TABLE stakeholder_profiles_enhanced (
 
     -- Engagement context
     key_projects_interests TEXT,  -- JSON: current projects/initiatives they care about
+    last_engagement_date DATE,  -- Latest stakeholder_engagements.engagement_date, kept by triggers
     escalation_preferences TEXT,  -- How they like to handle escalations
     follow_up_preferences TEXT,  -- Preferred follow-up style and timing
 
@@ -196,6 +197,59 @@ CREATE INDEX idx_stakeholder_projects_key ON stakeholder_project_interests(stake
 CREATE INDEX idx_stakeholder_projects_project ON stakeholder_project_interests(project_initiative_key);
 CREATE INDEX idx_stakeholder_projects_active ON stakeholder_project_interests(active);
 
+-- Composite indexes for recommendation generation and pending recommendation reads
+CREATE INDEX IF NOT EXISTS idx_eng_stk_date ON stakeholder_engagements(stakeholder_key, engagement_date DESC);
+CREATE INDEX IF NOT EXISTS idx_rec_pending ON engagement_recommendations(recommendation_status, stakeholder_key, expires_at);
+CREATE INDEX IF NOT EXISTS idx_rec_pending_live ON engagement_recommendations(urgency_level DESC, confidence_score DESC, created_at ASC, stakeholder_key) WHERE recommendation_status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_spi_active ON stakeholder_project_interests(stakeholder_key, active);
+CREATE INDEX IF NOT EXISTS idx_prof_key ON stakeholder_profiles_enhanced(stakeholder_key, display_name);
+
 CREATE INDEX idx_relationship_health_key ON relationship_health_metrics(stakeholder_key);
 CREATE INDEX idx_relationship_health_date ON relationship_health_metrics(assessment_date);
 CREATE INDEX idx_relationship_health_score ON relationship_health_metrics(overall_health_score);
+
+-- Keep stakeholder_profiles_enhanced.last_engagement_date at the latest engagement date
+CREATE TRIGGER IF NOT EXISTS trg_eng_last_insert AFTER INSERT ON stakeholder_engagements
+BEGIN
+    UPDATE stakeholder_profiles_enhanced
+    SET last_engagement_date = (
+        SELECT MAX(e.engagement_date)
+        FROM stakeholder_engagements e
+        WHERE e.stakeholder_key = stakeholder_profiles_enhanced.stakeholder_key
+    )
+    WHERE stakeholder_key = NEW.stakeholder_key;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_eng_last_update
+AFTER UPDATE OF stakeholder_key, engagement_date ON stakeholder_engagements
+BEGIN
+    UPDATE stakeholder_profiles_enhanced
+    SET last_engagement_date = (
+        SELECT MAX(e.engagement_date)
+        FROM stakeholder_engagements e
+        WHERE e.stakeholder_key = stakeholder_profiles_enhanced.stakeholder_key
+    )
+    WHERE stakeholder_key IN (OLD.stakeholder_key, NEW.stakeholder_key);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_eng_last_delete AFTER DELETE ON stakeholder_engagements
+BEGIN
+    UPDATE stakeholder_profiles_enhanced
+    SET last_engagement_date = (
+        SELECT MAX(e.engagement_date)
+        FROM stakeholder_engagements e
+        WHERE e.stakeholder_key = stakeholder_profiles_enhanced.stakeholder_key
+    )
+    WHERE stakeholder_key = OLD.stakeholder_key;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_profile_last_insert AFTER INSERT ON stakeholder_profiles_enhanced
+BEGIN
+    UPDATE stakeholder_profiles_enhanced
+    SET last_engagement_date = (
+        SELECT MAX(e.engagement_date)
+        FROM stakeholder_engagements e
+        WHERE e.stakeholder_key = stakeholder_profiles_enhanced.stakeholder_key
+    )
+    WHERE id = NEW.id;
+END;
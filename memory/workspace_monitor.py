@@ -7,7 +7,9 @@ Automated filesystem monitoring for strategic intelligence capture
 import json
 import os
 import sqlite3
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -23,6 +25,35 @@ try:
 except ImportError:
     STAKEHOLDER_DETECTION_AVAILABLE = False
 
+# Tuning for the handler's long-lived connection; WAL persists in the database file once set
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Seconds between background writes of queued workspace changes
+FLUSH_INTERVAL_SECONDS = 0.25
+
+# Workspace change insert, executed once per queued change in each batch
+INSERT_WORKSPACE_CHANGE_SQL = """
+    INSERT INTO workspace_changes
+    (change_type, path_full, path_relative, category, subcategory,
+     stakeholders_detected, projects_detected, meeting_type_detected,
+     content_summary, strategic_value, memory_trigger)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Seconds the active workspace templates are reused before the table is read again
+TEMPLATE_CACHE_SECONDS = 60
+
+
+@lru_cache(maxsize=64)
+def _load_template_json(text: str) -> Any:
+    """Parse a template's JSON column; the same few templates are applied repeatedly."""
+    return json.loads(text)
+
 
 class StrategicWorkspaceHandler(FileSystemEventHandler):
     """Handle workspace filesystem events for strategic intelligence capture."""
@@ -39,6 +70,24 @@ class StrategicWorkspaceHandler(FileSystemEventHandler):
             
         self.workspace_root = Path("workspace")
 
+        # One autocommit connection for the handler's lifetime, shared by the event and
+        # flusher threads under _db_lock; batches open their own transaction
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        for pragma in CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
+        self._db_lock = threading.Lock()
+
+        # Workspace changes queued by event handlers and written in batches by flush()
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._queued_count = 0
+        self._flusher: Optional[threading.Thread] = None
+        self._stop_flusher = threading.Event()
+
+        # Active workspace_templates rows, refreshed after TEMPLATE_CACHE_SECONDS
+        self._templates: List[tuple] = []
+        self._templates_loaded_at: Optional[float] = None
+
     def on_created(self, event):
         """Handle file/directory creation events."""
         if event.is_directory:
@@ -74,7 +123,7 @@ class StrategicWorkspaceHandler(FileSystemEventHandler):
             **intelligence,
         )
 
-        print(f"✅ Workspace change stored: ID {change_id}")
+        print(f"✅ Workspace change queued: #{change_id}")
 
         # Handle special cases
         if category == "meeting_prep":
@@ -252,39 +301,107 @@ class StrategicWorkspaceHandler(FileSystemEventHandler):
         return intelligence
 
     def _store_workspace_change(self, **kwargs) -> int:
-        """Store workspace change in strategic memory database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        """Queue workspace change for the next batched write to strategic memory."""
+        row = (
+            kwargs["change_type"],
+            kwargs["path_full"],
+            kwargs["path_relative"],
+            kwargs["category"],
+            kwargs["subcategory"],
+            json.dumps(kwargs.get("stakeholders_detected", [])),
+            json.dumps(kwargs.get("projects_detected", [])),
+            kwargs.get("meeting_type_detected"),
+            kwargs.get("content_summary", ""),
+            kwargs.get("strategic_value", "medium"),
+            kwargs.get("memory_trigger", False),
+        )
 
-            # Ensure workspace_changes table exists (handle gracefully if not)
-            try:
-                cursor.execute(
-                    """
-                    INSERT INTO workspace_changes
-                    (change_type, path_full, path_relative, category, subcategory,
-                     stakeholders_detected, projects_detected, meeting_type_detected,
-                     content_summary, strategic_value, memory_trigger)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        kwargs["change_type"],
-                        kwargs["path_full"],
-                        kwargs["path_relative"],
-                        kwargs["category"],
-                        kwargs["subcategory"],
-                        json.dumps(kwargs.get("stakeholders_detected", [])),
-                        json.dumps(kwargs.get("projects_detected", [])),
-                        kwargs.get("meeting_type_detected"),
-                        kwargs.get("content_summary", ""),
-                        kwargs.get("strategic_value", "medium"),
-                        kwargs.get("memory_trigger", False),
-                    ),
-                )
-                return cursor.lastrowid
-            except sqlite3.OperationalError:
-                # Table doesn't exist yet - return 0
+        # Sequence number of the change within this handler, not the database row id
+        with self._lock:
+            self._pending.append(row)
+            self._queued_count += 1
+            return self._queued_count
+
+    def flush(self) -> int:
+        """Write queued workspace changes in a single transaction."""
+        # Held across the swap and the write so batches reach the database in order
+        with self._db_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+
+            if not rows:
                 return 0
 
+            try:
+                self.conn.execute("BEGIN")
+                self.conn.executemany(INSERT_WORKSPACE_CHANGE_SQL, rows)
+                self.conn.execute("COMMIT")
+                return len(rows)
+            except Exception as e:
+                # Never leave the shared autocommit connection inside a failed batch
+                if self.conn.in_transaction:
+                    self.conn.execute("ROLLBACK")
+                if isinstance(e, sqlite3.OperationalError):
+                    if "no such table" in str(e):
+                        # Table doesn't exist yet - drop the batch
+                        return 0
+                    # Transient failure such as a locked database; retry on the next flush
+                    with self._lock:
+                        self._pending[:0] = rows
+                    return 0
+                if not isinstance(e, sqlite3.Error):
+                    raise
+
+            # One bad row fails the whole batch; store the rest one at a time
+            return self._store_rows_individually(rows)
+
+    def _store_rows_individually(self, rows: List[tuple]) -> int:
+        """Insert rows one by one after a failed batch, reporting any that are dropped."""
+        stored = 0
+        errors = []
+        for row in rows:
+            try:
+                self.conn.execute(INSERT_WORKSPACE_CHANGE_SQL, row)
+                stored += 1
+            except sqlite3.Error as e:
+                errors.append(e)
+
+        if errors:
+            print(f"⚠️  Dropped {len(errors)} of {len(rows)} workspace changes: {errors[0]}")
+        return stored
+
+    def start_flusher(self):
+        """Start writing queued workspace changes from a background thread."""
+        self._stop_flusher.clear()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="workspace-change-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def stop_flusher(self):
+        """Stop the background writer and write any changes still queued."""
+        self._stop_flusher.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+
+    def close(self):
+        """Write any queued changes and close the database connection."""
+        self.stop_flusher()
+        if self._pending:
+            print(f"⚠️  {len(self._pending)} workspace changes could not be stored")
+        with self._db_lock:
+            self.conn.close()
+
+    def _flush_periodically(self):
+        """Flush queued workspace changes every FLUSH_INTERVAL_SECONDS until stopped."""
+        while not self._stop_flusher.wait(FLUSH_INTERVAL_SECONDS):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"❌ Error storing workspace changes: {e}")
+
     def _handle_meeting_prep_directory(self, dir_path: Path):
         """Handle new meeting prep directory creation."""
         print(f"🎯 Processing new meeting prep directory: {dir_path.name}")
@@ -299,10 +416,10 @@ class StrategicWorkspaceHandler(FileSystemEventHandler):
 
             print(f"✅ Meeting session created: {meeting_data['meeting_key']} -> ID {meeting_id}")
 
-            # Update workspace change with memory storage info
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            # Update workspace change with memory storage info, once its queued row is written
+            self.flush()
+            with self._db_lock:
+                self.conn.execute(
                     """
                     UPDATE workspace_changes
                     SET memory_stored_at = CURRENT_TIMESTAMP
@@ -324,29 +441,39 @@ class StrategicWorkspaceHandler(FileSystemEventHandler):
 
     def _apply_directory_templates(self, dir_path: Path, category: str, subcategory: str):
         """Apply automatic directory templates based on category."""
-        # Query workspace_templates for matching templates
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            try:
-                cursor.execute(
-                    """
-                    SELECT template_name, directory_structure, default_files
-                    FROM workspace_templates
-                    WHERE active = 1
-                """
-                )
-                templates = cursor.fetchall()
+        try:
+            templates = self._get_templates()
+        except sqlite3.OperationalError:
+            # Templates table doesn't exist yet
+            return
 
-                for template_name, dir_structure, default_files in templates:
-                    # Check if template matches this directory
-                    if self._template_matches(dir_path, template_name):
-                        print(f"📋 Applying template: {template_name}")
-                        self._create_template_structure(dir_path, dir_structure, default_files)
-                        break
+        for template_name, dir_structure, default_files in templates:
+            # Check if template matches this directory
+            if self._template_matches(dir_path, template_name):
+                print(f"📋 Applying template: {template_name}")
+                self._create_template_structure(dir_path, dir_structure, default_files)
+                break
+
+    def _get_templates(self) -> List[tuple]:
+        """Get active workspace templates, querying the table at most once per cache period."""
+        now = time.monotonic()
+        if (
+            self._templates_loaded_at is not None
+            and now - self._templates_loaded_at < TEMPLATE_CACHE_SECONDS
+        ):
+            return self._templates
 
-            except sqlite3.OperationalError:
-                # Templates table doesn't exist yet
-                pass
+        with self._db_lock:
+            self._templates = self.conn.execute(
+                """
+                SELECT template_name, directory_structure, default_files
+                FROM workspace_templates
+                WHERE active = 1
+            """
+            ).fetchall()
+        self._templates_loaded_at = now
+
+        return self._templates
 
     def _template_matches(self, dir_path: Path, template_name: str) -> bool:
         """Check if directory matches template pattern."""
@@ -366,8 +493,8 @@ class StrategicWorkspaceHandler(FileSystemEventHandler):
     def _create_template_structure(self, dir_path: Path, dir_structure: str, default_files: str):
         """Create directory structure and default files from template."""
         try:
-            structure = json.loads(dir_structure) if dir_structure else {}
-            files = json.loads(default_files) if default_files else []
+            structure = _load_template_json(dir_structure) if dir_structure else {}
+            files = _load_template_json(default_files) if default_files else []
 
             # Create subdirectories
             if "subdirs" in structure:
@@ -416,6 +543,7 @@ class WorkspaceMonitor:
 
         self.observer.schedule(self.handler, str(self.workspace_path), recursive=True)
         self.observer.start()
+        self.handler.start_flusher()
 
         try:
             print("✅ Workspace monitor active - watching for strategic changes...")
@@ -427,6 +555,7 @@ class WorkspaceMonitor:
             self.observer.stop()
 
         self.observer.join()
+        self.handler.close()
         print("✅ Workspace monitor stopped")
 
 
@@ -511,6 +640,8 @@ def main():
         else:
             print(f"Test directory not found: {test_path}")
 
+        handler.close()
+
     else:
         # Start monitoring service
         monitor = WorkspaceMonitor(args.workspace, args.db_path)
@@ -0,0 +1,61 @@
+"""
+Unit tests for intelligent stakeholder detection
+"""
+
+import pytest
+
+import claudedirector  # noqa: F401  (puts memory/ on sys.path)
+from intelligent_stakeholder_detector import IntelligentStakeholderDetector
+
+
+def _candidate(stakeholder_key, name, confidence_score=0.95):
+    """Stakeholder candidate as returned by LocalStakeholderAI"""
+    return {
+        "stakeholder_key": stakeholder_key,
+        "name": name,
+        "confidence_score": confidence_score,
+        "strategic_importance": "high",
+        "detected_role": None,
+        "communication_preferences": {},
+    }
+
+
+@pytest.fixture
+def detector(tmp_path):
+    """Stakeholder detector over a database with the engagement schema applied"""
+    detector = IntelligentStakeholderDetector(str(tmp_path / "strategic_memory.db"))
+    assert detector.engagement_engine.apply_engagement_schema()
+    detector.engagement_engine.add_stakeholder("vp_eng", "VP Engineering")
+    detector.engagement_engine.generate_engagement_recommendations()
+    yield detector
+    detector.engagement_engine.close()
+    detector.ai_engine.close()
+
+
+class TestRecommendationRefresh:
+    """Test refreshing recommendations after a batch"""
+
+    def test_only_new_stakeholders_are_refreshed(self, detector, monkeypatch):
+        """Recommendations are regenerated for the stakeholders the batch created"""
+        engine = detector.engagement_engine
+        monkeypatch.setattr(
+            detector.ai_engine,
+            "detect_stakeholders_in_content",
+            lambda content, context: [_candidate("jane_doe", "Jane Doe")],
+        )
+        scopes = []
+        generate = engine.generate_engagement_recommendations
+
+        def record_scope(only=None):
+            scopes.append(None if only is None else set(only))
+            return generate(only=only)
+
+        monkeypatch.setattr(engine, "generate_engagement_recommendations", record_scope)
+
+        result = detector.process_content_for_stakeholders(
+            "Jane Doe will own the platform migration next quarter", {"category": "meeting_prep"}
+        )
+
+        assert result["auto_created"] == 1
+        assert scopes == [{"jane_doe"}]
+        assert engine.dirty_stakeholders == set()
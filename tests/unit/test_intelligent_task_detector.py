@@ -0,0 +1,102 @@
+"""
+Unit tests for local task detection patterns
+"""
+
+import pytest
+
+import memory.intelligent_task_detector as intelligent_task_detector
+from memory.intelligent_task_detector import TASK_TEXT_GROUP, IntelligentTaskDetector
+
+MEETING_NOTES = (
+    "I will deploy the fix by Friday and I need to document it. You should review the design "
+    "by 2026-11-02 and can you migrate the service urgently? Sarah will update the roadmap "
+    "next week."
+)
+
+
+@pytest.fixture
+def detector(tmp_path):
+    """Task detector backed by a throwaway database"""
+    detector = IntelligentTaskDetector(str(tmp_path / "tasks.db"))
+    yield detector
+    detector.close()
+
+
+class TestTaskTextCapture:
+    """Test the bounded task-text group shared by assignment patterns"""
+
+    def test_group_compiles_without_atomic_groups(self):
+        """Stdlib re only supports atomic groups from Python 3.11; the package targets 3.8"""
+        assert "(?>" not in TASK_TEXT_GROUP
+
+    def test_task_text_ends_at_sentence_boundary(self, detector):
+        """Task text runs up to the sentence terminator"""
+        tasks = detector._extract_self_assigned_tasks("I need to document the migration plan. ")
+
+        assert [task[0] for task in tasks] == ["document the migration plan"]
+
+    def test_overlong_task_text_is_not_captured(self, detector):
+        """Runs longer than 200 characters are not task text"""
+        content = "I need to document " + "the plan " * 30 + "."
+
+        assert detector._extract_self_assigned_tasks(content) == []
+
+
+class TestAssignmentExtraction:
+    """Test assignment extraction across overlapping patterns"""
+
+    NESTED = (
+        "I will deploy the fix and I need to document it. "
+        "You should review the design and can you migrate the service"
+    )
+
+    def test_nested_self_assignments_are_kept(self, detector):
+        """A self-assignment inside another one's task text is extracted too"""
+        tasks = detector._extract_self_assigned_tasks(self.NESTED)
+
+        assert [task[0] for task in tasks] == [
+            "deploy the fix and I need to document it",
+            "document it",
+        ]
+
+    def test_nested_incoming_assignments_are_kept(self, detector):
+        """An incoming request inside another one's task text is extracted too"""
+        tasks = detector._extract_incoming_tasks(self.NESTED)
+
+        assert [task[0] for task in tasks] == [
+            "review the design and can you migrate the service",
+            "migrate the service",
+        ]
+
+
+def _detect(db_path, **kwargs):
+    """Tasks detected in MEETING_NOTES by a fresh detector"""
+    detector = IntelligentTaskDetector(str(db_path), **kwargs)
+    try:
+        return detector.detect_tasks_in_content(MEETING_NOTES, {"category": "meeting_prep"})
+    finally:
+        detector.close()
+
+
+class TestOptionalAccelerators:
+    """Test that optional accelerators leave detection results unchanged"""
+
+    @pytest.mark.parametrize("module_name", ["ahocorasick", "hyperscan"])
+    def test_fallback_matches_accelerated_results(self, tmp_path, monkeypatch, module_name):
+        """Without the accelerator the stdlib fallback finds the same tasks"""
+        if getattr(intelligent_task_detector, module_name) is None:
+            pytest.skip(f"{module_name} is not installed")
+        expected = _detect(tmp_path / "accelerated.db")
+
+        monkeypatch.setattr(intelligent_task_detector, module_name, None)
+        monkeypatch.setattr(IntelligentTaskDetector, "_pattern_library_cache", {})
+
+        assert expected
+        assert _detect(tmp_path / "fallback.db") == expected
+
+    def test_regex_engine_matches_stdlib(self, tmp_path):
+        """Patterns compiled with the regex module find the same tasks as stdlib re"""
+        if intelligent_task_detector.regex is None:
+            pytest.skip("regex is not installed")
+
+        assert _detect(tmp_path / "regex.db", use_regex_module=True) == _detect(tmp_path / "re.db")
@@ -0,0 +1,178 @@
+"""
+Unit tests for local stakeholder AI analysis and connections
+"""
+
+import threading
+
+import pytest
+
+import claudedirector  # noqa: F401  (puts memory/ on sys.path)
+import local_stakeholder_ai
+from local_stakeholder_ai import LocalStakeholderAI
+
+MEETING_NOTES = (
+    "Sarah Chen, VP of Engineering, owns the budget and roadmap strategy decision. "
+    "Weekly sync with Sarah Chen on slack. Escalated to John M. Smith, director of "
+    "platform, who prefers email and a visual diagram. Contact mark.teamson@example.com."
+)
+
+
+@pytest.fixture
+def stakeholder_ai(tmp_path):
+    """Local stakeholder AI backed by a throwaway database"""
+    ai = LocalStakeholderAI(db_path=str(tmp_path / "stakeholders.db"))
+    yield ai
+    ai.close()
+
+
+class TestNameExtraction:
+    """Test candidate name extraction and exclusions"""
+
+    @pytest.mark.parametrize(
+        "name, excluded",
+        [
+            ("Product Team", True),
+            ("Design Review", True),
+            ("Mark Teamson", False),
+            ("Jane Doe", False),
+            ("jane doe", True),
+            ("Al", True),
+        ],
+    )
+    def test_exclusions_match_whole_words(self, stakeholder_ai, name, excluded):
+        """Excluded words drop a name only when they appear as whole words"""
+        assert stakeholder_ai._is_excluded_name(name) is excluded
+
+    def test_extract_names_merges_case_variants(self, stakeholder_ai):
+        """Mentions differing only in case collapse to the title-cased name"""
+        content = (
+            "Met with Sarah Chen and the Engineering Team. Mark Teamson joined; "
+            "email sarah.chen@example.com and SARAH CHEN later"
+        )
+
+        names = stakeholder_ai._extract_names(content)
+
+        assert names == {"sarah chen": "Sarah Chen", "mark teamson": "Mark Teamson"}
+
+    def test_overlapping_name_shapes_are_all_extracted(self, stakeholder_ai):
+        """Each name shape is matched on its own, so shorter shapes inside longer ones count"""
+        names = stakeholder_ai._extract_names("Escalated to John M. Smith yesterday")
+
+        assert names == {"john m. smith": "John M. Smith", "m. smith": "M. Smith"}
+
+
+class TestStakeholderDetection:
+    """Test end-to-end stakeholder detection"""
+
+    def test_title_cased_names_are_detected(self, stakeholder_ai):
+        """Proper names survive the exclusion check; earlier versions excluded every name"""
+        content = (
+            "Sarah Chen, VP of Engineering, owns the budget and roadmap strategy. "
+            "Weekly sync with Sarah Chen on slack."
+        )
+
+        candidates = stakeholder_ai.detect_stakeholders_in_content(content, {})
+
+        assert [candidate["stakeholder_key"] for candidate in candidates] == ["sarah_chen"]
+        assert candidates[0]["name"] == "Sarah Chen"
+
+    def test_excluded_words_yield_no_candidates(self, stakeholder_ai):
+        """Team and department names are still not stakeholders"""
+        content = "The Product Team and Design Review met about the Engineering Group budget."
+
+        assert stakeholder_ai.detect_stakeholders_in_content(content, {}) == []
+
+
+class TestCommunicationPatterns:
+    """Test communication preference detection"""
+
+    def test_plural_indicators_are_detected(self, stakeholder_ai):
+        """Plural indicators like "emails" and "meetings" still count"""
+        text = "prefers emails and slides with charts; weekly meetings and calls"
+
+        preferences = stakeholder_ai._analyze_communication_patterns(
+            "Jane Doe", text, name_context_lower=text
+        )
+
+        assert set(preferences["channels"]) == {"email", "meeting"}
+        assert preferences["style"] == "visual"
+
+
+class TestRoleIndicators:
+    """Test role classification from nearby titles"""
+
+    def test_titles_match_whole_words_only(self, stakeholder_ai):
+        """Short titles never match inside longer words"""
+        text = "jane sent a direct note to the doctor"
+
+        analysis = stakeholder_ai._analyze_role_indicators(
+            "Jane Doe", text, name_context_lower=text
+        )
+
+        assert analysis["role"] is None
+        assert analysis["confidence"] == 0.0
+
+    def test_whole_word_title_is_classified(self, stakeholder_ai):
+        """A standalone title still classifies the role"""
+        text = "jane doe, dir of platform engineering"
+
+        analysis = stakeholder_ai._analyze_role_indicators(
+            "Jane Doe", text, name_context_lower=text
+        )
+
+        assert analysis["role"] == "director"
+
+
+class TestConnections:
+    """Test per-thread database connections"""
+
+    def test_connection_is_reused_within_a_thread(self, stakeholder_ai):
+        """Repeated calls on one thread share a connection until it is closed"""
+        conn = stakeholder_ai.get_connection()
+
+        assert stakeholder_ai.get_connection() is conn
+
+        stakeholder_ai.close()
+        assert stakeholder_ai.get_connection() is not conn
+
+    def test_each_thread_gets_its_own_connection(self, stakeholder_ai):
+        """Connections are never shared across threads"""
+        conn = stakeholder_ai.get_connection()
+        other = []
+
+        def open_and_close():
+            other.append(stakeholder_ai.get_connection())
+            stakeholder_ai.close()
+
+        worker = threading.Thread(target=open_and_close)
+        worker.start()
+        worker.join()
+
+        assert other[0] is not conn
+        assert stakeholder_ai.get_connection() is conn
+
+
+class TestOptionalAccelerators:
+    """Test that optional accelerators leave detection results unchanged"""
+
+    @pytest.mark.parametrize("module_name", ["ahocorasick", "hyperscan"])
+    def test_fallback_matches_accelerated_results(self, tmp_path, monkeypatch, module_name):
+        """Without the accelerator the stdlib fallback finds the same stakeholders"""
+        if getattr(local_stakeholder_ai, module_name) is None:
+            pytest.skip(f"{module_name} is not installed")
+
+        def detect(db_name):
+            ai = LocalStakeholderAI(db_path=str(tmp_path / db_name))
+            try:
+                return (
+                    ai._extract_names(MEETING_NOTES),
+                    ai.detect_stakeholders_in_content(MEETING_NOTES, {}),
+                )
+            finally:
+                ai.close()
+
+        expected = detect("accelerated.db")
+        monkeypatch.setattr(local_stakeholder_ai, module_name, None)
+
+        assert expected[1]
+        assert detect("fallback.db") == expected
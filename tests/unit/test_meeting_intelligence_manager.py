@@ -0,0 +1,171 @@
+"""
+Unit tests for the meeting intelligence manager's database layer
+"""
+
+import sqlite3
+
+import pytest
+
+import memory.meeting_intelligence as meeting_intelligence
+from memory.meeting_intelligence import MeetingIntelligenceManager
+
+
+def _names(db_path, kind):
+    """Names of the schema objects of one kind in a database"""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = ?", (kind,))
+        return {row[0] for row in rows}
+    finally:
+        conn.close()
+
+
+def _meeting_data(meeting_key, **overrides):
+    """Parsed meeting data as produced by parse_meeting_prep_directory"""
+    data = {
+        "meeting_key": meeting_key,
+        "meeting_type": "vp_1on1",
+        "stakeholder_primary": "vp_engineering",
+        "stakeholder_secondary": [],
+        "prep_file_path": f"workspace/meeting-prep/{meeting_key}",
+        "agenda_items": ["Roadmap"],
+        "preparation_notes": "",
+        "strategic_themes": [],
+        "persona_activated": ["diego"],
+    }
+    data.update(overrides)
+    return data
+
+
+def _sessions(db_path):
+    """(meeting_key, id, agenda_items) of every stored meeting session"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT meeting_key, id, agenda_items FROM meeting_sessions ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Manager working in an empty workspace with the enhanced schema applied"""
+    monkeypatch.chdir(tmp_path)
+    return MeetingIntelligenceManager(str(tmp_path / "strategic_memory.db"))
+
+
+class TestEnhancedSchema:
+    """Test applying the enhanced schema"""
+
+    def test_commented_statements_are_applied(self, tmp_path, monkeypatch, capsys):
+        """Statements preceded by comment lines create their tables and indexes"""
+        # The schema is found next to the module, not relative to the working directory
+        monkeypatch.chdir(tmp_path)
+        db_path = str(tmp_path / "strategic_memory.db")
+
+        MeetingIntelligenceManager(db_path)
+
+        assert {"meeting_sessions", "workspace_changes", "workspace_templates"} <= _names(
+            db_path, "table"
+        )
+        assert "idx_meeting_sessions_stakeholder" in _names(db_path, "index")
+        assert "Schema warning" not in capsys.readouterr().out
+
+    def test_reapplying_keeps_seed_rows_once(self, tmp_path, monkeypatch, capsys):
+        """Seed rows from an earlier run are skipped without warnings"""
+        monkeypatch.chdir(tmp_path)
+        db_path = str(tmp_path / "strategic_memory.db")
+
+        MeetingIntelligenceManager(db_path)
+        MeetingIntelligenceManager(db_path)
+
+        conn = sqlite3.connect(db_path)
+        try:
+            (count,) = conn.execute("SELECT COUNT(*) FROM workspace_templates").fetchone()
+        finally:
+            conn.close()
+        assert count == 3
+        assert "Schema warning" not in capsys.readouterr().out
+
+    def test_integrity_errors_outside_seed_rows_are_reported(self, tmp_path, monkeypatch, capsys):
+        """Only seed INSERTs may fail silently on constraint violations"""
+        schema_path = tmp_path / "enhanced_schema.sql"
+        monkeypatch.setattr(meeting_intelligence, "ENHANCED_SCHEMA_PATH", schema_path)
+        schema_path.write_text(
+            "CREATE TABLE seeded (name TEXT UNIQUE);\n"
+            "INSERT INTO seeded VALUES ('a');\n"
+            "CREATE TABLE notes (name TEXT);\n"
+            "INSERT INTO notes VALUES ('a'), ('a');\n"
+            "-- Unique over rows that already repeat\n"
+            "CREATE UNIQUE INDEX idx_notes_name ON notes(name);\n"
+        )
+        db_path = str(tmp_path / "strategic_memory.db")
+
+        MeetingIntelligenceManager(db_path)
+        capsys.readouterr()
+        MeetingIntelligenceManager(db_path)
+
+        out = capsys.readouterr().out
+        assert "Schema warning: UNIQUE constraint failed: notes.name" in out
+        assert "seeded.name" not in out
+
+
+class TestStoreMeetingSession:
+    """Test storing meeting sessions"""
+
+    def test_existing_key_is_updated_in_place(self, manager):
+        """Storing a known key updates its row and returns the same id"""
+        first_id = manager.store_meeting_session(_meeting_data("vp-1on1-2026-10-17"))
+
+        second_id = manager.store_meeting_session(
+            _meeting_data("vp-1on1-2026-10-17", agenda_items=["Budget"])
+        )
+
+        assert second_id == first_id
+        assert _sessions(manager.db_path) == [("vp-1on1-2026-10-17", first_id, '["Budget"]')]
+
+    def test_caller_connection_transaction_is_left_open(self, manager):
+        """A caller-supplied connection decides whether the write is kept"""
+        conn = sqlite3.connect(manager.db_path)
+        try:
+            meeting_id = manager.store_meeting_session(_meeting_data("slt-review-2026-10-17"), conn)
+
+            assert meeting_id is not None
+            assert conn.in_transaction
+            conn.rollback()
+        finally:
+            conn.close()
+
+        assert _sessions(manager.db_path) == []
+
+
+class TestScanMeetingPrep:
+    """Test scanning the meeting-prep directory"""
+
+    def test_rescan_updates_known_meetings(self, manager, tmp_path):
+        """A second scan updates the sessions from the first and adds only new ones"""
+        prep_root = tmp_path / "workspace" / "meeting-prep"
+        for name in ("vp-weekly", "design-review", ".drafts"):
+            (prep_root / name).mkdir(parents=True)
+
+        first = manager.scan_and_process_meeting_prep()
+        first_sessions = _sessions(manager.db_path)
+        (prep_root / "slt-planning").mkdir()
+        second = manager.scan_and_process_meeting_prep()
+
+        assert (first["new_meetings"], first["updated_meetings"], first["errors"]) == (2, 0, [])
+        assert (second["new_meetings"], second["updated_meetings"], second["errors"]) == (1, 2, [])
+        assert _sessions(manager.db_path)[:2] == first_sessions
+        assert len(_sessions(manager.db_path)) == 3
+
+    def test_directories_sharing_a_key_store_one_session(self, manager, tmp_path):
+        """Two directories mapping to one key count as an insert then an update"""
+        prep_root = tmp_path / "workspace" / "meeting-prep"
+        for name in ("raghu-sync", "raghu-followup"):
+            (prep_root / name).mkdir(parents=True)
+
+        results = manager.scan_and_process_meeting_prep()
+
+        assert (results["new_meetings"], results["updated_meetings"]) == (1, 1)
+        assert len(_sessions(manager.db_path)) == 1
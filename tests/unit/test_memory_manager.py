@@ -0,0 +1,52 @@
+"""
+Unit tests for the workspace memory manager's JSON encoding
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+MEMORY_MANAGER = Path(__file__).resolve().parents[2] / "workspace" / "memory" / "memory_manager.py"
+
+PAYLOADS = [
+    ["Roadmap", "Budget"],
+    [{"owner": "Zoë Li", "due": "2026-11-02", "done": False}],
+    {"platform": 0.6, "product": 0.4},
+    [],
+]
+
+
+def _load_memory_manager(name):
+    """Import memory_manager.py from the workspace under its own module name"""
+    spec = importlib.util.spec_from_file_location(name, MEMORY_MANAGER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestJsonEncoding:
+    """Test stored JSON with and without orjson"""
+
+    def test_stdlib_fallback_is_used_without_orjson(self, monkeypatch):
+        """A missing orjson falls back to json.dumps"""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        module = _load_memory_manager("memory_manager_without_orjson")
+
+        assert module._json_dumps is json.dumps
+
+    @pytest.mark.parametrize("payload", PAYLOADS)
+    def test_orjson_round_trips_like_stdlib(self, monkeypatch, payload):
+        """Values read back with json.loads match the stdlib encoding"""
+        pytest.importorskip("orjson")
+        accelerated = _load_memory_manager("memory_manager_with_orjson")
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        fallback = _load_memory_manager("memory_manager_without_orjson")
+
+        assert json.loads(accelerated._json_dumps(payload)) == payload
+        assert json.loads(accelerated._json_dumps(payload)) == json.loads(
+            fallback._json_dumps(payload)
+        )
@@ -0,0 +1,175 @@
+"""
+Unit tests for stakeholder engagement bookkeeping
+"""
+
+import threading
+
+import pytest
+
+from memory.stakeholder_engagement_engine import (
+    LAST_ENGAGEMENT_TRIGGERS,
+    StakeholderEngagementEngine,
+)
+
+INSERT_RECOMMENDATION_SQL = """
+    INSERT INTO engagement_recommendations
+    (stakeholder_key, recommendation_type, urgency_level, confidence_score,
+     recommendation_status, expires_at, completed_date)
+    VALUES ('vp_eng', ?, 'medium', 0.5, ?, {expires_at}, {completed_date})
+"""
+
+LAST_ENGAGEMENT_DATE_SQL = """
+    SELECT last_engagement_date FROM stakeholder_profiles_enhanced WHERE stakeholder_key = ?
+"""
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engagement engine over a database with the engagement schema applied"""
+    engine = StakeholderEngagementEngine(str(tmp_path / "strategic_memory.db"))
+    assert engine.apply_engagement_schema()
+    engine.add_stakeholder("vp_eng", "VP Engineering", strategic_importance="critical")
+    yield engine
+    engine.close()
+
+
+def _last_engagement_date(engine, stakeholder_key="vp_eng"):
+    """The stakeholder's denormalized last engagement date"""
+    cursor = engine.get_connection().execute(LAST_ENGAGEMENT_DATE_SQL, (stakeholder_key,))
+    return cursor.fetchone()[0]
+
+
+def _add_recommendation(engine, name, status, expires_at="NULL", completed_date="NULL"):
+    """Insert a recommendation row directly, with SQL expressions for its dates"""
+    with engine.get_connection() as conn:
+        conn.execute(
+            INSERT_RECOMMENDATION_SQL.format(expires_at=expires_at, completed_date=completed_date),
+            (name, status),
+        )
+
+
+def _recommendation_types(engine):
+    """Types of every stored recommendation, regardless of status"""
+    rows = engine.get_connection().execute(
+        "SELECT recommendation_type FROM engagement_recommendations"
+    )
+    return {row[0] for row in rows}
+
+
+class TestLastEngagementTriggers:
+    """Test the triggers maintaining last_engagement_date"""
+
+    def test_insert_update_and_delete_keep_latest_date(self, engine):
+        """The profile tracks the latest engagement as engagements change"""
+        assert engine.record_engagement("vp_eng", "1on1", engagement_date="2026-01-05")
+        assert engine.record_engagement("vp_eng", "1on1", engagement_date="2026-02-10")
+        assert _last_engagement_date(engine) == "2026-02-10"
+
+        with engine.get_connection() as conn:
+            conn.execute(
+                "UPDATE stakeholder_engagements SET engagement_date = '2025-12-01' "
+                "WHERE engagement_date = '2026-02-10'"
+            )
+        assert _last_engagement_date(engine) == "2026-01-05"
+
+        with engine.get_connection() as conn:
+            conn.execute("DELETE FROM stakeholder_engagements WHERE engagement_date = '2026-01-05'")
+        assert _last_engagement_date(engine) == "2025-12-01"
+
+    def test_profile_added_after_engagements_picks_up_date(self, engine):
+        """A profile inserted after its engagements starts from the latest one"""
+        assert engine.record_engagement("new_peer", "sync", engagement_date="2026-03-01")
+
+        assert engine.add_stakeholder("new_peer", "New Peer")
+
+        assert _last_engagement_date(engine, "new_peer") == "2026-03-01"
+
+    def test_existing_database_is_backfilled(self, engine):
+        """Databases without the triggers get them and a backfilled column on connect"""
+        assert engine.record_engagement("vp_eng", "1on1", engagement_date="2026-01-05")
+        with engine.get_connection() as conn:
+            for name in LAST_ENGAGEMENT_TRIGGERS:
+                conn.execute(f"DROP TRIGGER {name}")
+            conn.execute("UPDATE stakeholder_profiles_enhanced SET last_engagement_date = NULL")
+        engine.close()
+
+        reopened = StakeholderEngagementEngine(engine.db_path)
+        try:
+            triggers = {
+                row[0]
+                for row in reopened.get_connection().execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+                )
+            }
+            assert triggers >= set(LAST_ENGAGEMENT_TRIGGERS)
+            assert _last_engagement_date(reopened) == "2026-01-05"
+        finally:
+            reopened.close()
+
+
+class TestRecommendationPurge:
+    """Test purging dead recommendations"""
+
+    def test_purge_removes_only_dead_recommendations(self, engine):
+        """Expired pending and long-completed recommendations are deleted"""
+        _add_recommendation(engine, "expired", "pending", expires_at="datetime('now', '-1 day')")
+        _add_recommendation(engine, "live", "pending", expires_at="datetime('now', '+1 day')")
+        _add_recommendation(engine, "open_ended", "pending")
+        _add_recommendation(
+            engine, "old_done", "completed", completed_date="date('now', '-40 days')"
+        )
+        _add_recommendation(
+            engine, "recent_done", "completed", completed_date="date('now', '-5 days')"
+        )
+
+        engine.get_pending_recommendations()
+
+        assert _recommendation_types(engine) == {"live", "open_ended", "recent_done"}
+
+    def test_purge_runs_at_most_once_per_interval(self, engine):
+        """A second read within the interval leaves newly expired rows for later"""
+        engine.get_pending_recommendations()
+        _add_recommendation(engine, "expired", "pending", expires_at="datetime('now', '-1 day')")
+
+        pending = engine.get_pending_recommendations()
+
+        assert "expired" in _recommendation_types(engine)
+        assert all(rec["recommendation_type"] != "expired" for rec in pending)
+
+
+class TestScopedRecommendations:
+    """Test regenerating recommendations for changed stakeholders only"""
+
+    def test_only_dirty_stakeholders_are_regenerated(self, engine):
+        """Passing the dirty set refreshes just those stakeholders and clears them"""
+        engine.generate_engagement_recommendations()
+        assert engine.dirty_stakeholders == set()
+        assert engine.add_stakeholder("new_peer", "New Peer", strategic_importance="high")
+
+        recommendations = engine.generate_engagement_recommendations(only=engine.dirty_stakeholders)
+
+        assert {rec["stakeholder_key"] for rec in recommendations} == {"new_peer"}
+        assert engine.dirty_stakeholders == set()
+
+
+class TestConnections:
+    """Test per-thread database connections"""
+
+    def test_each_thread_gets_its_own_connection(self, engine):
+        """Connections are never shared across threads"""
+        conn = engine.get_connection()
+        other = []
+
+        def record_from_thread():
+            other.append(engine.get_connection())
+            other.append(engine.record_engagement("vp_eng", "1on1", engagement_date="2026-04-01"))
+            engine.close()
+
+        worker = threading.Thread(target=record_from_thread)
+        worker.start()
+        worker.join()
+
+        assert other[0] is not conn
+        assert other[1]
+        assert engine.get_connection() is conn
+        assert _last_engagement_date(engine) == "2026-04-01"
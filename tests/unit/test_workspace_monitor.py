@@ -0,0 +1,124 @@
+"""
+Unit tests for batched workspace change storage
+"""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import memory.workspace_monitor as workspace_monitor
+from memory.workspace_monitor import StrategicWorkspaceHandler
+
+ENHANCED_SCHEMA = Path(__file__).resolve().parents[2] / "memory" / "enhanced_schema.sql"
+
+
+def _queue_change(handler, name):
+    """Queue a directory change for a workspace-relative name"""
+    return handler._store_workspace_change(
+        change_type="directory_created",
+        path_full=f"/workspace/{name}",
+        path_relative=name,
+        category="strategic_docs",
+        subcategory="general",
+    )
+
+
+def _stored_paths(db_path):
+    """Relative paths written to workspace_changes, in insert order"""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT path_relative FROM workspace_changes ORDER BY id")
+        return [row[0] for row in rows]
+    finally:
+        conn.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_handler(monkeypatch):
+    """Keep the meeting and stakeholder managers from touching the test databases"""
+    monkeypatch.setattr(workspace_monitor, "MeetingIntelligenceManager", Mock())
+    monkeypatch.setattr(workspace_monitor, "STAKEHOLDER_DETECTION_AVAILABLE", False)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Database created from the enhanced schema"""
+    path = tmp_path / "strategic_memory.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(ENHANCED_SCHEMA.read_text())
+    conn.close()
+    return str(path)
+
+
+@pytest.fixture
+def handler(db_path):
+    """Workspace handler without a background flusher"""
+    handler = StrategicWorkspaceHandler(db_path)
+    yield handler
+    handler.close()
+
+
+class TestWorkspaceChangeFlush:
+    """Test writing queued workspace changes"""
+
+    def test_flush_writes_queued_changes(self, handler, db_path):
+        """Queued changes are written in order and the queue is emptied"""
+        assert _queue_change(handler, "a") == 1
+        assert _queue_change(handler, "b") == 2
+
+        assert handler.flush() == 2
+        assert handler.flush() == 0
+        assert _stored_paths(db_path) == ["a", "b"]
+
+    def test_bad_row_does_not_discard_batch(self, handler, db_path, capsys):
+        """A row violating a constraint is dropped and the rest of the batch is stored"""
+        _queue_change(handler, "a")
+        handler._store_workspace_change(
+            change_type=None,
+            path_full="/workspace/bad",
+            path_relative="bad",
+            category="strategic_docs",
+            subcategory="general",
+        )
+        _queue_change(handler, "b")
+
+        assert handler.flush() == 2
+        assert not handler.conn.in_transaction
+        assert "Dropped 1 of 3 workspace changes" in capsys.readouterr().out
+
+        # The connection is still usable for the next batch
+        _queue_change(handler, "c")
+        assert handler.flush() == 1
+        assert _stored_paths(db_path) == ["a", "b", "c"]
+
+    def test_locked_database_keeps_batch_for_retry(self, handler, db_path):
+        """A transient lock leaves the batch queued for the next flush"""
+        _queue_change(handler, "a")
+        handler.conn.execute("PRAGMA busy_timeout = 0")
+        blocker = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            blocker.execute("BEGIN EXCLUSIVE")
+
+            assert handler.flush() == 0
+            assert not handler.conn.in_transaction
+
+            blocker.execute("ROLLBACK")
+        finally:
+            blocker.close()
+
+        _queue_change(handler, "b")
+        assert handler.flush() == 2
+        assert _stored_paths(db_path) == ["a", "b"]
+
+    def test_missing_table_rolls_back(self, tmp_path):
+        """Without the schema the batch is dropped and no transaction is left open"""
+        handler = StrategicWorkspaceHandler(str(tmp_path / "empty.db"))
+        try:
+            _queue_change(handler, "a")
+
+            assert handler.flush() == 0
+            assert not handler.conn.in_transaction
+        finally:
+            handler.close()
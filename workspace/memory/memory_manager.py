@@ -16,10 +16,38 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _json_dumps = json.dumps
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection tuning for the read-heavy recall path
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Composite indexes for the recall filters; the schema only runs on new databases, so
+# these are ensured on every start
+RECALL_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_executive_sessions_stakeholder_date "
+    "ON executive_sessions(stakeholder_key, meeting_date DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_initiatives_status_assignee "
+    "ON strategic_initiatives(status, assignee)",
+    "CREATE INDEX IF NOT EXISTS idx_intelligence_category_date "
+    "ON platform_intelligence(category, measurement_date)",
+)
+
 
 @dataclass
 class ExecutiveSession:
@@ -105,6 +133,8 @@ class SuperClaudeMemoryManager:
         """Initialize SQLite database with schema"""
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
 
         # Load and execute schema if database is empty
         schema_path = Path(__file__).parent / "schema.sql"
@@ -125,6 +155,10 @@ class SuperClaudeMemoryManager:
             else:
                 logger.info(f"Using existing database at: {self.db_path}")
 
+            for index_sql in RECALL_INDEXES:
+                self.conn.execute(index_sql)
+            self.conn.commit()
+
     def __enter__(self):
         return self
 
@@ -152,9 +186,9 @@ class SuperClaudeMemoryManager:
                 session.session_type,
                 session.stakeholder_key,
                 session.meeting_date,
-                json.dumps(session.agenda_topics),
-                json.dumps(session.decisions_made),
-                json.dumps(session.action_items),
+                _json_dumps(session.agenda_topics),
+                _json_dumps(session.decisions_made),
+                _json_dumps(session.action_items),
                 session.business_impact,
                 session.next_session_prep,
                 session.persona_activated,
@@ -176,12 +210,10 @@ class SuperClaudeMemoryManager:
         cursor.execute(
             """
             SELECT * FROM executive_sessions
-            WHERE stakeholder_key = ? AND meeting_date >= date('now', '-{} days')
+            WHERE stakeholder_key = ? AND meeting_date >= date('now', ?)
             ORDER BY meeting_date DESC
-        """.format(
-                days
-            ),
-            (stakeholder_key,),
+        """,
+            (stakeholder_key, f"-{days} days"),
         )
 
         sessions = []
@@ -253,7 +285,7 @@ class SuperClaudeMemoryManager:
                 initiative.priority,
                 initiative.business_value,
                 initiative.risk_level,
-                json.dumps(initiative.resource_allocation)
+                _json_dumps(initiative.resource_allocation)
                 if initiative.resource_allocation
                 else None,
                 initiative.completion_probability,
@@ -351,12 +383,10 @@ class SuperClaudeMemoryManager:
 
         query = """
             SELECT * FROM platform_metrics_trending
-            WHERE measurement_date >= date('now', '-{} days')
-        """.format(
-            days
-        )
+            WHERE measurement_date >= date('now', ?)
+        """
 
-        params = []
+        params = [f"-{days} days"]
         if category:
             query += " AND category = ?"
             params.append(category)
@@ -450,10 +480,9 @@ class SuperClaudeMemoryManager:
         cursor.execute(
             """
             DELETE FROM platform_intelligence
-            WHERE measurement_date < date('now', '-{} days')
-        """.format(
-                days
-            )
+            WHERE measurement_date < date('now', ?)
+        """,
+            (f"-{days} days",),
         )
         cleanup_stats["platform_intelligence"] = cursor.rowcount
 
@@ -461,10 +490,9 @@ class SuperClaudeMemoryManager:
         cursor.execute(
             """
             DELETE FROM executive_sessions
-            WHERE meeting_date < date('now', '-{} days') AND outcome_rating < 4
-        """.format(
-                days
-            )
+            WHERE meeting_date < date('now', ?) AND outcome_rating < 4
+        """,
+            (f"-{days} days",),
         )
         cleanup_stats["executive_sessions"] = cursor.rowcount
 